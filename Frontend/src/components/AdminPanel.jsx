@@ -44,23 +44,29 @@ export default function AdminPanel() {
   const [acting, setActing] = useState({ toggle: null, remove: null });
   const [confirm, setConfirm] = useState(null); // { type: 'toggle'|'delete', user, target? }
 
+  const [page, setPage] = useState(1);
+  const [count, setCount] = useState(0);
+  const PAGE_SIZE = 12;
+  const totalPages = Math.ceil(count / PAGE_SIZE);
+
   const load = useCallback(async () => {
     setLoading(true);
     setError(null);
     try {
-      const list = await fetchAdminUsers(); // was: const { data } = await fetchAdminUsers()
-      // Service returns the array directly (res.data). Guard just in case.
-      const arr = Array.isArray(list) ? list : list?.data ?? [];
-      setUsers(arr);
+      // Search and pagination happen server-side
+      const data = await fetchAdminUsers({ page, page_size: PAGE_SIZE, search: q });
+      setUsers(Array.isArray(data?.results) ? data.results : []);
+      setCount(data?.count ?? 0);
     } catch (e) {
       setError(
         e?.response?.status === 403 ? "Forbidden (not admin)" : "Load failed"
       );
       setUsers([]); // ensure never undefined
+      setCount(0);
     } finally {
       setLoading(false);
     }
-  }, []);
+  }, [page, q]);
 
   useEffect(() => {
     if (activeTab === "users") {
@@ -68,15 +74,6 @@ export default function AdminPanel() {
     }
   }, [load, activeTab]);
 
-  const filtered = (users || []).filter((u) => {
-    // guard against undefined
-    const text = [u.username, u.email, u.first_name, u.last_name]
-      .filter(Boolean)
-      .join(" ")
-      .toLowerCase();
-    return text.includes(q.toLowerCase());
-  });
-
   function handleToggle(u) {
     if (acting.toggle) return;
     setConfirm({ type: "toggle", user: u, target: !u.is_admin_user });
@@ -113,6 +110,7 @@ export default function AdminPanel() {
       try {
         await deleteUser(user.id);
         setUsers((list) => list.filter((x) => x.id !== user.id));
+        setCount((c) => Math.max(0, c - 1));
         toast.success("User deleted");
       } catch {
         toast.error("Delete failed");
@@ -171,7 +169,10 @@ export default function AdminPanel() {
             <div className="relative w-full sm:w-72">
               <input
                 value={q}
-                onChange={(e) => setQ(e.target.value)}
+                onChange={(e) => {
+                  setQ(e.target.value);
+                  setPage(1); // Reset to first page on new search
+                }}
                 placeholder="Search users..."
                 className="w-full h-11 pl-10 pr-3 rounded-xl border border-slate-200 bg-white/80 backdrop-blur text-sm focus:outline-none focus:ring-2 focus:ring-violet-400/40"
               />
@@ -204,11 +205,11 @@ export default function AdminPanel() {
               </div>
             )}
 
-            {!loading && filtered.length === 0 && (
+            {!loading && users.length === 0 && (
               <div className="text-sm text-slate-500">No users.</div>
             )}
 
-            {filtered.map((u) => {
+            {users.map((u) => {
               const isOpen = expanded === u.id;
               const avatar = buildMediaUrl(u.profile?.avatar);
               const initial = (
@@ -398,6 +399,31 @@ export default function AdminPanel() {
               );
             })}
           </div>
+
+          {/* Pagination */}
+          {totalPages > 1 && (
+            <div className="flex justify-center mt-8">
+              <div className="flex items-center gap-2">
+                <button
+                  disabled={page === 1}
+                  onClick={() => setPage((p) => Math.max(1, p - 1))}
+                  className="h-9 w-9 flex items-center justify-center rounded-lg border border-slate-300 text-slate-600 hover:bg-slate-50 disabled:opacity-50"
+                >
+                  &larr;
+                </button>
+                <span className="text-sm text-slate-600">
+                  Page {page} of {totalPages}
+                </span>
+                <button
+                  disabled={page >= totalPages}
+                  onClick={() => setPage((p) => Math.min(totalPages, p + 1))}
+                  className="h-9 w-9 flex items-center justify-center rounded-lg border border-slate-300 text-slate-600 hover:bg-slate-50 disabled:opacity-50"
+                >
+                  &rarr;
+                </button>
+              </div>
+            </div>
+          )}
         </>
       ) : (
         <AdminPosts />
@@ -58,24 +58,17 @@ export default function PostDetail() {
     setLikeLoading(true);
     setLikeError("");
     try {
-      if (!post.liked_by_user) {
-        const res = await likePost(post.id);
-        setPost((p) => ({
-          ...p,
-          likes_count: (p.likes_count ?? 0) + 1,
-          liked_by_user: true,
-          like_id: res.id,
-        }));
-      } else {
-        if (!post.like_id) throw new Error("Missing like_id");
-        await unlikePost(post.like_id);
-        setPost((p) => ({
-          ...p,
-          likes_count: Math.max(0, (p.likes_count ?? 1) - 1),
-          liked_by_user: false,
-          like_id: null,
-        }));
-      }
+      const res = post.liked_by_user
+        ? await unlikePost(post.slug)
+        : await likePost(post.slug);
+      setPost((p) => ({
+        ...p,
+        // A queued (write-behind) change isn't in the returned count yet
+        likes_count: res.pending
+          ? Math.max(0, (p.likes_count ?? 0) + (res.liked ? 1 : -1))
+          : res.likes_count,
+        liked_by_user: res.liked,
+      }));
       // eslint-disable-next-line no-unused-vars
     } catch (e) {
       setLikeError("Failed to update like");
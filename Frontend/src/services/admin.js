@@ -1,9 +1,11 @@
 import axios from "axios";
 const API_BASE = import.meta.env.VITE_API_BASE || "http://127.0.0.1:8000/api";
 
-export async function fetchAdminUsers() {
+// params: { page, page_size, search, ordering } -> { count, next, previous, results }
+export async function fetchAdminUsers(params = {}) {
   const access = localStorage.getItem("access");
   const res = await axios.get(`${API_BASE}/admin-panel/`, {
+    params,
     headers: { Authorization: access ? `Bearer ${access}` : undefined },
   });
   return res.data;
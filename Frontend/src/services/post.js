@@ -58,13 +58,15 @@ export async function getHighlightedPosts() {
   return data; // { latest: Post[], most_liked: Post[] }
 }
 
-export async function likePost(postId) {
-  const { data } = await api.post("/likes/", { post: postId });
+// Both are idempotent and resolve to { liked, likes_count } (plus pending: true
+// when the server queues likes, in which case likes_count predates this change)
+export async function likePost(slug) {
+  const { data } = await api.post(`/posts/${slug}/like/`);
   return data;
 }
 
-export async function unlikePost(likeId) {
-  const { data } = await api.delete(`/likes/${likeId}/`);
+export async function unlikePost(slug) {
+  const { data } = await api.delete(`/posts/${slug}/like/`);
   return data;
 }
 
@@ -0,0 +1,108 @@
+"""
+JWT authentication that rejects access tokens revoked at logout
+"""
+import threading
+import time
+
+from django.core.cache import cache
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+# Revocations are an append-only log in the cache: SEQUENCE_KEY counts them
+# and ENTRY_KEY % n holds the n-th (jti, exp). Every process keeps the
+# revoked jtis in memory and only reads the log tail every REFRESH_INTERVAL
+# seconds, so a revoked token stops working everywhere within that delay
+# (plus the local cache tier's lifetime) while ordinary requests never
+# leave the process.
+SEQUENCE_KEY = "auth:revocations:seq"
+ENTRY_KEY = "auth:revocations:%d"
+REFRESH_INTERVAL = 10
+# A process that starts cold reads at most this many recent entries; older
+# ones belong to access tokens that have expired anyway
+MAX_BACKFILL = 10000
+FETCH_BATCH = 500
+
+_lock = threading.Lock()
+_revoked = {}  # jti -> exp (unix time)
+_last_seq = None
+_refreshed_at = 0.0
+
+
+def _entry_timeout(exp):
+    # Keep the log entry for as long as the token could still be presented
+    return max(1, int(exp - time.time()) + 1)
+
+
+def revoke_token(jti, exp):
+    """Record a revoked access token; it is rejected until it expires."""
+    if not jti:
+        return
+    cache.add(SEQUENCE_KEY, 0, None)
+    try:
+        seq = cache.incr(SEQUENCE_KEY)
+    except ValueError:
+        # Evicted between add() and incr()
+        cache.add(SEQUENCE_KEY, 0, None)
+        seq = cache.incr(SEQUENCE_KEY)
+    cache.set(ENTRY_KEY % seq, (jti, exp), _entry_timeout(exp))
+    with _lock:
+        _revoked[jti] = exp
+
+
+def refresh_revocations(force=False):
+    """Pull new log entries into this process's revoked set."""
+    global _last_seq, _refreshed_at
+    now = time.monotonic()
+    if not force and now - _refreshed_at < REFRESH_INTERVAL:
+        return
+    _refreshed_at = now
+
+    seq = cache.get(SEQUENCE_KEY) or 0
+    last = _last_seq
+    if last is None or last > seq:
+        # Cold start, or the cache was flushed
+        last = max(0, seq - MAX_BACKFILL)
+
+    entries = {}
+    for start in range(last + 1, seq + 1, FETCH_BATCH):
+        keys = [ENTRY_KEY % n for n in range(start, min(start + FETCH_BATCH, seq + 1))]
+        entries.update(cache.get_many(keys))
+
+    wall_now = time.time()
+    with _lock:
+        for jti, exp in entries.values():
+            _revoked[jti] = exp
+        for jti in [jti for jti, exp in _revoked.items() if exp <= wall_now]:
+            del _revoked[jti]
+        _last_seq = seq
+
+
+def is_revoked(jti):
+    refresh_revocations()
+    return jti in _revoked
+
+
+def reset_revocations():
+    """Forget the in-process state (used by tests)."""
+    global _last_seq, _refreshed_at
+    with _lock:
+        _revoked.clear()
+        _last_seq = None
+        _refreshed_at = 0.0
+
+
+class RevocationAwareJWTAuthentication(JWTAuthentication):
+    """
+    simplejwt's stateless validation plus a check against the revoked jtis
+    held in memory (see refresh_revocations).
+    """
+
+    def get_validated_token(self, raw_token):
+        token = super().get_validated_token(raw_token)
+        if is_revoked(token.get(api_settings.JTI_CLAIM)):
+            raise InvalidToken({
+                "detail": "Token has been revoked",
+                "code": "token_revoked",
+            })
+        return token
@@ -0,0 +1,45 @@
+"""
+Authentication backend for username-or-email logins
+"""
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.db.models import Q
+
+UserModel = get_user_model()
+
+
+class UsernameOrEmailBackend(ModelBackend):
+    """
+    Accepts either the username or the email address (case-insensitive) in
+    the `username` credential.
+    Both are resolved in one query (unique username index plus the UPPER(email)
+    index), and the password is hashed exactly once whether or not a user
+    matches. A failed attempt returns None like ModelBackend, so the
+    backends listed after this one still get their turn.
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+
+        candidates = list(
+            UserModel._default_manager
+            .filter(Q(username=username) | Q(email__iexact=username))[:2]
+        )
+        # A username that looks like someone else's email wins, as it did
+        # when usernames were tried first
+        user = (
+            next((u for u in candidates if u.username == username), None)
+            or next((u for u in candidates if u.email == username), None)
+            or (candidates[0] if candidates else None)
+        )
+
+        if user is None:
+            # Run the hasher anyway so unknown users take as long as wrong passwords
+            UserModel().set_password(password)
+            return None
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
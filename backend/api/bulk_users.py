@@ -0,0 +1,114 @@
+"""
+Bulk moderation of user accounts: role changes in one UPDATE, deletions in
+short chunked transactions with their progress kept in the cache
+"""
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection, transaction
+
+from .exceptions import log
+
+User = get_user_model()
+
+# Progress of a bulk deletion, readable from any worker while it runs
+JOB_KEY = "admin:bulk_delete:%s"
+JOB_TIMEOUT = 60 * 60 * 24
+# A job saves its progress (updated_at) after every batch; one that has been
+# silent this long died with its worker and is reported as failed
+HEARTBEAT_TIMEOUT = 60 * 5
+
+
+def set_admin_flag(user_ids, is_admin_user):
+    """Grant or revoke the admin flag for all `user_ids`; returns the rows updated."""
+    return User.objects.filter(id__in=user_ids).update(is_admin_user=is_admin_user)
+
+
+def get_job(job_id):
+    """The job as last saved; an unfinished job whose heartbeat stopped is reported as failed."""
+    job = cache.get(JOB_KEY % job_id)
+    if (job is not None and job["status"] in ("pending", "running")
+            and time.time() - job["updated_at"] > HEARTBEAT_TIMEOUT):
+        job = {**job, "status": "failed", "error": "BULK_DELETE_STALLED"}
+    return job
+
+
+def _save_job(job):
+    job["updated_at"] = time.time()
+    cache.set(JOB_KEY % job["id"], job, JOB_TIMEOUT)
+
+
+def start_bulk_delete(user_ids, requested_by=None):
+    """
+    Record a deletion job for `user_ids` and run it: on a background thread
+    once the current transaction commits, or inline when
+    ADMIN_BULK_DELETE_ASYNC is off. Returns the job as last saved.
+    """
+    ids = sorted(set(user_ids))
+    job = {
+        "id": uuid.uuid4().hex,
+        "status": "pending",
+        "total": len(ids),
+        "processed": 0,
+        "deleted": 0,
+        "requested_by": requested_by,
+        "started_at": time.time(),
+        "updated_at": None,
+        "finished_at": None,
+        "error": None,
+    }
+    _save_job(job)
+
+    if settings.ADMIN_BULK_DELETE_ASYNC:
+        thread = threading.Thread(
+            target=_run_in_thread, args=(job, ids), name=f"bulk-delete-{job['id']}", daemon=True,
+        )
+        transaction.on_commit(thread.start)
+    else:
+        run_bulk_delete(job, ids)
+    return job
+
+
+def _run_in_thread(job, ids):
+    try:
+        run_bulk_delete(job, ids)
+    finally:
+        # The thread got its own connection; don't leave it to the server's idle timeout
+        connection.close()
+
+
+def run_bulk_delete(job, ids, batch_size=None, pause=None):
+    """
+    Delete users `batch_size` at a time, each batch (with the posts, comments
+    and likes cascading from it) in its own transaction, so no lock is held
+    for the whole job. Progress is saved to the cache after every batch,
+    which doubles as the job's heartbeat.
+    """
+    batch_size = batch_size or settings.ADMIN_BULK_DELETE_BATCH_SIZE
+    pause = settings.ADMIN_BULK_DELETE_PAUSE if pause is None else pause
+
+    job["status"] = "running"
+    _save_job(job)
+    try:
+        for start in range(0, len(ids), batch_size):
+            chunk = ids[start:start + batch_size]
+            with transaction.atomic():
+                _, per_model = User.objects.filter(id__in=chunk).delete()
+            job["processed"] += len(chunk)
+            job["deleted"] += per_model.get(User._meta.label, 0)
+            _save_job(job)
+            if pause and job["processed"] < len(ids):
+                time.sleep(pause)
+        job["status"] = "done"
+    except Exception as e:
+        log.exception("Bulk delete %s failed after %s users: %s", job["id"], job["processed"], e)
+        job["status"] = "failed"
+        job["error"] = "BULK_DELETE_FAILED"
+    finally:
+        job["finished_at"] = time.time()
+        _save_job(job)
+    return job
@@ -0,0 +1,196 @@
+"""
+Tiered cache backend: a bounded per-process LRU in front of a shared cache
+"""
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+_MISSING = object()
+
+# Backend instances are per thread; the L1 state is shared by the whole
+# process, keyed by LOCATION, the same way LocMemCache does it.
+_local_caches = {}
+_local_locks = {}
+_local_stats = {}
+
+
+class TieredCache(BaseCache):
+    """
+    Reads are answered from a small in-process LRU (L1) when possible and
+    from the shared cache configured under another alias (L2) otherwise.
+    Writes go through to L2 and refresh L1.
+
+    L1 entries live for LOCAL_TIMEOUT seconds at most, or less when the key's
+    own timeout is shorter, so another process's write is seen after that
+    delay at worst; writes in this process are seen immediately.
+    Atomic operations (add, incr, decr) are decided by L2.
+
+    OPTIONS:
+        SHARED_ALIAS   alias of the L2 cache in settings.CACHES (default "shared")
+        MAX_ENTRIES    L1 capacity (default 1000)
+        LOCAL_TIMEOUT  L1 lifetime in seconds (default 5)
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self.shared_alias = options.get("SHARED_ALIAS", "shared")
+        self.max_local_entries = int(options.get("MAX_ENTRIES", 1000))
+        self.local_timeout = float(options.get("LOCAL_TIMEOUT", 5))
+        name = location or self.shared_alias
+        self._local = _local_caches.setdefault(name, OrderedDict())
+        self._lock = _local_locks.setdefault(name, threading.Lock())
+        self._stats = _local_stats.setdefault(name, {"local_hits": 0, "shared_hits": 0, "misses": 0})
+
+    @property
+    def shared(self):
+        return caches[self.shared_alias]
+
+    # L1 helpers
+
+    def _local_get(self, key):
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return _MISSING
+            expires_at, pickled = entry
+            if expires_at <= time.monotonic():
+                del self._local[key]
+                return _MISSING
+            self._local.move_to_end(key)
+        return pickle.loads(pickled)
+
+    def _local_set(self, key, value, timeout):
+        timeout = self.get_backend_timeout(timeout)
+        lifetime = self.local_timeout if timeout is None else min(self.local_timeout, timeout - time.time())
+        if lifetime <= 0:
+            self._local_delete(key)
+            return
+        # Pickled like LocMemCache, so callers can't mutate the cached object
+        pickled = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._local[key] = (time.monotonic() + lifetime, pickled)
+            self._local.move_to_end(key)
+            while len(self._local) > self.max_local_entries:
+                self._local.popitem(last=False)
+
+    def _local_delete(self, key):
+        with self._lock:
+            self._local.pop(key, None)
+
+    def _count(self, stat, amount=1):
+        with self._lock:
+            self._stats[stat] += amount
+
+    # Cache API
+
+    def get(self, key, default=None, version=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        value = self._local_get(local_key)
+        if value is not _MISSING:
+            self._count("local_hits")
+            return value
+
+        value = self.shared.get(key, _MISSING, version=version)
+        if value is _MISSING:
+            self._count("misses")
+            return default
+        self._count("shared_hits")
+        # L2 doesn't report the remaining lifetime; LOCAL_TIMEOUT bounds the staleness
+        self._local_set(local_key, value, None)
+        return value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        self.shared.set(key, value, timeout, version=version)
+        self._local_set(local_key, value, timeout)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        added = self.shared.add(key, value, timeout, version=version)
+        if added:
+            self._local_set(local_key, value, timeout)
+        else:
+            self._local_delete(local_key)
+        return added
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        self._local_delete(local_key)
+        return self.shared.touch(key, timeout, version=version)
+
+    def delete(self, key, version=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        self._local_delete(local_key)
+        return self.shared.delete(key, version=version)
+
+    def has_key(self, key, version=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        if self._local_get(local_key) is not _MISSING:
+            return True
+        return self.shared.has_key(key, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        self._local_delete(local_key)
+        return self.shared.incr(key, delta, version=version)
+
+    def decr(self, key, delta=1, version=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        self._local_delete(local_key)
+        return self.shared.decr(key, delta, version=version)
+
+    def get_many(self, keys, version=None):
+        found, remaining = {}, []
+        for key in keys:
+            value = self._local_get(self.make_and_validate_key(key, version=version))
+            if value is _MISSING:
+                remaining.append(key)
+            else:
+                found[key] = value
+        self._count("local_hits", len(found))
+
+        if remaining:
+            shared = self.shared.get_many(remaining, version=version)
+            self._count("shared_hits", len(shared))
+            self._count("misses", len(remaining) - len(shared))
+            for key, value in shared.items():
+                self._local_set(self.make_and_validate_key(key, version=version), value, None)
+            found.update(shared)
+        return found
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        failed = self.shared.set_many(data, timeout, version=version)
+        for key, value in data.items():
+            local_key = self.make_and_validate_key(key, version=version)
+            if key in failed:
+                self._local_delete(local_key)
+            else:
+                self._local_set(local_key, value, timeout)
+        return failed
+
+    def delete_many(self, keys, version=None):
+        keys = list(keys)
+        for key in keys:
+            self._local_delete(self.make_and_validate_key(key, version=version))
+        self.shared.delete_many(keys, version=version)
+
+    def clear(self):
+        self.clear_local()
+        self.shared.clear()
+
+    def clear_local(self):
+        with self._lock:
+            self._local.clear()
+
+    def stats(self):
+        """Per-process hit/miss counters and the current L1 size."""
+        with self._lock:
+            return {**self._stats, "local_entries": len(self._local)}
+
+    def close(self, **kwargs):
+        self.shared.close(**kwargs)
@@ -0,0 +1,108 @@
+"""
+Precompiled content-safety rules shared by the serializers and the security middlewares
+"""
+import re
+
+from .screening import PatternSet
+
+# Every pattern here runs in time linear in the input. The classic forms
+# (`'.*or.*'.*=.*'`, `/\*.*\*/`, `on\w+\s*=`, `<script[^>]*>.*?</script>`)
+# backtrack quadratically or worse when an attacker repeats the opening
+# token without ever completing the match. The rewrites below match exactly
+# the same texts (see api/test/test_content_safety.py).
+
+# `'.*or.*'.*=.*'`: the first quote of a line followed, in order, by the
+# first "or", quote, "=" and quote after it.
+QUOTED_OR = r"^[^'\n]*'[^o\n]*(?:o(?!r)[^o\n]*)*or[^'\n]*'[^=\n]*=[^'\n]*'"
+
+# `/\*.*\*/`: a "/*" followed by a "*/" on the same line. The scan from one
+# "/*" stops at the next, which then takes over, so no character is scanned
+# twice ("/*/" still closes the previous comment).
+BLOCK_COMMENT = r'/\*[^*/\n]*(?:(?:\*(?!/)|/(?!\*))[^*/\n]*)*(?:\*/|/\*/)'
+
+# `\bunion\s+select\b.*from\b`: UNION SELECT followed by "from" on the same
+# line, scanning only up to the next UNION SELECT.
+UNION_SELECT_FROM = (r'\bunion\s+select\b[^fu\n]*'
+                     r'(?:(?:f(?!rom\b)|\Bu|\bu(?!nion\s+select\b))[^fu\n]*)*from\b')
+
+# `on\w+\s*=`: "on" and the rest of its word followed by "=", scanning only
+# up to the next "on" inside the word.
+EVENT_HANDLER = r'on(?=\w)[^\Wo]*(?:o(?!n\w)[^\Wo]*)*\s*='
+QUOTED_EVENT_HANDLER = EVENT_HANDLER + r'\s*["\'][^"\']*["\']'
+
+# `<script[^>]*>.*?</script>`: a script tag closed by the first ">" after it
+# and then a "</script>" (on the same line unless compiled with re.DOTALL).
+# The opening tag is scanned only up to the next "<script", which has the
+# same first ">"; past the ">", a later "<script" hands over to the next
+# match attempt unless the "</script>" comes before that tag's own ">".
+SCRIPT_ELEMENT = (r'<script(?:[^<>]|<(?!script))*>(?:(?!<).|<(?!script))*?'
+                  r'(?:</script>|<script(?:(?!>).)*?</script>)')
+
+
+def _tag(name, attribute=None):
+    r"""
+    `<name[^>]*>`, or `<name[^>]*attribute\s*=` when an attribute is given,
+    scanning only up to the next "<name": the match attempt from there sees
+    the same text before the next ">".
+    """
+    if attribute is None:
+        return rf'<{name}(?:[^<>]|<(?!{name}))*>'
+    first, rest = attribute[0], attribute[1:]
+    return (rf'<{name}(?:[^<>{first}]|<(?!{name})|{first}(?!{rest}\s*=))*'
+            rf'{attribute}\s*=')
+
+
+IFRAME_TAG = _tag('iframe')
+OBJECT_TAG = _tag('object')
+EMBED_TAG = _tag('embed')
+IFRAME_SRC = _tag('iframe', 'src')
+OBJECT_DATA = _tag('object', 'data')
+EMBED_SRC = _tag('embed', 'src')
+
+JAVASCRIPT_URL = r'javascript:'
+EVAL_CALL = r'eval\s*\('
+CSS_EXPRESSION = r'expression\s*\('
+
+SQL_KEYWORD = r'\b(?:union|select|insert|update|delete|drop|create|alter)\b'
+
+FLAGS = re.IGNORECASE | re.MULTILINE
+
+TITLE_SQL_PATTERNS = PatternSet([
+    SQL_KEYWORD,
+    r'\||&&',
+    QUOTED_OR,
+    r';|\-\-',
+], FLAGS)
+
+# Titles are plain text: only the most dangerous markup is rejected
+TITLE_XSS_PATTERNS = PatternSet([
+    SCRIPT_ELEMENT,
+    JAVASCRIPT_URL,
+    EVENT_HANDLER,
+], FLAGS)
+
+# Blog content is HTML from the editor, so only scripts are rejected
+POST_CONTENT_XSS_PATTERNS = PatternSet([
+    SCRIPT_ELEMENT,
+    JAVASCRIPT_URL,
+    QUOTED_EVENT_HANDLER,
+    EVAL_CALL,
+], FLAGS)
+
+COMMENT_SQL_PATTERNS = PatternSet([
+    SQL_KEYWORD,
+    r'\||&&',
+    QUOTED_OR,
+    r';|\-\-',
+    r'\b(?:concat|char)\b',
+], FLAGS)
+
+COMMENT_XSS_PATTERNS = PatternSet([
+    SCRIPT_ELEMENT,
+    JAVASCRIPT_URL,
+    EVENT_HANDLER,
+    IFRAME_TAG,
+    OBJECT_TAG,
+    EMBED_TAG,
+    EVAL_CALL,
+], FLAGS)
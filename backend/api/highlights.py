@@ -0,0 +1,120 @@
+"""
+Cached home-page highlights (latest and most liked posts)
+"""
+import time
+
+from django.core.cache import cache
+
+from .models.like import Like
+from .models.post import Post
+from .serializers.post import PostListSerializer
+
+HIGHLIGHTED_LIMIT = 6
+
+# The payload only changes when posts, likes or comments change (see api/signals.py),
+# so the timeout is just a safety net against missed invalidations.
+CACHE_TIMEOUT = 60 * 10
+# The last good payload is served while a rebuild is in flight
+STALE_TIMEOUT = 60 * 60 * 24
+# Upper bound on a rebuild; the lock expires on its own if the builder dies
+LOCK_TIMEOUT = 10
+WAIT_INTERVAL = 0.05
+WAIT_ATTEMPTS = 20
+
+VERSION_KEY = "highlighted-posts:version"
+STALE_KEY = "highlighted-posts:stale"
+
+# Cached as the storage's (relative) URLs; each request gets them absolute for its own host
+MEDIA_URL_FIELDS = ("author_avatar", "cover")
+
+
+def _current_version():
+    return cache.get_or_set(VERSION_KEY, 1, None)
+
+
+def invalidate_highlighted_posts():
+    """Retire the cached payload; the next request rebuilds it."""
+    cache.add(VERSION_KEY, 1, None)
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        # Evicted between add() and incr()
+        cache.set(VERSION_KEY, 2, None)
+
+
+def build_highlighted_payload():
+    """
+    Serialize the anonymous view of the highlights: no per-viewer like state,
+    and no request, so nothing in it depends on the Host that triggered the build.
+    """
+    published = (Post.objects.filter(is_published=True)
+                 .for_list()
+                 .with_related()
+                 .with_engagement(None))
+
+    latest_posts = published.order_by('-created_at')[:HIGHLIGHTED_LIMIT]
+    most_liked_posts = published.order_by('-like_count', '-created_at')[:HIGHLIGHTED_LIMIT]
+
+    return {
+        "latest": list(PostListSerializer(latest_posts, many=True).data),
+        "most_liked": list(PostListSerializer(most_liked_posts, many=True).data),
+    }
+
+
+def get_highlighted_payload():
+    """
+    Return the anonymous payload from cache.
+    On a miss only the request holding the rebuild lock queries the database;
+    concurrent requests get the previous payload, or wait briefly for the new one.
+    """
+    version = _current_version()
+    key = f"highlighted-posts:v{version}"
+
+    payload = cache.get(key)
+    if payload is not None:
+        return payload
+
+    lock_key = f"{key}:lock"
+    if cache.add(lock_key, 1, LOCK_TIMEOUT):
+        try:
+            payload = build_highlighted_payload()
+            cache.set(key, payload, CACHE_TIMEOUT)
+            cache.set(STALE_KEY, payload, STALE_TIMEOUT)
+        finally:
+            cache.delete(lock_key)
+        return payload
+
+    stale = cache.get(STALE_KEY)
+    if stale is not None:
+        return stale
+
+    for _ in range(WAIT_ATTEMPTS):
+        time.sleep(WAIT_INTERVAL)
+        payload = cache.get(key)
+        if payload is not None:
+            return payload
+
+    # The builder is too slow or gone; answer this request directly
+    return build_highlighted_payload()
+
+
+def personalise_payload(payload, request):
+    """
+    Fill in what depends on the request: absolute media URLs for its host,
+    and liked_by_user for the viewer with a single query.
+    """
+    liked = set()
+    if request.user.is_authenticated:
+        post_ids = {item["id"] for items in payload.values() for item in items}
+        liked = set(
+            Like.objects.filter(user=request.user, post_id__in=post_ids).values_list("post_id", flat=True)
+        )
+
+    def personalise(item):
+        item = {**item, "liked_by_user": item["id"] in liked}
+        for field in MEDIA_URL_FIELDS:
+            if item.get(field):
+                item[field] = request.build_absolute_uri(item[field])
+        return item
+
+    return {name: [personalise(item) for item in items] for name, items in payload.items()}
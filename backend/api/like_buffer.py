@@ -0,0 +1,192 @@
+"""
+Write-behind buffer for likes (settings.LIKE_WRITE_BEHIND)
+
+Like/unlike requests append an event to a Redis list instead of writing the
+Like table; `manage.py flush_likes --every N` drains the list into the
+database in batched transactions.
+
+Delivery is at least once: a flush first renames the pending list to an
+in-flight list and trims each batch off its head only after the batch has
+committed, so a flusher that dies part-way leaves the rest of the in-flight
+list to be replayed by the next one. Replays are harmless because a batch is
+applied as the final state of each (user, post) pair: inserts skip rows that
+exist, deletes skip rows that don't, and the post counters move only by the
+rows actually changed.
+
+Only the holder of the flush lock touches the in-flight list. The lock
+carries a per-flush token (redis-py's Lock: compare-and-delete in Lua) and
+is renewed around every batch; a flusher that finds it lost stops before
+trimming, leaving the list to the new holder.
+"""
+import logging
+import time
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from redis.exceptions import LockNotOwnedError, ResponseError
+
+from .highlights import invalidate_highlighted_posts
+from .models.like import Like
+from .models.post import Post
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+PENDING_KEY = "likes:pending"
+INFLIGHT_KEY = "likes:inflight"
+# Held while a flush runs and renewed per batch; expires on its own if the flusher dies
+LOCK_KEY = "likes:flush_lock"
+LOCK_TIMEOUT = 60
+
+_LIKE_SQL = """
+WITH changed AS (
+    INSERT INTO {like} (user_id, post_id, created_at)
+    SELECT * FROM UNNEST(%(users)s::bigint[], %(posts)s::bigint[], %(times)s::timestamptz[])
+    ON CONFLICT (user_id, post_id) DO NOTHING
+    RETURNING post_id
+)
+UPDATE {post} SET like_count = {post}.like_count + c.n
+FROM (SELECT post_id, COUNT(*) AS n FROM changed GROUP BY post_id) c
+WHERE {post}.id = c.post_id
+"""
+
+_UNLIKE_SQL = """
+WITH changed AS (
+    DELETE FROM {like} l
+    USING UNNEST(%(users)s::bigint[], %(posts)s::bigint[]) AS e(user_id, post_id)
+    WHERE l.user_id = e.user_id AND l.post_id = e.post_id
+    RETURNING l.post_id
+)
+UPDATE {post} SET like_count = GREATEST({post}.like_count - c.n, 0)
+FROM (SELECT post_id, COUNT(*) AS n FROM changed GROUP BY post_id) c
+WHERE {post}.id = c.post_id
+"""
+
+
+def _encode(user_id, post_id, liked, at):
+    return f"{int(liked)}:{user_id}:{post_id}:{at:.6f}"
+
+
+def _decode(event):
+    liked, user_id, post_id, at = event.split(":")
+    return int(user_id), int(post_id), liked == "1", float(at)
+
+
+def buffer_like(user, slug, liked):
+    """
+    Queue `user` liking (or unliking) the post with `slug`. Returns the
+    post's committed like count, which doesn't include queued events yet,
+    or None when there is no such post.
+    """
+    post = Post.objects.filter(slug=slug).values_list("id", "like_count").first()
+    if post is None:
+        return None
+    post_id, like_count = post
+    get_redis().rpush(PENDING_KEY, _encode(user.pk, post_id, liked, time.time()))
+    return like_count
+
+
+def pending_count():
+    """Events waiting for a flush, including an unfinished in-flight list."""
+    redis = get_redis()
+    return redis.llen(PENDING_KEY) + redis.llen(INFLIGHT_KEY)
+
+
+def flush_likes(batch_size=None):
+    """
+    Apply buffered events to the Like table and post counters,
+    `batch_size` events per transaction. Returns the number of events
+    applied, or None when another flush holds the lock.
+    """
+    batch_size = max(1, batch_size or settings.LIKE_FLUSH_BATCH_SIZE)
+    redis = get_redis()
+    lock = redis.lock(LOCK_KEY, timeout=LOCK_TIMEOUT, blocking=False, raise_on_release_error=False)
+    if not lock.acquire():
+        return None
+    applied = 0
+    changed = False
+    try:
+        # A leftover in-flight list is a flush that died; replay it first
+        if not redis.exists(INFLIGHT_KEY):
+            try:
+                redis.rename(PENDING_KEY, INFLIGHT_KEY)
+            except ResponseError:
+                return 0  # nothing pending
+
+        while True:
+            lock.reacquire()
+            events = redis.lrange(INFLIGHT_KEY, 0, batch_size - 1)
+            if not events:
+                break
+            changed |= apply_events(events)
+            # Still ours for another LOCK_TIMEOUT, so nobody else has read past this batch
+            lock.reacquire()
+            redis.ltrim(INFLIGHT_KEY, len(events), -1)
+            applied += len(events)
+        return applied
+    except LockNotOwnedError:
+        logger.warning("Like flush lost its lock after %d events; leaving the rest to the new holder.", applied)
+        return applied
+    finally:
+        lock.release()
+        if changed:
+            invalidate_highlighted_posts()
+
+
+def apply_events(events):
+    """
+    Apply one batch in a transaction: the last event per (user, post) wins.
+    Events for users or posts deleted since are dropped. Returns whether any
+    Like row was inserted or deleted.
+    """
+    final = {}
+    for event in events:
+        user_id, post_id, liked, at = _decode(event)
+        final[user_id, post_id] = (liked, at)
+    if not final:
+        return False
+
+    post_ids = set(Post.objects.filter(id__in={p for _, p in final}).values_list("id", flat=True))
+    user_ids = set(get_user_model().objects.filter(id__in={u for u, _ in final}).values_list("id", flat=True))
+    final = {pair: state for pair, state in final.items() if pair[0] in user_ids and pair[1] in post_ids}
+    likes = [(u, p, at) for (u, p), (liked, at) in final.items() if liked]
+    unlikes = [(u, p) for (u, p), (liked, _) in final.items() if not liked]
+
+    if connection.vendor == "postgresql":
+        return _apply_sql(likes, unlikes)
+    return _apply_orm(likes, unlikes)
+
+
+def _apply_sql(likes, unlikes):
+    tables = {"like": Like._meta.db_table, "post": Post._meta.db_table}
+    changed = 0
+    with transaction.atomic(), connection.cursor() as cursor:
+        if likes:
+            cursor.execute(_LIKE_SQL.format(**tables), {
+                "users": [u for u, _, _ in likes],
+                "posts": [p for _, p, _ in likes],
+                "times": [datetime.fromtimestamp(at, tz=timezone.utc) for _, _, at in likes],
+            })
+            changed += cursor.rowcount
+        if unlikes:
+            cursor.execute(_UNLIKE_SQL.format(**tables), {
+                "users": [u for u, _ in unlikes],
+                "posts": [p for _, p in unlikes],
+            })
+            changed += cursor.rowcount
+    return changed > 0
+
+
+def _apply_orm(likes, unlikes):
+    # Other databases: row by row, with the Like signals keeping the counters
+    changed = False
+    with transaction.atomic():
+        for user_id, post_id, _ in likes:
+            changed |= Like.objects.get_or_create(user_id=user_id, post_id=post_id)[1]
+        for user_id, post_id in unlikes:
+            for like in Like.objects.filter(user_id=user_id, post_id=post_id):
+                like.delete()
+                changed = True
+    return changed
@@ -0,0 +1,83 @@
+"""
+Idempotent like / unlike of a post by slug, in one round trip on PostgreSQL
+"""
+from django.db import connection, transaction
+
+from .highlights import invalidate_highlighted_posts
+from .models.like import Like
+from .models.post import Post
+
+# One statement per direction: find the post, insert or delete the like row,
+# and shift the counter only when a row was actually inserted or deleted.
+# The final SELECT sees the pre-statement snapshot of the post table, hence the
+# COALESCE with the counter the UPDATE returned.
+_LIKE_SQL = """
+WITH target AS (SELECT id, like_count FROM {post} WHERE slug = %(slug)s),
+changed AS (
+    INSERT INTO {like} (user_id, post_id, created_at)
+    SELECT %(user_id)s, id, NOW() FROM target
+    ON CONFLICT (user_id, post_id) DO NOTHING
+    RETURNING post_id
+),
+counted AS (
+    UPDATE {post} SET like_count = like_count + 1
+    WHERE id IN (SELECT post_id FROM changed)
+    RETURNING like_count
+)
+SELECT (SELECT COUNT(*) FROM changed),
+       COALESCE((SELECT like_count FROM counted), like_count)
+FROM target
+"""
+
+_UNLIKE_SQL = """
+WITH target AS (SELECT id, like_count FROM {post} WHERE slug = %(slug)s),
+changed AS (
+    DELETE FROM {like}
+    WHERE user_id = %(user_id)s AND post_id IN (SELECT id FROM target)
+    RETURNING post_id
+),
+counted AS (
+    UPDATE {post} SET like_count = like_count - 1
+    WHERE id IN (SELECT post_id FROM changed) AND like_count > 0
+    RETURNING like_count
+)
+SELECT (SELECT COUNT(*) FROM changed),
+       COALESCE((SELECT like_count FROM counted), like_count)
+FROM target
+"""
+
+
+def set_like(user, slug, liked):
+    """
+    Make `user` like (or stop liking) the post with `slug`; repeating the
+    call changes nothing. Returns the post's like count afterwards, or None
+    when there is no such post.
+    """
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            sql = _LIKE_SQL if liked else _UNLIKE_SQL
+            tables = {'like': Like._meta.db_table, 'post': Post._meta.db_table}
+            cursor.execute(sql.format(**tables), {'slug': slug, 'user_id': user.pk})
+            row = cursor.fetchone()
+        if row is None:
+            return None
+        changed, likes_count = row
+        if changed:
+            # The statement bypasses the Like signals, which would do this
+            transaction.on_commit(invalidate_highlighted_posts)
+        return likes_count
+    return _set_like_orm(user, slug, liked)
+
+
+def _set_like_orm(user, slug, liked):
+    # Other databases: the Like signals keep the counter and the highlights in step
+    with transaction.atomic():
+        post_id = Post.objects.filter(slug=slug).values_list('id', flat=True).first()
+        if post_id is None:
+            return None
+        if liked:
+            Like.objects.get_or_create(user=user, post_id=post_id)
+        else:
+            for like in Like.objects.filter(user=user, post_id=post_id):
+                like.delete()
+        return Post.objects.filter(pk=post_id).values_list('like_count', flat=True).first()
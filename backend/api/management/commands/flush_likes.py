@@ -0,0 +1,34 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from api.like_buffer import flush_likes
+
+
+class Command(BaseCommand):
+    help = (
+        "Apply buffered like/unlike events (LIKE_WRITE_BEHIND) to the Like table and post counters. "
+        "Keep it running with --every; an interrupted flush is replayed by the next one."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=settings.LIKE_FLUSH_BATCH_SIZE,
+            help="Events applied per transaction.",
+        )
+        parser.add_argument(
+            "--every", type=float, default=0,
+            help=f"Repeat every N seconds instead of exiting after one pass (e.g. {settings.LIKE_FLUSH_INTERVAL:g}).",
+        )
+
+    def handle(self, *args, batch_size, every, **options):
+        while True:
+            applied = flush_likes(batch_size=batch_size)
+            if applied is None:
+                self.stdout.write("Another flush is running.")
+            elif applied or every <= 0:
+                self.stdout.write(self.style.SUCCESS(f"Flushed {applied} like events."))
+            if every <= 0:
+                break
+            time.sleep(every)
@@ -0,0 +1,178 @@
+import csv
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Q
+
+from api.models.profile import Profile
+from api.models.security import UserSecurityAnswer, hash_security_answer
+from api.security_questions import SIGNUP_QUESTION_COUNT, signup_question_ids
+
+User = get_user_model()
+
+OPTIONAL_FIELDS = ("first_name", "last_name", "address", "phone_number")
+
+
+def read_csv(path, question_ids):
+    # security_answer_1..3 columns answer the signup questions in order
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            answers = [row.pop(f"security_answer_{n}", None) for n in range(1, SIGNUP_QUESTION_COUNT + 1)]
+            row["security_answers"] = [
+                {"question": qid, "answer": answer}
+                for qid, answer in zip(question_ids, answers) if answer
+            ]
+            yield row
+
+
+def read_jsonl(path):
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+class Command(BaseCommand):
+    help = (
+        "Create users (with profile and security answers) from a CSV or JSONL file. "
+        "Rows need username and email; password (plaintext), password_hash (an existing "
+        "Django hash) or neither (unusable password); optional first_name, last_name, "
+        "address, phone_number and three security answers (security_answers in JSONL, "
+        "a list of {question: <id>, answer} objects; security_answer_1..3 in CSV). Existing usernames/emails are skipped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV or JSONL file.")
+        parser.add_argument(
+            "--format", choices=("csv", "jsonl"),
+            help="Input format (default: from the file extension).",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=1000,
+            help="Users inserted per transaction.",
+        )
+        parser.add_argument(
+            "--hash-workers", type=int, default=os.cpu_count() or 1,
+            help="Threads hashing plaintext passwords and security answers (the hasher releases the GIL).",
+        )
+
+    def handle(self, *args, path, format, batch_size, hash_workers, **options):
+        fmt = format or ("csv" if path.lower().endswith(".csv") else "jsonl")
+        question_ids = signup_question_ids()
+        if len(question_ids) < SIGNUP_QUESTION_COUNT:
+            raise CommandError("System security questions are not initialized properly.")
+
+        rows = read_csv(path, question_ids) if fmt == "csv" else read_jsonl(path)
+        self.created = self.skipped = 0
+        self.errors = []
+        with ThreadPoolExecutor(max_workers=max(1, hash_workers)) as hashers:
+            batch = []
+            for line_no, row in enumerate(rows, start=1):
+                batch.append((line_no, row))
+                if len(batch) >= batch_size:
+                    self.import_batch(batch, question_ids, hashers)
+                    batch = []
+            if batch:
+                self.import_batch(batch, question_ids, hashers)
+
+        for line_no, message in self.errors[:20]:
+            self.stderr.write(f"Row {line_no}: {message}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {self.created} users, skipped {self.skipped} existing, {len(self.errors)} invalid rows."
+        ))
+
+    def clean_answers(self, answers, question_ids):
+        """
+        Check security_answers is empty or a list of {question, answer}
+        objects covering every signup question once, and return them in
+        question order.
+        """
+        if not answers:
+            return []
+        if not isinstance(answers, list) or not all(
+            isinstance(a, dict) and set(a) == {"question", "answer"} and isinstance(a["question"], int)
+            for a in answers
+        ):
+            raise ValidationError("security_answers must be a list of {question, answer} objects")
+        by_question = {a["question"]: a["answer"] for a in answers}
+        if len(answers) != SIGNUP_QUESTION_COUNT or set(by_question) != set(question_ids):
+            raise ValidationError(f"expected one answer to each of the security questions {question_ids}")
+        if not all(isinstance(a, str) and a.strip() for a in by_question.values()):
+            raise ValidationError("security answers must be non-empty strings")
+        return [(qid, by_question[qid]) for qid in question_ids]
+
+    def build_user(self, row, question_ids):
+        username = User.normalize_username((row.get("username") or "").strip())
+        email = User.objects.normalize_email((row.get("email") or "").strip())
+        if not username or not email:
+            raise ValidationError("username and email are required")
+
+        answers = self.clean_answers(row.get("security_answers"), question_ids)
+
+        user = User(
+            username=username, email=email,
+            **{field: row.get(field) or "" for field in OPTIONAL_FIELDS},
+        )
+        # Field validators and lengths; uniqueness is checked per batch
+        user.clean_fields(exclude=["password"])
+        if row.get("password_hash"):
+            identify_hasher(row["password_hash"])  # ValueError for unknown formats
+            user.password = row["password_hash"]
+        elif not row.get("password"):
+            user.set_unusable_password()
+        return user, answers
+
+    def import_batch(self, batch, question_ids, hashers):
+        users, answers_by_username, passwords = [], {}, {}
+        seen_usernames, seen_emails = set(), set()
+        for line_no, row in batch:
+            try:
+                user, answers = self.build_user(row, question_ids)
+            except (ValidationError, ValueError) as e:
+                self.errors.append((line_no, "; ".join(getattr(e, "messages", [str(e)]))))
+                continue
+            if user.username in seen_usernames or user.email in seen_emails:
+                self.skipped += 1
+                continue
+            seen_usernames.add(user.username)
+            seen_emails.add(user.email)
+            users.append(user)
+            answers_by_username[user.username] = answers
+            if row.get("password") and not row.get("password_hash"):
+                passwords[user.username] = row["password"]
+
+        # One query for every username/email in the batch that is already taken
+        existing = list(User.objects.filter(
+            Q(username__in=seen_usernames) | Q(email__in=seen_emails)
+        ).values_list("username", "email"))
+        taken_usernames = {u for u, _ in existing}
+        taken_emails = {e for _, e in existing}
+        fresh = [u for u in users if u.username not in taken_usernames and u.email not in taken_emails]
+        self.skipped += len(users) - len(fresh)
+        if not fresh:
+            return
+
+        to_hash = [u for u in fresh if u.username in passwords]
+        for user, encoded in zip(to_hash, hashers.map(make_password, [passwords[u.username] for u in to_hash])):
+            user.password = encoded
+
+        # Answers use the password hasher too, so they share the pool
+        security_answers, raw_answers = [], []
+        for u in fresh:
+            for qid, answer in answers_by_username[u.username]:
+                security_answers.append(UserSecurityAnswer(user=u, question_id=qid))
+                raw_answers.append(answer)
+        for answer, encoded in zip(security_answers, hashers.map(hash_security_answer, raw_answers)):
+            answer.answer_hash = encoded
+
+        with transaction.atomic():
+            User.objects.bulk_create(fresh)
+            Profile.objects.bulk_create(Profile(user=u) for u in fresh)
+            UserSecurityAnswer.objects.bulk_create(security_answers)
+        self.created += len(fresh)
@@ -0,0 +1,39 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from api.refresh_tokens import prune_expired_tokens
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete expired refresh tokens from the simplejwt outstanding/blacklisted tables. "
+        "Run it from cron, or keep it running with --every."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=1000,
+            help="Number of expired tokens deleted per transaction.",
+        )
+        parser.add_argument(
+            "--pause", type=float, default=0.1,
+            help="Seconds to sleep between batches.",
+        )
+        parser.add_argument(
+            "--every", type=int, default=0,
+            help="Repeat every N seconds instead of exiting after one pass.",
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true",
+            help="Report how many tokens have expired without deleting them.",
+        )
+
+    def handle(self, *args, batch_size, pause, every, dry_run, **options):
+        while True:
+            removed = prune_expired_tokens(batch_size=max(1, batch_size), pause=pause, dry_run=dry_run)
+            verb = "Would prune" if dry_run else "Pruned"
+            self.stdout.write(self.style.SUCCESS(f"{verb} {removed} expired tokens."))
+            if every <= 0:
+                break
+            time.sleep(every)
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F, Max, Q
+
+from api.models.post import Post, actual_comment_count, actual_like_count
+
+
+class Command(BaseCommand):
+    help = "Recompute Post.like_count / Post.comment_count from the Like and Comment tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=1000,
+            help="Number of posts (by primary key range) checked per transaction.",
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true",
+            help="Report drifted posts without writing the corrected counts.",
+        )
+
+    def handle(self, *args, batch_size, dry_run, **options):
+        batch_size = max(1, batch_size)
+        max_pk = Post.objects.aggregate(max_pk=Max("pk"))["max_pk"] or 0
+
+        checked = fixed = 0
+        for start in range(0, max_pk + 1, batch_size):
+            # Short, pk-bounded transactions keep row locks brief on a live table
+            with transaction.atomic():
+                batch = Post.objects.filter(pk__gte=start, pk__lt=start + batch_size)
+                drifted = list(
+                    batch.annotate(actual_likes=actual_like_count(), actual_comments=actual_comment_count())
+                    .filter(~Q(like_count=F("actual_likes")) | ~Q(comment_count=F("actual_comments")))
+                    .values_list("pk", flat=True)
+                )
+                checked += batch.count()
+                if drifted and not dry_run:
+                    # Counts are re-evaluated inside the UPDATE, so concurrent likes aren't lost
+                    Post.objects.filter(pk__in=drifted).update(
+                        like_count=actual_like_count(), comment_count=actual_comment_count()
+                    )
+                fixed += len(drifted)
+
+        verb = "would fix" if dry_run else "fixed"
+        self.stdout.write(self.style.SUCCESS(f"Checked {checked} posts, {verb} {fixed} drifted counters."))
@@ -2,10 +2,13 @@
 Basic XSS Protection Middleware 
 """
 import re
-import html
 from django.http import JsonResponse
 from django.utils.deprecation import MiddlewareMixin
 
+from .content_safety import (CSS_EXPRESSION, EMBED_SRC, EVAL_CALL, IFRAME_SRC, JAVASCRIPT_URL,
+                             OBJECT_DATA, QUOTED_EVENT_HANDLER, SCRIPT_ELEMENT)
+from .screening import PatternSet, PrefixTrie, request_text, screens_body
+
 
 class SimpleXSSProtectionMiddleware(MiddlewareMixin):
     """
@@ -13,15 +16,16 @@ class SimpleXSSProtectionMiddleware(MiddlewareMixin):
     """
 
     # only check for the most  dangerous XSS patterns
+    # (lower case: matched case-insensitively in a single pass, see api/screening.py)
     DANGEROUS_PATTERNS = [
-        r'<script[^>]*>.*?</script>',  # script tags
-        r'javascript:',               # javascript protocol
-        r'on\w+\s*=\s*["\'][^"\']*["\']',  # event handler attributes
-        r'eval\s*\(',                 # eval function
-        r'expression\s*\(',           # CSS expression
-        r'<iframe[^>]*src\s*=',       # iframe with src
-        r'<object[^>]*data\s*=',      # object with data
-        r'<embed[^>]*src\s*=',        # embed with src
+        SCRIPT_ELEMENT,               # script tags
+        JAVASCRIPT_URL,               # javascript protocol
+        QUOTED_EVENT_HANDLER,         # event handler attributes
+        EVAL_CALL,                    # eval function
+        CSS_EXPRESSION,               # CSS expression
+        IFRAME_SRC,                   # iframe with src
+        OBJECT_DATA,                  # object with data
+        EMBED_SRC,                    # embed with src
     ]
 
     # allowed API endpoints (no strict checking)
@@ -56,26 +60,21 @@ class SimpleXSSProtectionMiddleware(MiddlewareMixin):
     
     def __init__(self, get_response):
         self.get_response = get_response
-        self.compiled_patterns = [re.compile(pattern, re.IGNORECASE | re.DOTALL) 
-                                for pattern in self.DANGEROUS_PATTERNS]
+        self.xss_patterns = PatternSet(self.DANGEROUS_PATTERNS, re.IGNORECASE | re.DOTALL)
+        self.allowed_endpoints = PrefixTrie((endpoint, True) for endpoint in self.ALLOWED_ENDPOINTS)
     
     def __call__(self, request):
         # Check if it's an allowed endpoint
-        is_allowed_endpoint = any(request.path.startswith(endpoint) 
-                                for endpoint in self.ALLOWED_ENDPOINTS)
+        is_allowed_endpoint = self.allowed_endpoints.match(request.path) is not None
 
         # For non-allowed endpoints, perform XSS checks
-        if not is_allowed_endpoint and request.method in ['POST', 'PUT', 'PATCH']:
-            if hasattr(request, 'body') and request.body:
-                try:
-                    body_str = request.body.decode('utf-8', errors='ignore')
-                    if self._contains_dangerous_xss(body_str):
-                        return JsonResponse({
-                            'error': 'Potential XSS attack detected',
-                            'message': 'Your input contains unsafe content.'
-                        }, status=400)
-                except:
-                    pass
+        if not is_allowed_endpoint and screens_body(request):
+            # The body is decoded once and shared with the SQL middleware
+            if self._contains_dangerous_xss(request_text(request)):
+                return JsonResponse({
+                    'error': 'Potential XSS attack detected',
+                    'message': 'Your input contains unsafe content.'
+                }, status=400)
         
         response = self.get_response(request)
         
@@ -88,10 +87,7 @@ class SimpleXSSProtectionMiddleware(MiddlewareMixin):
     
     def _contains_dangerous_xss(self, text):
         """Check if the text contains dangerous XSS patterns"""
-        for pattern in self.compiled_patterns:
-            if pattern.search(text):
-                return True
-        return False
+        return self.xss_patterns.search(text) is not None
     
     def _contains_any_html(self, text):
         """Check if the text contains any HTML tags"""
@@ -104,17 +100,3 @@ class SimpleXSSProtectionMiddleware(MiddlewareMixin):
         response['X-Content-Type-Options'] = 'nosniff'
         response['X-Frame-Options'] = 'DENY'
         return response
-    
-    def _sanitize_text(self, text):
-        """Basic text sanitization"""
-        if not text:
-            return text
-
-        # HTML escape
-        text = html.escape(text)
-
-        # Remove dangerous patterns
-        for pattern in self.compiled_patterns:
-            text = pattern.sub('', text)
-        
-        return text
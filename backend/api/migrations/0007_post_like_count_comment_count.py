@@ -0,0 +1,47 @@
+# Generated by Django 4.2.23 on 2026-10-17 20:19
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    """Seed the new counter columns from the existing Like and Comment rows."""
+    Post = apps.get_model('api', 'Post')
+    Like = apps.get_model('api', 'Like')
+    Comment = apps.get_model('api', 'Comment')
+
+    def count_of(model):
+        counts = (model.objects.filter(post=OuterRef('pk'))
+                  .order_by()
+                  .values('post')
+                  .annotate(total=Count('*'))
+                  .values('total'))
+        return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+    Post.objects.update(like_count=count_of(Like), comment_count=count_of(Comment))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_ensure_cache_table'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='like_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['is_published', '-like_count', '-created_at'], name='api_post_is_publ_d70a25_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.23 on 2026-10-17 20:54
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_post_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(django.db.models.functions.text.Upper('email'), name='api_user_email_upper_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+from django.db import migrations
+
+INDEX_NAME = "api_outstandingtoken_expires_at"
+
+
+def create_expires_at_index(apps, schema_editor):
+    """
+    Indexes token_blacklist_outstandingtoken.expires_at (simplejwt ships none),
+    so prune_tokens finds expired rows without scanning the table.
+    On PostgreSQL the index is built CONCURRENTLY to avoid blocking logins.
+    """
+    concurrently = "CONCURRENTLY " if schema_editor.connection.vendor == "postgresql" else ""
+    schema_editor.execute(
+        f'CREATE INDEX {concurrently}IF NOT EXISTS "{INDEX_NAME}" '
+        'ON "token_blacklist_outstandingtoken" ("expires_at")'
+    )
+
+
+def drop_expires_at_index(apps, schema_editor):
+    schema_editor.execute(f'DROP INDEX IF EXISTS "{INDEX_NAME}"')
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("api", "0009_customuser_email_upper_idx"),
+        ("token_blacklist", "0013_alter_blacklistedtoken_options_and_more"),
+    ]
+    operations = [
+        migrations.RunPython(create_expires_at_index, drop_expires_at_index),
+    ]
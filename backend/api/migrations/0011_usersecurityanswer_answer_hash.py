@@ -0,0 +1,42 @@
+from django.contrib.auth.hashers import make_password
+from django.db import migrations, models
+
+
+def hash_answer(raw_answer):
+    # Same format as api.models.security.hash_security_answer
+    return make_password(raw_answer.strip().lower())
+
+
+def hash_existing_answers(apps, schema_editor):
+    UserSecurityAnswer = apps.get_model("api", "UserSecurityAnswer")
+    batch = []
+    for answer in UserSecurityAnswer.objects.only("pk", "answer").iterator(chunk_size=1000):
+        answer.answer_hash = hash_answer(answer.answer)
+        batch.append(answer)
+        if len(batch) >= 1000:
+            UserSecurityAnswer.objects.bulk_update(batch, ["answer_hash"])
+            batch = []
+    if batch:
+        UserSecurityAnswer.objects.bulk_update(batch, ["answer_hash"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0010_outstandingtoken_expires_at_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="usersecurityanswer",
+            name="answer_hash",
+            field=models.CharField(default="", max_length=128),
+            preserve_default=False,
+        ),
+        # Plaintext answers can't be recovered, so this is one-way
+        migrations.RunPython(hash_existing_answers, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name="usersecurityanswer",
+            name="answer",
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.23 on 2026-10-17 21:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_comment_like_indexes'),
+    ]
+
+    # The new post-led index replaces (post, user) before that one is dropped
+    operations = [
+        migrations.AddIndex(
+            model_name='like',
+            index=models.Index(fields=['post', '-created_at', '-id'], name='api_like_post_id_b0658d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='like',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='api_like_user_id_0e9533_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='like',
+            name='api_like_post_id_4dadf1_idx',
+        ),
+    ]
@@ -0,0 +1,36 @@
+from django.db import migrations
+
+def create_cache_tables(apps, schema_editor):
+    """
+    Creates the table of every DatabaseCache in CACHES that does not exist yet.
+    0006 only looks at CACHES["default"], which is now a tiered cache whose
+    shared tier may be the database.
+    """
+    from django.conf import settings
+    from django.core.management import call_command
+
+    tables = [
+        cfg.get("LOCATION") for cfg in settings.CACHES.values()
+        if cfg.get("BACKEND") == "django.core.cache.backends.db.DatabaseCache"
+    ]
+    tables = [table for table in tables if isinstance(table, str) and table]
+    if not tables:
+        return
+
+    # Idempotency check: skip tables that already exist
+    connection = schema_editor.connection
+    existing = set(connection.introspection.table_names())
+
+    # Support for multiple databases: use the connection alias of the current migration
+    alias = connection.alias
+    for table in tables:
+        if table not in existing:
+            call_command("createcachetable", table, database=alias, verbosity=0)
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0013_like_listing_indexes"),
+    ]
+    operations = [
+        migrations.RunPython(create_cache_tables, migrations.RunPython.noop),
+    ]
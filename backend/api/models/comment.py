@@ -5,15 +5,43 @@ from .post import Post
 User = settings.AUTH_USER_MODEL
 
 
+class CommentQuerySet(models.QuerySet):
+    def for_display(self):
+        """
+        Only what CommentSerializer emits: the comment row, its author's
+        username and avatar (one join through to Profile). The parent post
+        is left out entirely; its id is on the comment.
+        """
+        return self.select_related('author__profile').only(
+            'id', 'post', 'author', 'content', 'created_at', 'updated_at',
+            'author__username', 'author__profile__avatar',
+        )
+
+    def for_my_list(self):
+        """Only what MyCommentItemSerializer emits: the comment and its post's title and slug."""
+        return self.select_related('post').only(
+            'id', 'post', 'content', 'created_at', 'post__title', 'post__slug',
+        )
+
+
 class Comment(models.Model):
-    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="comments")
-    author = models.ForeignKey(User, on_delete=models.CASCADE, related_name="comments")
+    # Indexed by the composite indexes below, which lead with these columns
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="comments", db_index=False)
+    author = models.ForeignKey(User, on_delete=models.CASCADE, related_name="comments", db_index=False)
     content = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = CommentQuerySet.as_manager()
+
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # A post's thread and a user's comments, newest first (id breaks
+            # ties for keyset pagination), read straight off the index
+            models.Index(fields=["post", "-created_at", "-id"]),
+            models.Index(fields=["author", "-created_at", "-id"]),
+        ]
 
     def __str__(self):
         return f"{self.author.username} on {self.post.title[:30]}"
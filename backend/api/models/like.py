@@ -6,12 +6,19 @@ User = settings.AUTH_USER_MODEL
 
 
 class Like(models.Model):
-    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="likes")
-    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="likes")
+    # Indexed by unique_together and the composite indexes below
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="likes", db_index=False)
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="likes", db_index=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         unique_together = ('user', 'post')  # Preventing Repeated Likes
+        indexes = [
+            # A post's likes and a user's likes, newest first (id breaks ties
+            # for keyset pagination); per-post counts scan the first one
+            models.Index(fields=["post", "-created_at", "-id"]),
+            models.Index(fields=["user", "-created_at", "-id"]),
+        ]
 
     def __str__(self):
         return f"{self.user.username} ❤️ {self.post.title[:30]}"
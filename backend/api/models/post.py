@@ -1,10 +1,111 @@
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
+from django.db import connection, models
 from django.conf import settings
+from django.db.models import Count, Exists, F, IntegerField, OuterRef, Prefetch, Subquery, Value
+from django.db.models.functions import Coalesce, Substr
 from django.utils.text import slugify
 from .tag import Tag  
 
 User = settings.AUTH_USER_MODEL
 
+# Characters of the HTML body loaded for list-mode excerpts
+EXCERPT_SOURCE_LENGTH = 1000
+
+# Denormalized counters maintained by the Like/Comment signal handlers.
+# A plain save() never writes them back, so a stale in-memory copy can't clobber them.
+COUNTER_FIELDS = ('like_count', 'comment_count')
+
+# Full-text search document: title ranks above body. The default parser skips
+# HTML tags, so the raw content can be indexed as-is.
+SEARCH_CONFIG = 'english'
+SEARCH_VECTOR = (SearchVector('title', weight='A', config=SEARCH_CONFIG)
+                 + SearchVector('content', weight='B', config=SEARCH_CONFIG))
+
+
+def search_vector_of(title, content):
+    """SEARCH_VECTOR over given values rather than the stored columns."""
+    return (SearchVector(Value(title), weight='A', config=SEARCH_CONFIG)
+            + SearchVector(Value(content), weight='B', config=SEARCH_CONFIG))
+
+
+def _count_per_post(queryset):
+    """Correlated COUNT(*) subquery so several counters don't multiply each other's joins."""
+    counts = (queryset.filter(post=OuterRef('pk'))
+              .order_by()
+              .values('post')
+              .annotate(total=Count('*'))
+              .values('total'))
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+def actual_like_count():
+    """Expression recomputing a post's like count from the Like table."""
+    from .like import Like
+    return _count_per_post(Like.objects.all())
+
+
+def actual_comment_count():
+    """Expression recomputing a post's comment count from the Comment table."""
+    from .comment import Comment
+    return _count_per_post(Comment.objects.all())
+
+
+class PostQuerySet(models.QuerySet):
+    def for_list(self):
+        """Skip the full body and load only the head needed for an excerpt."""
+        return self.defer('content').annotate(
+            content_head=Substr('content', 1, EXCERPT_SOURCE_LENGTH)
+        )
+
+    def with_related(self):
+        """Load author, author profile and tags up front instead of once per post."""
+        return self.select_related('author__profile').prefetch_related('tags')
+
+    def with_comments(self):
+        """Prefetch the comments with just the columns CommentSerializer needs."""
+        from .comment import Comment
+        return self.prefetch_related(
+            Prefetch('comments', queryset=Comment.objects.for_display())
+        )
+
+    def with_engagement(self, user):
+        """
+        Annotate whether the viewer likes each post in SQL so PostSerializer doesn't query it per post.
+        Like/comment counts come from the denormalized counter columns.
+        """
+        from .like import Like
+
+        if user is not None and user.is_authenticated:
+            viewer_liked = Exists(Like.objects.filter(post=OuterRef('pk'), user=user))
+        else:
+            viewer_liked = Value(False, output_field=models.BooleanField())
+
+        return self.annotate(viewer_liked=viewer_liked)
+
+    def update_search_vector(self):
+        """Recompute the tsvector column in the database (PostgreSQL only)."""
+        if connection.vendor != 'postgresql':
+            return 0
+        return self.update(search_vector=SEARCH_VECTOR)
+
+    def adjust_counters(self, likes=0, comments=0):
+        """Atomically shift the denormalized counters with a single UPDATE."""
+        changes = {}
+        if likes:
+            changes['like_count'] = F('like_count') + likes
+        if comments:
+            changes['comment_count'] = F('comment_count') + comments
+        if not changes:
+            return 0
+        return self.update(**changes)
+
+
+class PostManager(models.Manager.from_queryset(PostQuerySet)):
+    def get_queryset(self):
+        # The tsvector is only ever read inside SQL; don't ship it with every row
+        return super().get_queryset().defer('search_vector')
+
 
 class Post(models.Model):
     author = models.ForeignKey(User, on_delete=models.CASCADE, related_name='posts')
@@ -16,14 +117,23 @@ class Post(models.Model):
 
     tags = models.ManyToManyField(Tag, related_name="posts", blank=True)
 
+    like_count = models.PositiveIntegerField(default=0, editable=False)
+    comment_count = models.PositiveIntegerField(default=0, editable=False)
+
+    search_vector = SearchVectorField(null=True, editable=False)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = PostManager()
+
     class Meta:
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["author"]),
             models.Index(fields=["is_published", "created_at"]),
+            models.Index(fields=["is_published", "-like_count", "-created_at"]),
+            GinIndex(fields=["search_vector"], name="api_post_search_vector_gin"),
         ]
 
     def __str__(self):
@@ -41,4 +151,29 @@ class Post(models.Model):
 
             self.slug = slug
 
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            deferred = self.get_deferred_fields()
+            kwargs['update_fields'] = [
+                f.name for f in self._meta.concrete_fields
+                if not f.primary_key and f.name not in COUNTER_FIELDS
+                and f.name != 'search_vector' and f.attname not in deferred
+            ]
+
+        update_fields = kwargs.get('update_fields')
+        reindex = update_fields is None or bool({'title', 'content'} & set(update_fields))
+        # An update writes the vector in the same statement; an INSERT can't
+        # reference its own row, so a new post gets a follow-up UPDATE
+        inline = (reindex and not self._state.adding and connection.vendor == 'postgresql'
+                  and not {'title', 'content'} & self.get_deferred_fields())
+        if inline:
+            # The new values as literals: inside the UPDATE the columns still hold the old ones
+            self.search_vector = search_vector_of(self.title, self.content)
+            kwargs['update_fields'] = [*update_fields, 'search_vector']
+
         super().save(*args, **kwargs)
+
+        if inline:
+            # Back to deferred: the attribute holds the expression, not the stored value
+            del self.search_vector
+        elif reindex:
+            Post.objects.filter(pk=self.pk).update_search_vector()
@@ -17,5 +17,41 @@ class Profile(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Bumped on every write, so it never counts as a change by itself
+    UNTRACKED_FIELDS = ("id", "user", "created_at", "updated_at")
+
     def __str__(self):
         return f"Profile({self.user.username})"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def changed_fields(self):
+        """Names of the fields assigned a different value since the row was loaded or saved."""
+        loaded = getattr(self, "_loaded_values", None)
+        tracked = [f for f in self._meta.concrete_fields if f.name not in self.UNTRACKED_FIELDS]
+        if loaded is None:
+            return [f.name for f in tracked]
+        return [
+            f.name for f in tracked
+            if (f.attname in loaded and getattr(self, f.attname) != loaded[f.attname])
+            # A deferred field that has since been assigned
+            or (f.attname not in loaded and f.attname in self.__dict__)
+        ]
+
+    def save(self, *args, **kwargs):
+        """
+        Writes only the changed fields (plus updated_at) of an existing profile,
+        and nothing at all when none changed. An explicit update_fields is
+        respected as is.
+        """
+        if not self._state.adding and kwargs.get("update_fields") is None and hasattr(self, "_loaded_values"):
+            changed = self.changed_fields()
+            if not changed:
+                return
+            kwargs["update_fields"] = changed + ["updated_at"]
+        super().save(*args, **kwargs)
+        self._loaded_values = {f.attname: getattr(self, f.attname) for f in self._meta.concrete_fields}
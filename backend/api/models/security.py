@@ -1,4 +1,5 @@
 # backend/api/models/security.py
+from django.contrib.auth.hashers import check_password, make_password
 from django.db import models
 from django.conf import settings
 
@@ -12,13 +13,36 @@ class SecurityQuestion(models.Model):
         return self.question_text
 
 
+def normalize_security_answer(raw_answer):
+    return raw_answer.strip().lower()
+
+
+def hash_security_answer(raw_answer):
+    """
+    Password-hasher encoding (make_password) of the normalized answer
+    (stripped, lower-cased). It is salted and independent of SECRET_KEY, so
+    rotating the key leaves stored answers valid.
+    """
+    return make_password(normalize_security_answer(raw_answer))
+
+
 class UserSecurityAnswer(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='security_answers')
     question = models.ForeignKey(SecurityQuestion, on_delete=models.CASCADE)
-    answer = models.CharField(max_length=255)
+    answer_hash = models.CharField(max_length=128)
 
     class Meta:
         unique_together = ('user', 'question')
 
     def __str__(self):
-        return f"{self.user.username} - {self.question.question_text}"
\ No newline at end of file
+        return f"{self.user.username} - {self.question.question_text}"
+
+    def set_answer(self, raw_answer):
+        self.answer_hash = hash_security_answer(raw_answer)
+
+    def check_answer(self, raw_answer):
+        """Check `raw_answer` against the stored hash, as check_password() does for passwords."""
+        # A missing answer still costs one hash, and never matches
+        given = raw_answer if isinstance(raw_answer, str) else ""
+        matches = check_password(normalize_security_answer(given), self.answer_hash)
+        return matches and isinstance(raw_answer, str)
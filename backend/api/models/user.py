@@ -1,5 +1,6 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models.functions import Upper
 
 
 class CustomUser(AbstractUser):
@@ -8,5 +9,11 @@ class CustomUser(AbstractUser):
     phone_number = models.CharField(max_length=20, blank=True)
     is_admin_user = models.BooleanField(default=False)
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # email__iexact compiles to UPPER(email) = UPPER(%s); see api/backends.py
+            models.Index(Upper("email"), name="api_user_email_upper_idx"),
+        ]
+
     def __str__(self):
         return self.username
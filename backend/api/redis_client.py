@@ -0,0 +1,234 @@
+"""
+Process-wide Redis client, created on first use
+"""
+import os
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from redis.exceptions import LockError, LockNotOwnedError, ResponseError
+
+_lock = threading.Lock()
+_client = None
+_client_pid = None
+
+
+def get_redis():
+    """
+    Return the process's Redis client.
+    Nothing connects at import or startup; the pool is built on first use and
+    rebuilt in a forked child (gunicorn --preload), so workers never share
+    the parent's sockets. The pool is bounded by REDIS_MAX_CONNECTIONS and
+    reuses connections instead of opening one per request.
+    """
+    global _client, _client_pid
+    pid = os.getpid()
+    client = _client
+    if client is not None and _client_pid == pid:
+        return client
+    with _lock:
+        if _client is None or _client_pid != pid:
+            _client = _build_client()
+            _client_pid = pid
+        return _client
+
+
+def reset_redis():
+    """Drop the process's client; the next get_redis() builds a new one."""
+    global _client, _client_pid
+    with _lock:
+        client, _client, _client_pid = _client, None, None
+    if client is not None and hasattr(client, "connection_pool"):
+        client.connection_pool.disconnect()
+
+
+def _build_client():
+    if settings.REDIS_CLIENT_BACKEND == "local":
+        return LocalRedis()
+
+    import redis
+    pool = redis.ConnectionPool(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        db=settings.REDIS_DB,
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+        health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+        retry_on_timeout=True,
+        decode_responses=True,
+    )
+    return redis.Redis(connection_pool=pool)
+
+
+class LocalRedis:
+    """
+    In-memory stand-in for the redis-py commands the project uses (the like
+    buffer's keys, strings with expiry, lists and a lock), with
+    decode_responses=True semantics. Selected with REDIS_CLIENT_BACKEND =
+    "local"; state lives in the instance, so it is not shared between
+    processes. Add a command here when new code starts using it.
+    """
+
+    WRONGTYPE = "WRONGTYPE Operation against a key holding the wrong kind of value"
+
+    def __init__(self):
+        self._data = {}
+        self._expires = {}
+        self._lock = threading.RLock()
+
+    # Internals
+
+    def _alive(self, name):
+        expires_at = self._expires.get(name)
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._data.pop(name, None)
+            self._expires.pop(name, None)
+        return name in self._data
+
+    def _get_typed(self, name, kind):
+        if not self._alive(name):
+            return None
+        value = self._data[name]
+        if not isinstance(value, kind):
+            raise ResponseError(self.WRONGTYPE)
+        return value
+
+    @staticmethod
+    def _encode(value):
+        if isinstance(value, bytes):
+            return value.decode()
+        return str(value)
+
+    # Keys
+
+    def exists(self, *names):
+        with self._lock:
+            return sum(1 for name in names if self._alive(name))
+
+    def delete(self, *names):
+        with self._lock:
+            removed = 0
+            for name in names:
+                if self._alive(name):
+                    removed += 1
+                self._data.pop(name, None)
+                self._expires.pop(name, None)
+            return removed
+
+    def rename(self, src, dst):
+        with self._lock:
+            if not self._alive(src):
+                raise ResponseError("no such key")
+            self._data[dst] = self._data.pop(src)
+            self._expires.pop(dst, None)
+            if src in self._expires:
+                self._expires[dst] = self._expires.pop(src)
+            return True
+
+    # Strings
+
+    def get(self, name):
+        with self._lock:
+            return self._get_typed(name, str)
+
+    def set(self, name, value, ex=None, px=None, nx=False):
+        with self._lock:
+            if nx and self._alive(name):
+                return None
+            self._data[name] = self._encode(value)
+            self._expires.pop(name, None)
+            if ex is not None:
+                self._expires[name] = time.monotonic() + ex
+            elif px is not None:
+                self._expires[name] = time.monotonic() + px / 1000
+            return True
+
+    # Lists
+
+    def rpush(self, name, *values):
+        with self._lock:
+            items = self._get_typed(name, list)
+            if items is None:
+                items = self._data[name] = []
+            items.extend(self._encode(value) for value in values)
+            return len(items)
+
+    def lrange(self, name, start, end):
+        with self._lock:
+            items = self._get_typed(name, list) or []
+            end = len(items) if end == -1 else end + 1
+            return list(items[start:end])
+
+    def ltrim(self, name, start, end):
+        with self._lock:
+            items = self._get_typed(name, list)
+            if items is not None:
+                end = len(items) if end == -1 else end + 1
+                items[:] = items[start:end]
+                if not items:
+                    del self._data[name]
+            return True
+
+    def llen(self, name):
+        with self._lock:
+            return len(self._get_typed(name, list) or [])
+
+    # Locks
+
+    def lock(self, name, timeout=None, blocking=True, raise_on_release_error=True, **kwargs):
+        return LocalLock(self, name, timeout, blocking, raise_on_release_error)
+
+
+class LocalLock:
+    """
+    LocalRedis counterpart of redis.lock.Lock: a token-owned key that only
+    its owner can renew or delete.
+    """
+
+    def __init__(self, redis, name, timeout, blocking, raise_on_release_error):
+        self.redis = redis
+        self.name = name
+        self.timeout = timeout
+        self.blocking = blocking
+        self.raise_on_release_error = raise_on_release_error
+        self.token = None
+
+    def acquire(self, blocking=None):
+        blocking = self.blocking if blocking is None else blocking
+        token = uuid.uuid4().hex
+        while not self.redis.set(self.name, token, nx=True, px=self._timeout_ms()):
+            if not blocking:
+                return False
+            time.sleep(0.1)
+        self.token = token
+        return True
+
+    def reacquire(self):
+        if self.token is None:
+            raise LockError("Cannot reacquire an unlocked lock", lock_name=self.name)
+        with self.redis._lock:
+            self._check_owned("reacquire")
+            self.redis.set(self.name, self.token, px=self._timeout_ms())
+        return True
+
+    def release(self):
+        if self.token is None:
+            raise LockError("Cannot release an unlocked lock", lock_name=self.name)
+        try:
+            with self.redis._lock:
+                self._check_owned("release")
+                self.redis.delete(self.name)
+        except LockNotOwnedError:
+            if self.raise_on_release_error:
+                raise
+        finally:
+            self.token = None
+
+    def _check_owned(self, action):
+        if self.redis.get(self.name) != self.token:
+            raise LockNotOwnedError(f"Cannot {action} a lock that's no longer owned", lock_name=self.name)
+
+    def _timeout_ms(self):
+        return None if self.timeout is None else int(self.timeout * 1000)
@@ -0,0 +1,85 @@
+"""
+Refresh-token rotation with a cached blacklist check, and pruning of expired
+outstanding/blacklisted tokens
+"""
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import aware_utcnow
+
+# Set when a refresh token is blacklisted here (rotation or logout) and kept
+# until the token expires, so replays of used tokens are rejected without a
+# database round trip. A miss falls back to the indexed blacklist lookup;
+# "not blacklisted" is never cached, since another worker may blacklist the
+# token at any moment.
+BLACKLISTED_KEY = "auth:blacklisted:%s"
+
+
+def _remaining_lifetime(exp):
+    return max(1, int(exp - time.time()) + 1)
+
+
+def _blacklist_cache():
+    # The shared tier of the default TieredCache: a per-process L1 copy could
+    # miss a blacklisting done by another worker
+    return getattr(cache, "shared", cache)
+
+
+class CachedRefreshToken(RefreshToken):
+    """RefreshToken whose blacklist membership is answered from the cache first."""
+
+    def check_blacklist(self):
+        jti = self.payload[api_settings.JTI_CLAIM]
+        key = BLACKLISTED_KEY % jti
+        if _blacklist_cache().get(key):
+            raise TokenError(_("Token is blacklisted"))
+        if BlacklistedToken.objects.filter(token__jti=jti).exists():
+            _blacklist_cache().set(key, True, _remaining_lifetime(self.payload["exp"]))
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self):
+        result = super().blacklist()
+        _blacklist_cache().set(
+            BLACKLISTED_KEY % self.payload[api_settings.JTI_CLAIM], True,
+            _remaining_lifetime(self.payload["exp"]),
+        )
+        return result
+
+
+class CachedTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = CachedRefreshToken
+
+
+def prune_expired_tokens(batch_size=1000, pause=0.0, dry_run=False):
+    """
+    Delete outstanding tokens that have expired, with their blacklist rows.
+    Works through the expires_at index one batch per short transaction, so
+    concurrent logins and refreshes never wait behind a long delete.
+    Returns the number of outstanding tokens removed (or that would be).
+    """
+    now = aware_utcnow()
+    expired = OutstandingToken.objects.filter(expires_at__lte=now)
+    if dry_run:
+        return expired.count()
+
+    removed = 0
+    while True:
+        with transaction.atomic():
+            ids = list(expired.order_by("expires_at").values_list("pk", flat=True)[:batch_size])
+            if not ids:
+                break
+            BlacklistedToken.objects.filter(token_id__in=ids).delete()
+            OutstandingToken.objects.filter(pk__in=ids).delete()
+        removed += len(ids)
+        if len(ids) < batch_size:
+            break
+        if pause:
+            time.sleep(pause)
+    return removed
@@ -0,0 +1,128 @@
+"""
+Shared request screening engine for the security middlewares
+"""
+import re
+
+# Methods whose body is screened
+BODY_METHODS = frozenset({'POST', 'PUT', 'PATCH'})
+
+_TEXT_ATTR = '_screening_text'
+
+
+class PrefixTrie:
+    """
+    Character trie over path prefixes.
+    `match(path)` returns the label of the longest registered prefix of
+    `path` (None if there is none), walking at most len(longest prefix)
+    characters instead of calling startswith() once per prefix.
+    """
+
+    _LABEL = object()
+
+    def __init__(self, prefixes=()):
+        self._root = {}
+        for prefix, label in prefixes:
+            self.insert(prefix, label)
+
+    def insert(self, prefix, label):
+        node = self._root
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node.setdefault(self._LABEL, label)
+
+    def match(self, path):
+        node = self._root
+        found = node.get(self._LABEL)
+        for char in path:
+            node = node.get(char)
+            if node is None:
+                break
+            found = node.get(self._LABEL, found)
+        return found
+
+
+WORD_BOUNDARY = r'\b'
+
+
+def _has_top_level_alternation(pattern):
+    depth, escaped, in_class = 0, False, False
+    for char in pattern:
+        if escaped:
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif in_class:
+            in_class = char != ']'
+        elif char == '[':
+            in_class = True
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            return True
+    return False
+
+
+class PatternSet:
+    """
+    A list of regexes compiled into one alternation, so a text is scanned in a
+    single pass. `search(text)` returns the source pattern that matched first,
+    or None.
+
+    Two rewrites keep the single pass cheaper than searching pattern by pattern:
+    patterns that start with a word boundary share a single one, and
+    re.IGNORECASE is replaced by lower-casing the text once, which lets the
+    regex engine skip ahead on literal characters. Patterns compiled with
+    re.IGNORECASE must therefore be written in lower case.
+    """
+
+    def __init__(self, patterns, flags=0):
+        self.patterns = tuple(patterns)
+        self.fold_case = bool(flags & re.IGNORECASE)
+        if self.fold_case:
+            flags &= ~re.IGNORECASE
+            for pattern in self.patterns:
+                if any(char.isupper() for char in re.sub(r'\\.', '', pattern)):
+                    raise ValueError(f"Case-insensitive pattern must be lower case: {pattern!r}")
+
+        # Each pattern is tagged with an empty named group at its end rather
+        # than wrapped in one, so branches still start with their literal text
+        bounded, branches = [], []
+        for index, pattern in enumerate(self.patterns):
+            if pattern.startswith(WORD_BOUNDARY) and not _has_top_level_alternation(pattern):
+                bounded.append(f'(?:{pattern[len(WORD_BOUNDARY):]})(?P<p{index}>)')
+            else:
+                branches.append(f'(?:{pattern})(?P<p{index}>)')
+        if bounded:
+            branches.insert(0, WORD_BOUNDARY + '(?:' + '|'.join(bounded) + ')')
+        self.regex = re.compile('|'.join(branches), flags)
+
+    def search(self, text):
+        if not text or not isinstance(text, str):
+            return None
+        match = self.regex.search(text.lower() if self.fold_case else text)
+        if match is None:
+            return None
+        return self.patterns[int(match.lastgroup[1:])]
+
+
+def request_text(request):
+    """
+    The request body decoded as UTF-8 (undecodable bytes dropped).
+    Decoded once and cached on the request, so every middleware that screens
+    the body shares the same string.
+    """
+    text = getattr(request, _TEXT_ATTR, None)
+    if text is None:
+        try:
+            text = request.body.decode('utf-8', errors='ignore') if request.body else ''
+        except Exception:
+            # Body already consumed as a stream or exceeds DATA_UPLOAD_MAX_MEMORY_SIZE
+            text = ''
+        setattr(request, _TEXT_ATTR, text)
+    return text
+
+
+def screens_body(request):
+    return request.method in BODY_METHODS
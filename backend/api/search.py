@@ -0,0 +1,47 @@
+"""
+PostgreSQL full-text search backend for posts
+"""
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connection
+from django.db.models import F
+from rest_framework import filters
+
+from .models.post import SEARCH_CONFIG
+
+# Only plain word characters reach to_tsquery(); everything else separates terms
+SEARCH_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+MAX_SEARCH_TOKENS = 8
+
+
+class PostFullTextSearchFilter(filters.SearchFilter):
+    """
+    `?search=` over the indexed Post.search_vector column.
+    Every term must match, any term may be a prefix ("djan" finds "django"),
+    and results are ordered by rank unless `?ordering=` is given.
+    Falls back to DRF's ILIKE search on databases other than PostgreSQL.
+    """
+
+    def build_query(self, request):
+        terms = " ".join(self.get_search_terms(request))
+        tokens = SEARCH_TOKEN_RE.findall(terms)[:MAX_SEARCH_TOKENS]
+        if not tokens:
+            return None
+        raw = " & ".join(f"{token}:*" for token in tokens)
+        return SearchQuery(raw, search_type='raw', config=SEARCH_CONFIG)
+
+    def filter_queryset(self, request, queryset, view):
+        if connection.vendor != 'postgresql':
+            return super().filter_queryset(request, queryset, view)
+
+        query = self.build_query(request)
+        if query is None:
+            return queryset
+
+        queryset = queryset.filter(search_vector=query).annotate(
+            search_rank=SearchRank(F('search_vector'), query)
+        )
+        if request.query_params.get(filters.OrderingFilter.ordering_param):
+            return queryset
+        return queryset.order_by('-search_rank', '-created_at')
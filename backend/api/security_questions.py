@@ -0,0 +1,47 @@
+"""
+In-process cache of the security questions every user answers at signup
+"""
+import threading
+import time
+
+from .models.security import SecurityQuestion
+
+# Signup (and import_users) use the first SIGNUP_QUESTION_COUNT questions by
+# id. They are seeded by create_default_security_questions and practically
+# never change; a periodic reload picks up edits made by other processes.
+SIGNUP_QUESTION_COUNT = 3
+REFRESH_INTERVAL = 60 * 5
+
+_lock = threading.Lock()
+_question_ids = None
+_loaded_at = 0.0
+
+
+def load_signup_questions():
+    """(Re)load the signup question ids in one query."""
+    global _question_ids, _loaded_at
+    ids = list(
+        SecurityQuestion.objects.order_by('id').values_list('id', flat=True)[:SIGNUP_QUESTION_COUNT]
+    )
+    with _lock:
+        # An incomplete set isn't cached, so seeding the questions takes effect at once
+        _question_ids = ids if len(ids) == SIGNUP_QUESTION_COUNT else None
+        _loaded_at = time.monotonic()
+    return ids
+
+
+def invalidate_question_cache():
+    global _question_ids
+    with _lock:
+        _question_ids = None
+
+
+def signup_question_ids():
+    """
+    Ids of the questions a new user answers, in order. Fewer than
+    SIGNUP_QUESTION_COUNT means the questions haven't been seeded.
+    """
+    ids = _question_ids
+    if ids is None or time.monotonic() - _loaded_at > REFRESH_INTERVAL:
+        ids = load_signup_questions()
+    return ids
@@ -2,10 +2,13 @@ import re  # for regex validation
 from django.contrib.auth import authenticate
 from django.core.exceptions import ValidationError
 from django.core.validators import validate_email
+from django.db import transaction
 from rest_framework import serializers
 
+from ..models.profile import Profile
 from ..models.user import CustomUser
-from ..models.security import SecurityQuestion, UserSecurityAnswer
+from ..models.security import UserSecurityAnswer
+from ..security_questions import SIGNUP_QUESTION_COUNT, signup_question_ids
 
 class SignupSerializer(serializers.ModelSerializer):
 
@@ -57,19 +60,31 @@ class SignupSerializer(serializers.ModelSerializer):
         return value
 
     def create(self, validated_data):
-
         answers = validated_data.pop('security_answers', [])
+        password = validated_data.pop('password')
 
-
-        user = CustomUser.objects.create_user(**validated_data)
-
-
-        questions = list(SecurityQuestion.objects.all().order_by('id')[:3])
-        if len(questions) < 3:
+        question_ids = signup_question_ids()
+        if len(question_ids) < SIGNUP_QUESTION_COUNT:
             raise serializers.ValidationError("System security questions are not initialized properly.")
 
-
-        for q, ans in zip(questions, answers):
-            UserSecurityAnswer.objects.create(user=user, question=q, answer=ans.strip())
+        # Same normalisation as create_user(); the slow password and answer
+        # hashing happens before the transaction opens
+        user = CustomUser(**validated_data)
+        user.username = CustomUser.normalize_username(user.username)
+        user.email = CustomUser.objects.normalize_email(user.email)
+        user.set_password(password)
+        user._creates_own_profile = True
+        security_answers = []
+        for qid, ans in zip(question_ids, answers):
+            answer = UserSecurityAnswer(question_id=qid)
+            answer.set_answer(ans)
+            security_answers.append(answer)
+
+        with transaction.atomic():
+            user.save()
+            Profile.objects.create(user=user)
+            for answer in security_answers:
+                answer.user = user
+            UserSecurityAnswer.objects.bulk_create(security_answers)
 
         return user
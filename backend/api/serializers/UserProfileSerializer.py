@@ -23,12 +23,13 @@ class UserProfileSerializer(serializers.ModelSerializer):
         profile_data = validated_data.pop('profile', {})
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        instance.save()
+        if validated_data:
+            instance.save(update_fields=list(validated_data))
 
         # Update Profile table fields
         profile = instance.profile
         for attr, value in profile_data.items():
             setattr(profile, attr, value)
-        profile.save()
+        profile.save()  # writes only the fields that changed
 
         return instance
\ No newline at end of file
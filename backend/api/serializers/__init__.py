@@ -1,7 +1,7 @@
 # This file makes the serializers directory a proper Python package
 
 # Import and expose classes from submodules
-from .post import PostSerializer
+from .post import PostSerializer, PostListSerializer
 from .tag import TagSerializer
 from .comment import CommentSerializer
 from .like import LikeSerializer
@@ -12,4 +12,4 @@ from .gemini_prompt import BlogExpansionRequestSerializer
 # from .user import UserSerializer
 # from .comment import CommentSerializer
 
-__all__ = ['PostSerializer', 'TagSerializer', 'CommentSerializer', 'LikeSerializer', 'UserProfileSerializer','SignupSerializer', 'BlogExpansionRequestSerializer']  # List all classes that should be importable directly
\ No newline at end of file
+__all__ = ['PostSerializer', 'PostListSerializer', 'TagSerializer', 'CommentSerializer', 'LikeSerializer', 'UserProfileSerializer','SignupSerializer', 'BlogExpansionRequestSerializer']  # List all classes that should be importable directly
\ No newline at end of file
@@ -2,8 +2,8 @@
 
 from rest_framework import serializers
 from ..models.comment import Comment
+from ..content_safety import COMMENT_SQL_PATTERNS, COMMENT_XSS_PATTERNS
 import html
-import re
 
 class CommentSerializer(serializers.ModelSerializer):
     author_username = serializers.CharField(source='author.username', read_only=True)
@@ -32,32 +32,12 @@ class CommentSerializer(serializers.ModelSerializer):
             return value
 
         # SQL Injection detection
-        sql_patterns = [
-            r'\b(union|select|insert|update|delete|drop|create|alter)\b',
-            r'(\||\||&&)',
-            r'(\'.*or.*\'.*=.*\')',
-            r'(;|\-\-)',
-            r'(\bconcat\b|\bchar\b)',
-        ]
-        
-        for pattern in sql_patterns:
-            if re.search(pattern, value, re.IGNORECASE):
-                raise serializers.ValidationError("Content contains unsafe SQL characters")
+        if COMMENT_SQL_PATTERNS.search(value):
+            raise serializers.ValidationError("Content contains unsafe SQL characters")
 
         # XSS detection
-        xss_patterns = [
-            r'<script[^>]*>.*?</script>',
-            r'javascript:',
-            r'on\w+\s*=',
-            r'<iframe[^>]*>',
-            r'<object[^>]*>',
-            r'<embed[^>]*>',
-            r'eval\s*\(',
-        ]
-        
-        for pattern in xss_patterns:
-            if re.search(pattern, value, re.IGNORECASE):
-                raise serializers.ValidationError("Content contains unsafe content")
+        if COMMENT_XSS_PATTERNS.search(value):
+            raise serializers.ValidationError("Content contains unsafe content")
 
         # HTML escape
         return html.escape(value)
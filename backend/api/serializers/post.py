@@ -1,9 +1,14 @@
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
 from rest_framework import serializers
 from ..models.post import Post
 from ..models.tag import Tag
 from ..serializers.comment import CommentSerializer
+from ..content_safety import POST_CONTENT_XSS_PATTERNS, TITLE_SQL_PATTERNS, TITLE_XSS_PATTERNS
 import html
-import re
+
+# Number of characters shown in the list-mode excerpt
+EXCERPT_LENGTH = 200
 
 
 class PostSerializer(serializers.ModelSerializer):
@@ -17,23 +22,23 @@ class PostSerializer(serializers.ModelSerializer):
     author_avatar = serializers.SerializerMethodField()
     comments = CommentSerializer(many=True, read_only=True)
 
-    likes_count = serializers.SerializerMethodField()
+    likes_count = serializers.IntegerField(source='like_count', read_only=True)
     liked_by_user = serializers.SerializerMethodField()
-    like_id = serializers.SerializerMethodField() 
 
     class Meta:
         model = Post
         fields = [
             'id', 'author', 'author_username', 'title', 'slug', 'content',
             'cover', 'is_published', 'tags', 'created_at', 'updated_at', 'comments',
-            'likes_count', 'liked_by_user', 'author_avatar','like_id'
+            'likes_count', 'liked_by_user', 'author_avatar'
         ]
         read_only_fields = ['id', 'slug', 'created_at', 'updated_at', 'author', 'author_username', 'comments', 'author_avatar']
 
 
-    def get_likes_count(self, obj):
-        return obj.likes.count()
     def get_liked_by_user(self, obj):
+        # Annotated by PostQuerySet.with_engagement on read paths
+        if hasattr(obj, 'viewer_liked'):
+            return obj.viewer_liked
         user = self.context['request'].user
         return obj.likes.filter(user=user).exists() if user.is_authenticated else False
     def get_author_avatar(self, obj):
@@ -60,40 +65,18 @@ class PostSerializer(serializers.ModelSerializer):
             instance.tags.set(tags)
         return instance
 
-    def get_like_id(self, obj):
-        user = self.context['request'].user
-        if user.is_authenticated:
-            like = obj.likes.filter(user=user).first()
-            return like.id if like else None
-        return None
-
     def validate_title(self, value):
         """check title to prevent XSS attacks"""
         if not value:
             return value
 
         # SQL Injection detection
-        sql_patterns = [
-            r'\b(union|select|insert|update|delete|drop|create|alter)\b',
-            r'(\||\||&&)',
-            r'(\'.*or.*\'.*=.*\')',
-            r'(;|\-\-)',
-        ]
-        
-        for pattern in sql_patterns:
-            if re.search(pattern, value, re.IGNORECASE):
-                raise serializers.ValidationError("Title contains unsafe SQL characters")
+        if TITLE_SQL_PATTERNS.search(value):
+            raise serializers.ValidationError("Title contains unsafe SQL characters")
 
         # XSS detection - only check the most dangerous patterns
-        dangerous_patterns = [
-            r'<script[^>]*>.*?</script>',
-            r'javascript:',
-            r'on\w+\s*=',
-        ]
-        
-        for pattern in dangerous_patterns:
-            if re.search(pattern, value, re.IGNORECASE):
-                raise serializers.ValidationError("Title contains unsafe content")
+        if TITLE_XSS_PATTERNS.search(value):
+            raise serializers.ValidationError("Title contains unsafe content")
 
         # HTML escape
         return html.escape(value)
@@ -104,16 +87,42 @@ class PostSerializer(serializers.ModelSerializer):
             return value
 
         # only check for the most dangerous script patterns
-        dangerous_patterns = [
-            r'<script[^>]*>.*?</script>',
-            r'javascript:',
-            r'on\w+\s*=\s*["\'][^"\']*["\']',  # event handler
-            r'eval\s*\(',
-        ]
-        
-        for pattern in dangerous_patterns:
-            if re.search(pattern, value, re.IGNORECASE):
-                raise serializers.ValidationError("Content contains unsafe content")
+        if POST_CONTENT_XSS_PATTERNS.search(value):
+            raise serializers.ValidationError("Content contains unsafe content")
 
         # Blog content requires HTML tags, so no escaping is performed
-        return value
\ No newline at end of file
+        return value
+
+
+class PostListSerializer(PostSerializer):
+    """
+    Read-only list representation of a post used by feed pages.
+    Drops the embedded comments tree and the full HTML body in favour of
+    a plain-text excerpt and a comment count.
+    """
+    comments = None
+    content = None
+    excerpt = serializers.SerializerMethodField()
+    comments_count = serializers.IntegerField(source='comment_count', read_only=True)
+
+    class Meta(PostSerializer.Meta):
+        fields = [
+            'id', 'author', 'author_username', 'author_avatar', 'title', 'slug', 'excerpt',
+            'cover', 'is_published', 'tags', 'created_at', 'updated_at',
+            'comments_count', 'likes_count', 'liked_by_user'
+        ]
+
+    def get_excerpt(self, obj):
+        # List querysets load only the head of the body (see PostQuerySet.for_list)
+        source = getattr(obj, 'content_head', None)
+        if source is None:
+            source = obj.content
+        else:
+            # The head can end inside a tag (an inline base64 image, say), which
+            # strip_tags would keep as text; drop the unterminated tag
+            tag_start = source.rfind('<')
+            if tag_start > source.rfind('>'):
+                source = source[:tag_start]
+        # Pad tags with a space so adjacent block elements don't run together
+        text = " ".join(html.unescape(strip_tags((source or "").replace("<", " <"))).split())
+        return Truncator(text).chars(EXCERPT_LENGTH)
@@ -35,12 +35,14 @@ class VerifySecurityAnswersSerializer(serializers.Serializer):
         if len(stored_answers) != len(answers):
             raise serializers.ValidationError({"answers": "Invalid number of answers provided."})
 
+        correct = True
         for given, stored in zip(answers, stored_answers):
-            if given.strip().lower() != stored.answer.strip().lower():
-                raise serializers.ValidationError({"answers": "Security answers do not match."})
+            correct &= stored.check_answer(given)
+        if not correct:
+            raise serializers.ValidationError({"answers": "Security answers do not match."})
 
 
         user.set_password(new_password)
-        user.save()
+        user.save(update_fields=["password"])
 
         return data
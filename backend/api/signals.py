@@ -1,7 +1,15 @@
-from django.db.models.signals import post_save, post_migrate
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, post_migrate
 from django.dispatch import receiver
 from django.db.utils import ProgrammingError, OperationalError
 
+from .highlights import invalidate_highlighted_posts
+from .security_questions import invalidate_question_cache
+from .tag_cache import invalidate_tag_cache, prime_tag_cache
+
+from .models.comment import Comment
+from .models.like import Like
+from .models.post import Post, actual_comment_count, actual_like_count
 from .models.user import CustomUser
 from .models.profile import Profile
 from .models.tag import Tag
@@ -15,15 +23,110 @@ def create_or_update_user_profile(sender, instance, created, **kwargs):
     """Automatically create or update profile when user is saved."""
     try:
         if created:
-
+            # Signup and import_users create the profile in the same transaction
+            if getattr(instance, '_creates_own_profile', False):
+                return
             Profile.objects.get_or_create(user=instance)
-        else:
-            if hasattr(instance, 'profile'):
-                instance.profile.save()
+        elif CustomUser.profile.is_cached(instance):
+            # Only a profile already loaded through this user can hold unsaved
+            # edits; Profile.save() writes nothing when no field changed
+            instance.profile.save()
     except (ProgrammingError, OperationalError):
 
         pass
 
+def _origin_model(origin):
+    return getattr(origin, 'model', None) or type(origin)
+
+
+def _deleted_with_user(origin, post_id):
+    """
+    True when the delete cascades from a user (one account or a queryset of
+    them). The post is remembered on `origin` and recounted once when the
+    user row itself goes, instead of one UPDATE per cascaded row.
+    """
+    if _origin_model(origin) is not CustomUser:
+        return False
+    if not hasattr(origin, '_stale_post_ids'):
+        origin._stale_post_ids = set()
+    origin._stale_post_ids.add(post_id)
+    return True
+
+
+def _on_commit_once(func):
+    """on_commit(func), unless the current transaction already has it queued."""
+    connection = transaction.get_connection()
+    if connection.in_atomic_block and any(queued is func for _, queued, *_ in connection.run_on_commit):
+        return
+    transaction.on_commit(func)
+
+
+# ? Keep Post.like_count / Post.comment_count in step with Like and Comment rows
+# (a delete cascading from the post itself leaves nothing to count)
+@receiver(post_save, sender=Like)
+def increment_like_count(sender, instance, created, **kwargs):
+    if created:
+        Post.objects.filter(pk=instance.post_id).adjust_counters(likes=1)
+
+
+@receiver(post_delete, sender=Like)
+def decrement_like_count(sender, instance, origin=None, **kwargs):
+    if _origin_model(origin) is Post or _deleted_with_user(origin, instance.post_id):
+        return
+    Post.objects.filter(pk=instance.post_id, like_count__gt=0).adjust_counters(likes=-1)
+
+
+@receiver(post_save, sender=Comment)
+def increment_comment_count(sender, instance, created, **kwargs):
+    if created:
+        Post.objects.filter(pk=instance.post_id).adjust_counters(comments=1)
+
+
+@receiver(post_delete, sender=Comment)
+def decrement_comment_count(sender, instance, origin=None, **kwargs):
+    if _origin_model(origin) is Post or _deleted_with_user(origin, instance.post_id):
+        return
+    Post.objects.filter(pk=instance.post_id, comment_count__gt=0).adjust_counters(comments=-1)
+
+
+@receiver(post_delete, sender=CustomUser)
+def recount_posts_after_user_delete(sender, instance, origin=None, **kwargs):
+    # Users are deleted after the likes and comments that cascade from them
+    post_ids = getattr(origin, '_stale_post_ids', None)
+    if post_ids:
+        del origin._stale_post_ids
+        Post.objects.filter(pk__in=post_ids).update(
+            like_count=actual_like_count(), comment_count=actual_comment_count()
+        )
+
+
+# ? Drop the cached home-page highlights whenever posts, likes or comments change
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Like)
+@receiver(post_delete, sender=Like)
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def invalidate_highlights_cache(sender, **kwargs):
+    # After commit, so the rebuild can't cache the pre-change rows; once per
+    # transaction however many rows a cascade removes
+    _on_commit_once(invalidate_highlighted_posts)
+
+
+# ? Keep the in-process tag name -> id cache in sync
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def reset_tag_cache(sender, **kwargs):
+    invalidate_tag_cache()
+
+
+# ? Keep the in-process signup question cache in sync
+@receiver(post_save, sender=SecurityQuestion)
+@receiver(post_delete, sender=SecurityQuestion)
+def reset_question_cache(sender, **kwargs):
+    invalidate_question_cache()
+
+
 # ? Create default tags after migrations
 @receiver(post_migrate)
 def create_default_tags(sender, **kwargs):
@@ -51,6 +154,7 @@ def create_default_tags(sender, **kwargs):
     try:
         for tag_name in default_tags:
             Tag.objects.get_or_create(name=tag_name)
+        prime_tag_cache()
     except (ProgrammingError, OperationalError):
 
         pass
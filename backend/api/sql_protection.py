@@ -6,6 +6,9 @@ import logging
 from django.http import JsonResponse
 from django.utils.deprecation import MiddlewareMixin
 
+from .content_safety import BLOCK_COMMENT, QUOTED_OR, UNION_SELECT_FROM
+from .screening import PatternSet, PrefixTrie, request_text, screens_body
+
 logger = logging.getLogger(__name__)
 
 class SimpleSQLInjectionProtectionMiddleware(MiddlewareMixin):
@@ -15,28 +18,29 @@ class SimpleSQLInjectionProtectionMiddleware(MiddlewareMixin):
     """
 
     # Dangerous SQL patterns to check for
+    # (lower case: matched case-insensitively in a single pass, see api/screening.py)
     DANGEROUS_SQL_PATTERNS = [
-        r'(\bunion\s+select\b)',           # UNION SELECT
-        r'(\bor\s+\d+\s*=\s*\d+)',        # OR 1=1
-        r'(\band\s+\d+\s*=\s*\d+)',       # AND 1=1
-        r'(\'.*or.*\'.*=.*\')',           # String OR injection
-        r'(\-\-)',                        # SQL comment
-        r'(\/\*.*\*\/)',                  # SQL multi-line comment
-        r'(\bdrop\s+table\b)',            # DROP TABLE
-        r'(\bdelete\s+from\b)',           # DELETE FROM
-        r'(\btruncate\b)',                # TRUNCATE
-        r'(\bexec\b|\bexecute\b)',        # EXEC/EXECUTE
-        r'(\bwaitfor\s+delay\b)',         # Time-based attack
-        r'(\bload_file\b|\boutfile\b)',   # File operations
+        r'\bunion\s+select\b',            # UNION SELECT
+        r'\bor\s+\d+\s*=\s*\d+',          # OR 1=1
+        r'\band\s+\d+\s*=\s*\d+',         # AND 1=1
+        QUOTED_OR,                        # String OR injection
+        r'\-\-',                          # SQL comment
+        BLOCK_COMMENT,                    # SQL multi-line comment
+        r'\bdrop\s+table\b',              # DROP TABLE
+        r'\bdelete\s+from\b',             # DELETE FROM
+        r'\btruncate\b',                  # TRUNCATE
+        r'\b(?:exec|execute)\b',          # EXEC/EXECUTE
+        r'\bwaitfor\s+delay\b',           # Time-based attack
+        r'\b(?:load_file|outfile)\b',     # File operations
     ]
     
    
     CRITICAL_SQL_PATTERNS = [
-        r'(\bunion\s+select\b.*from\b)',   #  UNION SELECT with FROM
-        r'(\bor\s+\d+\s*=\s*\d+\s*--)',   # OR 1=1 with comment
-        r'(\band\s+\d+\s*=\s*\d+\s*--)',  # AND 1=1 with comment
-        r'(\bdrop\s+table\s+\w+)',        # DROP TABLE with table name
-        r'(\bdelete\s+from\s+\w+)',       # DELETE FROM with table name
+        UNION_SELECT_FROM,                #  UNION SELECT with FROM
+        r'\bor\s+\d+\s*=\s*\d+\s*--',     # OR 1=1 with comment
+        r'\band\s+\d+\s*=\s*\d+\s*--',    # AND 1=1 with comment
+        r'\bdrop\s+table\s+\w+',          # DROP TABLE with table name
+        r'\bdelete\s+from\s+\w+',         # DELETE FROM with table name
     ]
 
     # Allowed content endpoints (no strict SQL checks)
@@ -60,33 +64,29 @@ class SimpleSQLInjectionProtectionMiddleware(MiddlewareMixin):
         '/api/forgot-password/',
     ]
     
+    CONTENT, STRICT, MODERATE = 'content', 'strict', 'moderate'
+
     def __init__(self, get_response):
         self.get_response = get_response
-        self.compiled_patterns = [
-            re.compile(pattern, re.IGNORECASE | re.MULTILINE) 
-            for pattern in self.DANGEROUS_SQL_PATTERNS
-        ]
-        # 为内容端点使用更严格的模式
-        self.critical_patterns = [
-            re.compile(pattern, re.IGNORECASE | re.MULTILINE)
-            for pattern in self.CRITICAL_SQL_PATTERNS
-        ]
-    
+        self.endpoints = PrefixTrie(
+            [(endpoint, self.CONTENT) for endpoint in self.CONTENT_ENDPOINTS]
+            + [(endpoint, self.STRICT) for endpoint in self.STRICT_CHECK_ENDPOINTS]
+            + [(endpoint, self.MODERATE) for endpoint in self.MODERATE_CHECK_ENDPOINTS]
+        )
+        self.sql_patterns = PatternSet(self.DANGEROUS_SQL_PATTERNS, re.IGNORECASE | re.MULTILINE)
+        # Critical patterns only, for endpoints that legitimately carry free text
+        self.critical_patterns = PatternSet(self.CRITICAL_SQL_PATTERNS, re.IGNORECASE | re.MULTILINE)
+
     def __call__(self, request):
         # Determine the type of endpoint
-        is_content_endpoint = any(request.path.startswith(endpoint) 
-                                for endpoint in self.CONTENT_ENDPOINTS)
-        is_strict_endpoint = any(request.path.startswith(endpoint) 
-                               for endpoint in self.STRICT_CHECK_ENDPOINTS)
-        is_moderate_endpoint = any(request.path.startswith(endpoint)
-                                 for endpoint in self.MODERATE_CHECK_ENDPOINTS)
+        endpoint_type = self.endpoints.match(request.path)
 
         # Content endpoints only check for the most dangerous patterns
-        if is_content_endpoint:
+        if endpoint_type == self.CONTENT:
             pass
 
         # Strictly check all parameters for strict endpoints
-        elif is_strict_endpoint:
+        elif endpoint_type == self.STRICT:
             if self._check_query_params(request):
                 logger.warning(f"SQL Injection attempt in URL params: {request.GET}")
                 return JsonResponse({
@@ -94,7 +94,7 @@ class SimpleSQLInjectionProtectionMiddleware(MiddlewareMixin):
                     'message': 'The request parameters contain illegal characters'
                 }, status=400)
             
-            if request.method in ['POST', 'PUT', 'PATCH']:
+            if screens_body(request):
                 if self._check_request_body(request):
                     logger.warning(f"SQL Injection attempt in request body")
                     return JsonResponse({
@@ -103,8 +103,8 @@ class SimpleSQLInjectionProtectionMiddleware(MiddlewareMixin):
                     }, status=400)
 
         # Moderate check endpoints - only check for critical SQL patterns
-        elif is_moderate_endpoint:
-            if request.method in ['POST', 'PUT', 'PATCH']:
+        elif endpoint_type == self.MODERATE:
+            if screens_body(request):
                 if self._check_dangerous_sql_only(request):
                     logger.warning(f"Critical SQL injection detected in moderate endpoint: {request.path}")
                     return JsonResponse({
@@ -133,25 +133,12 @@ class SimpleSQLInjectionProtectionMiddleware(MiddlewareMixin):
     
     def _check_request_body(self, request):
         """Check request body"""
-        if hasattr(request, 'body') and request.body:
-            try:
-                body_str = request.body.decode('utf-8', errors='ignore')
-                return self._contains_sql_injection(body_str)
-            except:
-                return False
-        return False
+        return self._contains_sql_injection(request_text(request))
     
     def _contains_sql_injection(self, text):
         """Check for SQL injection patterns"""
-        if not text or not isinstance(text, str):
-            return False
-
-        # Check for SQL injection patterns
-        for pattern in self.compiled_patterns:
-            if pattern.search(text):
-                return True
-        
-        return False
+        # All patterns in one pass
+        return self.sql_patterns.search(text) is not None
     
     def _is_safe_value(self, value):
         """Check if the value is safe (contains only alphanumeric and basic characters)"""
@@ -163,22 +150,9 @@ class SimpleSQLInjectionProtectionMiddleware(MiddlewareMixin):
     
     def _check_dangerous_sql_only(self, request):
         """Check only for the most dangerous SQL patterns in the request body"""
-        if hasattr(request, 'body') and request.body:
-            try:
-                body_str = request.body.decode('utf-8', errors='ignore')
-                return self._contains_dangerous_sql(body_str)
-            except:
-                return False
-        return False
+        return self._contains_dangerous_sql(request_text(request))
     
     def _contains_dangerous_sql(self, text):
         """Check for dangerous SQL injection patterns - content endpoints only"""
-        if not text or not isinstance(text, str):
-            return False
-
         # For content endpoints, only check the most critical SQL injection patterns
-        for pattern in self.critical_patterns:
-            if pattern.search(text):
-                return True
-        
-        return False
+        return self.critical_patterns.search(text) is not None
@@ -0,0 +1,61 @@
+"""
+In-process cache of the tag table (name -> id)
+"""
+import threading
+import time
+
+from .models.tag import Tag
+
+# The tag table is small and mostly static (seeded by create_default_tags);
+# a periodic reload picks up tags created by other processes.
+REFRESH_INTERVAL = 60 * 5
+# Unknown names trigger an early reload at most this often, so requests for
+# tags that don't exist can't turn every lookup into a table scan.
+MISS_RELOAD_INTERVAL = 5
+
+_lock = threading.Lock()
+_ids_by_name = None
+_loaded_at = 0.0
+
+
+def prime_tag_cache():
+    """(Re)load every tag name in one query."""
+    global _ids_by_name, _loaded_at
+    mapping = {name: pk for pk, name in Tag.objects.values_list('pk', 'name')}
+    with _lock:
+        _ids_by_name = mapping
+        _loaded_at = time.monotonic()
+    return mapping
+
+
+def invalidate_tag_cache():
+    global _ids_by_name
+    with _lock:
+        _ids_by_name = None
+
+
+def _mapping():
+    mapping = _ids_by_name
+    if mapping is None or time.monotonic() - _loaded_at > REFRESH_INTERVAL:
+        mapping = prime_tag_cache()
+    return mapping
+
+
+def resolve_tag_ids(names):
+    """
+    Map tag names to ids, preserving order and dropping names that don't
+    exist. Names are matched exactly, as Tag.name is case-sensitively unique. Unknown names cause an early reload in case they
+    were created by another process since the last one.
+    """
+    wanted = [n.strip() for n in names if n and n.strip()]
+    mapping = _mapping()
+    if (any(name not in mapping for name in wanted)
+            and time.monotonic() - _loaded_at > MISS_RELOAD_INTERVAL):
+        mapping = prime_tag_cache()
+
+    ids = []
+    for name in wanted:
+        pk = mapping.get(name)
+        if pk is not None and pk not in ids:
+            ids.append(pk)
+    return ids
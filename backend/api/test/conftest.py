@@ -11,4 +11,40 @@ def django_db_setup():
 @pytest.fixture(autouse=True)
 def _ensure_atomic_requests(settings):
     for alias, cfg in settings.DATABASES.items():
-        cfg.setdefault("ATOMIC_REQUESTS", False)
\ No newline at end of file
+        cfg.setdefault("ATOMIC_REQUESTS", False)
+
+@pytest.fixture(autouse=True)
+def _reset_tag_cache():
+    # Tag ids cached by one test may belong to rows another test rolled back
+    from api.tag_cache import invalidate_tag_cache
+    invalidate_tag_cache()
+
+
+@pytest.fixture(autouse=True)
+def _reset_question_cache():
+    from api.security_questions import invalidate_question_cache
+    invalidate_question_cache()
+
+@pytest.fixture(autouse=True)
+def _sync_bulk_delete(settings):
+    # Run bulk deletions inline so tests see their result in the response
+    settings.ADMIN_BULK_DELETE_ASYNC = False
+
+@pytest.fixture(scope='session', autouse=True)
+def _local_backends():
+    # No Redis here: keep the tiered cache with process memory as the shared
+    # tier, and use the in-memory Redis stand-in
+    from django.conf import settings
+    from django.test import override_settings
+    caches = {**settings.CACHES, 'shared': settings.SHARED_CACHE_BACKENDS['locmem']}
+    with override_settings(CACHES=caches, REDIS_CLIENT_BACKEND='local'):
+        yield
+
+@pytest.fixture(autouse=True)
+def _clear_cache(_local_backends):
+    from api.authentication import reset_revocations
+    from api.redis_client import reset_redis
+    from django.core.cache import cache
+    cache.clear()
+    reset_redis()
+    reset_revocations()
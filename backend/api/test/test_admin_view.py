@@ -39,7 +39,7 @@ def _call_view(method: str, factory, user, data=None, url="/", **url_kwargs):
 
     view = AdminUserManagementView.as_view()
     if method == "get":
-        request = factory.get(url)
+        request = factory.get(url, data=data)
     elif method == "put":
         request = factory.put(url, data=json.dumps(data or {}), content_type="application/json")
     elif method == "delete":
@@ -64,8 +64,79 @@ def test_get_returns_user_list(factory, admin_user, normal_user):
     User.objects.create_user(username="u2", email="u2@ex.com", password="x", is_admin_user=False)
     resp = _call_view("get", factory, admin_user)
     assert resp.status_code == status.HTTP_200_OK
-    assert isinstance(resp.data, list)
-    assert len(resp.data) >= 2
+    assert resp.data["count"] >= 3
+    assert len(resp.data["results"]) >= 3
+    assert {"username", "email", "profile"} <= set(resp.data["results"][0])
+
+
+def test_get_paginates_searches_and_orders(factory, admin_user):
+    for n in range(5):
+        User.objects.create_user(username=f"page_user{n}", email=f"pu{n}@ex.com", password="x")
+
+    resp = _call_view("get", factory, admin_user, data={"search": "page_user", "page_size": 2})
+    assert resp.data["count"] == 5
+    assert [u["username"] for u in resp.data["results"]] == ["page_user0", "page_user1"]
+    assert resp.data["next"]
+
+    resp = _call_view("get", factory, admin_user, data={"search": "PU4@EX", "ordering": "-username"})
+    assert [u["username"] for u in resp.data["results"]] == ["page_user4"]
+
+    resp = _call_view("get", factory, admin_user, data={"search": "page_user", "ordering": "-username"})
+    assert resp.data["results"][0]["username"] == "page_user4"
+
+
+def test_get_loads_profiles_in_the_same_query(factory, admin_user):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    for n in range(4):
+        User.objects.create_user(username=f"nplus{n}", email=f"np{n}@ex.com", password="x")
+    with CaptureQueriesContext(connection) as captured:
+        resp = _call_view("get", factory, admin_user)
+    assert resp.status_code == status.HTTP_200_OK
+    assert all(u["profile"] is not None for u in resp.data["results"])
+    # COUNT(*) and the page itself, whatever the page size
+    assert len([q for q in captured.captured_queries if q["sql"].startswith("SELECT")]) == 2
+
+
+def test_export_streams_ndjson(factory, admin_user, normal_user):
+    resp = _call_view("get", factory, admin_user, data={"export": "ndjson", "search": "tester"})
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.streaming
+    assert resp["Content-Type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in b"".join(resp.streaming_content).decode().splitlines()]
+    assert [r["username"] for r in rows] == ["admin_tester", "normal_tester"]
+    assert rows[0]["is_admin_user"] is True
+    assert "bio" in rows[0] and "password" not in rows[0]
+
+
+def test_export_streams_csv(factory, admin_user, normal_user):
+    import csv
+
+    resp = _call_view("get", factory, admin_user, data={"export": "csv", "ordering": "-id", "search": "tester"})
+    assert resp["Content-Disposition"] == 'attachment; filename="users.csv"'
+    rows = list(csv.DictReader(b"".join(resp.streaming_content).decode().splitlines()))
+    assert [r["email"] for r in rows] == ["n@n.com", "a@a.com"]
+
+
+def test_export_csv_neutralises_formulas(factory, admin_user):
+    import csv
+
+    User.objects.create_user(
+        username="formula_tester", email="f@f.com", password="x",
+        first_name='=HYPERLINK("http://evil.example","x")', last_name="-2+3", address="@SUM(A1)",
+    )
+    resp = _call_view("get", factory, admin_user, data={"export": "csv", "search": "formula"})
+    (row,) = csv.DictReader(b"".join(resp.streaming_content).decode().splitlines())
+    assert row["first_name"] == '\'=HYPERLINK("http://evil.example","x")'
+    assert row["last_name"] == "'-2+3"
+    assert row["address"] == "'@SUM(A1)"
+    assert row["username"] == "formula_tester"
+
+
+def test_export_rejects_unknown_format(factory, admin_user):
+    resp = _call_view("get", factory, admin_user, data={"export": "xml"})
+    assert resp.status_code == status.HTTP_400_BAD_REQUEST
 
 
 
@@ -113,3 +184,16 @@ def test_delete_other_user_success(factory, admin_user, normal_user):
 def test_delete_user_not_found(factory, admin_user):
     resp = _call_view("delete", factory, admin_user, user_id=987654321)
     assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_put_writes_only_the_admin_flag(factory, admin_user):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    target = User.objects.create_user(username="to_update3", email="t3@ex.com", password="x")
+    with CaptureQueriesContext(connection) as captured:
+        resp = _call_view("put", factory, admin_user, data={"user_id": target.id, "is_admin_user": True})
+    assert resp.status_code == status.HTTP_200_OK
+    updates = [q["sql"] for q in captured.captured_queries if q["sql"].startswith("UPDATE")]
+    assert len(updates) == 1
+    assert '"is_admin_user"' in updates[0] and '"password"' not in updates[0]
@@ -0,0 +1,100 @@
+# backend/api/test/test_authentication.py
+import pytest
+from api import authentication
+from api.authentication import (RevocationAwareJWTAuthentication, is_revoked,
+                                refresh_revocations, reset_revocations, revoke_token)
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+pytestmark = pytest.mark.django_db
+User = get_user_model()
+
+
+@pytest.fixture()
+def user():
+    return User.objects.create_user(username="jwt_user", email="jwt@ex.com", password="x")
+
+
+@pytest.fixture()
+def tokens(user):
+    refresh = RefreshToken.for_user(user)
+    return refresh, refresh.access_token
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(authentication.time, "monotonic", lambda: now[0])
+    return now
+
+
+def get_profile(access):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+    return client.get("/api/profile/")
+
+
+def test_default_authentication_class():
+    from rest_framework.settings import api_settings
+    assert RevocationAwareJWTAuthentication in api_settings.DEFAULT_AUTHENTICATION_CLASSES
+
+
+def test_login_does_not_write_to_cache(user):
+    response = APIClient().post("/api/login/", {"username": "jwt_user", "password": "x"}, format="json")
+    assert response.status_code == 200
+    assert cache.get(f"user:{user.id}:access_hash") is None
+
+
+def test_logged_out_access_token_is_rejected(tokens):
+    refresh, access = tokens
+    assert get_profile(access).status_code == 200
+
+    response = APIClient().post("/api/logout/", {"refresh": str(refresh), "access": str(access)}, format="json")
+    assert response.status_code == 205
+
+    response = get_profile(access)
+    assert response.status_code == 401
+    assert response.data["code"] == "token_revoked"
+
+
+def test_other_process_revocations_are_picked_up_after_refresh_interval(tokens, clock):
+    _, access = tokens
+    assert get_profile(access).status_code == 200
+
+    # Revoked by another process: the log has the entry, this process's set doesn't
+    revoke_token(access["jti"], access["exp"])
+    authentication._revoked.clear()
+    assert get_profile(access).status_code == 200
+
+    clock[0] += authentication.REFRESH_INTERVAL + 1
+    assert get_profile(access).status_code == 401
+
+
+def test_cold_process_loads_recent_revocations(tokens):
+    _, access = tokens
+    revoke_token(access["jti"], access["exp"])
+    reset_revocations()
+    assert is_revoked(access["jti"])
+
+
+def test_requests_within_interval_do_not_touch_the_cache(tokens, monkeypatch):
+    _, access = tokens
+    refresh_revocations(force=True)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cache was read")
+
+    monkeypatch.setattr(authentication.cache, "get", fail)
+    monkeypatch.setattr(authentication.cache, "get_many", fail)
+    assert get_profile(access).status_code == 200
+    assert get_profile(access).status_code == 200
+
+
+def test_expired_revocations_are_pruned():
+    revoke_token("old", 10)
+    revoke_token("live", authentication.time.time() + 60)
+    refresh_revocations(force=True)
+    assert not is_revoked("old")
+    assert is_revoked("live")
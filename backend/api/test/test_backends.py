@@ -0,0 +1,75 @@
+# backend/api/test/test_backends.py
+import pytest
+from allauth.account.auth_backends import AuthenticationBackend
+from api.backends import UsernameOrEmailBackend
+from django.contrib.auth import authenticate, get_user_model
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+pytestmark = pytest.mark.django_db
+User = get_user_model()
+
+
+@pytest.fixture()
+def alice():
+    return User.objects.create_user(username="alice", email="Alice@Example.com", password="pw-alice")
+
+
+@pytest.fixture()
+def hash_calls(monkeypatch):
+    calls = []
+    original = PBKDF2PasswordHasher.encode
+
+    def counting_encode(self, password, salt, iterations=None):
+        calls.append(password)
+        return original(self, password, salt, iterations)
+
+    monkeypatch.setattr(PBKDF2PasswordHasher, "encode", counting_encode)
+    return calls
+
+
+@pytest.mark.parametrize("login", ["alice", "alice@example.com", "ALICE@EXAMPLE.COM"])
+def test_username_or_email_in_one_query_and_one_hash(alice, hash_calls, login):
+    with CaptureQueriesContext(connection) as queries:
+        user = authenticate(username=login, password="pw-alice")
+    assert user == alice
+    assert len(queries) == 1
+    assert len(hash_calls) == 1
+
+
+@pytest.mark.parametrize("login, password", [("alice@example.com", "wrong"), ("nobody@example.com", "pw-alice")])
+def test_failures_hash_exactly_once(alice, hash_calls, login, password):
+    with CaptureQueriesContext(connection) as queries:
+        assert UsernameOrEmailBackend().authenticate(None, username=login, password=password) is None
+    assert len(queries) == 1
+    assert len(hash_calls) == 1
+
+
+def test_failure_leaves_the_next_backend_its_turn(alice, monkeypatch):
+    tried = []
+    monkeypatch.setattr(AuthenticationBackend, "authenticate", lambda self, request, **credentials: tried.append(credentials))
+    assert authenticate(username="alice", password="wrong") is None
+    assert tried == [{"username": "alice", "password": "wrong"}]
+
+
+def test_username_match_wins_over_email_match(alice):
+    squatter = User.objects.create_user(username="alice@example.com", email="s@example.com", password="pw-squatter")
+    assert authenticate(username="alice@example.com", password="pw-squatter") == squatter
+    assert authenticate(username="alice@example.com", password="pw-alice") is None
+
+
+def test_inactive_user_is_rejected(alice):
+    alice.is_active = False
+    alice.save()
+    assert authenticate(username="alice", password="pw-alice") is None
+
+
+def test_other_credentials_are_left_to_other_backends(alice, hash_calls):
+    assert UsernameOrEmailBackend().authenticate(None, email="alice@example.com", password="pw-alice") is None
+    assert hash_calls == []
+
+
+def test_email_lookup_uses_upper_index():
+    index_names = [index.name for index in User._meta.indexes]
+    assert "api_user_email_upper_idx" in index_names
@@ -0,0 +1,125 @@
+# backend/api/test/test_bulk_users.py
+import pytest
+from api import bulk_users
+from api.bulk_users import HEARTBEAT_TIMEOUT, get_job
+from api.models.comment import Comment
+from api.models.like import Like
+from api.models.post import Post
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+pytestmark = pytest.mark.django_db
+User = get_user_model()
+
+
+@pytest.fixture()
+def admin():
+    return User.objects.create_user(username="bulk_admin", email="ba@ex.com", password="x", is_admin_user=True)
+
+
+@pytest.fixture()
+def client(admin):
+    client = APIClient()
+    client.force_authenticate(admin)
+    return client
+
+
+def make_users(count, prefix="bulk"):
+    return [
+        User.objects.create_user(username=f"{prefix}{n}", email=f"{prefix}{n}@ex.com", password="x")
+        for n in range(count)
+    ]
+
+
+def test_set_admin_uses_one_update(client):
+    users = make_users(3)
+    ids = [u.id for u in users]
+    with CaptureQueriesContext(connection) as captured:
+        response = client.post(
+            "/api/admin-panel/bulk/",
+            {"action": "set_admin", "user_ids": ids + [99999999], "is_admin_user": True},
+            format="json",
+        )
+    assert response.status_code == 200
+    assert response.data == {"requested": 4, "updated": 3}
+    assert User.objects.filter(id__in=ids, is_admin_user=True).count() == 3
+    assert len([q for q in captured.captured_queries if q["sql"].startswith("UPDATE")]) == 1
+
+
+@pytest.mark.parametrize("payload", [
+    {"action": "set_admin", "user_ids": [1]},
+    {"action": "delete", "user_ids": []},
+    {"action": "ban", "user_ids": [1]},
+])
+def test_invalid_payload_returns_400(client, payload):
+    assert client.post("/api/admin-panel/bulk/", payload, format="json").status_code == 400
+
+
+def test_delete_in_batches_with_cascades_and_progress(client, admin, settings):
+    settings.ADMIN_BULK_DELETE_BATCH_SIZE = 2
+    spammers = make_users(5, prefix="spam")
+    keeper = User.objects.create_user(username="keeper", email="k@ex.com", password="x")
+    post = Post.objects.create(author=spammers[0], title="spam", content="buy now", slug="spam")
+    kept_post = Post.objects.create(author=keeper, title="real", content="hello", slug="real")
+    Comment.objects.create(post=kept_post, author=spammers[1], content="spam")
+    Like.objects.create(user=spammers[2], post=kept_post)
+    Like.objects.create(user=keeper, post=post)
+
+    ids = [u.id for u in spammers] + [admin.id, 99999999]
+    response = client.post("/api/admin-panel/bulk/", {"action": "delete", "user_ids": ids}, format="json")
+    assert response.status_code == 202
+    assert response.data["skipped"] == [admin.id]
+    job = response.data["job"]
+    assert job["status"] == "done"
+    assert (job["total"], job["processed"], job["deleted"]) == (6, 6, 5)
+
+    assert not User.objects.filter(id__in=[u.id for u in spammers]).exists()
+    assert User.objects.filter(id__in=[admin.id, keeper.id]).count() == 2
+    assert not Post.objects.filter(pk=post.pk).exists()
+    assert not Comment.objects.exists() and not Like.objects.exists()
+
+    progress = client.get(f"/api/admin-panel/bulk/{job['id']}/")
+    assert progress.status_code == 200
+    assert progress.data["deleted"] == 5
+    assert client.get("/api/admin-panel/bulk/unknown/").status_code == 404
+
+
+def test_async_delete_starts_after_commit(client, settings, django_capture_on_commit_callbacks):
+    settings.ADMIN_BULK_DELETE_ASYNC = True
+    users = make_users(2)
+    with django_capture_on_commit_callbacks() as callbacks:
+        response = client.post(
+            "/api/admin-panel/bulk/", {"action": "delete", "user_ids": [u.id for u in users]}, format="json",
+        )
+    assert response.status_code == 202
+    assert response.data["job"]["status"] == "pending"
+    assert get_job(response.data["job"]["id"])["total"] == 2
+    # The thread is only started once the request's transaction commits
+    assert len(callbacks) == 1
+    assert User.objects.filter(id__in=[u.id for u in users]).count() == 2
+
+
+def test_job_without_heartbeat_is_reported_failed(client, settings, monkeypatch):
+    settings.ADMIN_BULK_DELETE_ASYNC = True
+    users = make_users(2, prefix="orphan")
+    # The worker never runs, as if it was killed with the job pending
+    response = client.post(
+        "/api/admin-panel/bulk/", {"action": "delete", "user_ids": [u.id for u in users]}, format="json",
+    )
+    job_id = response.data["job"]["id"]
+    assert get_job(job_id)["status"] == "pending"
+
+    saved_at = get_job(job_id)["updated_at"]
+    monkeypatch.setattr(bulk_users.time, "time", lambda: saved_at + HEARTBEAT_TIMEOUT + 1)
+    progress = client.get(f"/api/admin-panel/bulk/{job_id}/")
+    assert progress.data["status"] == "failed"
+    assert progress.data["error"] == "BULK_DELETE_STALLED"
+
+
+def test_non_admin_forbidden():
+    client = APIClient()
+    client.force_authenticate(make_users(1, prefix="plain")[0])
+    response = client.post("/api/admin-panel/bulk/", {"action": "delete", "user_ids": [1]}, format="json")
+    assert response.status_code == 403
@@ -0,0 +1,133 @@
+# backend/api/test/test_cache_backends.py
+import threading
+import uuid
+
+import pytest
+from api import cache_backends
+from api.cache_backends import TieredCache
+from django.core.cache import caches
+
+
+@pytest.fixture()
+def location():
+    return f"test-{uuid.uuid4()}"
+
+
+@pytest.fixture()
+def tiered(location):
+    def build(**options):
+        options.setdefault("SHARED_ALIAS", "shared")
+        return TieredCache(location, {"OPTIONS": options})
+    return build
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    """Controls the monotonic clock the local expiry is based on."""
+    now = [1000.0]
+    monkeypatch.setattr(cache_backends.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_default_cache_is_tiered():
+    assert isinstance(caches["default"], TieredCache)
+
+
+def test_reads_are_served_from_local_tier(tiered):
+    tc = tiered()
+    tc.set("k", {"a": 1})
+    assert tc.get("k") == {"a": 1}
+    assert tc.stats()["local_hits"] == 1
+
+    tc.clear_local()
+    assert tc.get("k") == {"a": 1}
+    assert tc.get("k") == {"a": 1}
+    assert tc.get("missing", "dflt") == "dflt"
+    assert tc.stats() == {"local_hits": 2, "shared_hits": 1, "misses": 1, "local_entries": 1}
+
+
+def test_local_copy_is_isolated_from_callers(tiered):
+    tc = tiered()
+    value = {"items": [1]}
+    tc.set("k", value)
+    value["items"].append(2)
+    tc.get("k")["items"].append(3)
+    assert tc.get("k") == {"items": [1]}
+
+
+def test_other_process_writes_are_seen_after_local_timeout(tiered, clock):
+    tc = tiered(LOCAL_TIMEOUT=5)
+    tc.set("k", "old")
+    # Another process writes straight to the shared tier
+    caches["shared"].set("k", "new")
+    assert tc.get("k") == "old"
+    clock[0] += 6
+    assert tc.get("k") == "new"
+
+
+def test_local_tier_honours_shorter_key_timeout(tiered, clock):
+    tc = tiered(LOCAL_TIMEOUT=60)
+    tc.set("k", "v", timeout=1)
+    caches["shared"].delete("k")
+    assert tc.get("k") == "v"
+    clock[0] += 2
+    assert tc.get("k") is None
+
+
+def test_zero_timeout_is_not_cached(tiered):
+    tc = tiered()
+    tc.set("k", "v", timeout=0)
+    assert tc.get("k") is None
+    assert tc.stats()["local_entries"] == 0
+
+
+def test_local_tier_is_bounded_lru(tiered):
+    tc = tiered(MAX_ENTRIES=2)
+    tc.set("a", 1)
+    tc.set("b", 2)
+    tc.get("a")
+    tc.set("c", 3)
+    assert tc.stats()["local_entries"] == 2
+    caches["shared"].delete_many(["a", "b", "c"])
+    # "b" was least recently used and fell out of the local tier
+    assert tc.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+
+
+def test_atomic_operations_go_to_shared_tier(tiered):
+    tc = tiered()
+    assert tc.add("lock", 1)
+    assert not tc.add("lock", 2)
+    assert tc.get("lock") == 1
+
+    tc.set("n", 1)
+    assert tc.get("n") == 1
+    assert tc.incr("n") == 2
+    caches["shared"].incr("n")
+    assert tc.get("n") == 3
+    assert tc.decr("n", 2) == 1
+
+    tc.delete("n")
+    assert not tc.has_key("n")
+
+
+def test_many_operations(tiered):
+    tc = tiered()
+    assert tc.set_many({"a": 1, "b": 2}) == []
+    assert tc.get_many(["a", "b", "c"]) == {"a": 1, "b": 2}
+    tc.delete_many(["a"])
+    assert tc.get_many(["a", "b"]) == {"b": 2}
+    tc.clear()
+    assert tc.get("b") is None
+
+
+def test_local_tier_is_shared_between_threads(tiered):
+    tc = tiered()
+    tc.set("k", "v")
+    caches["shared"].delete("k")
+
+    seen = []
+    # Django builds one backend instance per thread
+    thread = threading.Thread(target=lambda: seen.append(tiered().get("k")))
+    thread.start()
+    thread.join()
+    assert seen == ["v"]
@@ -0,0 +1,144 @@
+# backend/api/test/test_commands.py
+import json
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from api.models.comment import Comment
+from api.models.like import Like
+from api.models.post import Post
+from api.models.profile import Profile
+from api.models.security import SecurityQuestion, UserSecurityAnswer
+from api.security_questions import signup_question_ids
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+from rest_framework_simplejwt.utils import aware_utcnow
+
+pytestmark = pytest.mark.django_db
+User = get_user_model()
+
+
+def test_reconcile_post_counters_fixes_drift():
+    user = User.objects.create_user(username="rc_user", email="rc@ex.com", password="x")
+    drifted = Post.objects.create(author=user, title="drifted", content="...")
+    healthy = Post.objects.create(author=user, title="healthy", content="...")
+    Like.objects.create(user=user, post=drifted)
+    Comment.objects.create(post=drifted, author=user, content="c")
+    Like.objects.create(user=user, post=healthy)
+    Post.objects.filter(pk=drifted.pk).update(like_count=7, comment_count=0)
+
+    out = StringIO()
+    call_command("reconcile_post_counters", "--dry-run", batch_size=1, stdout=out)
+    assert "would fix 1" in out.getvalue()
+    assert Post.objects.get(pk=drifted.pk).like_count == 7
+
+    out = StringIO()
+    call_command("reconcile_post_counters", batch_size=1, stdout=out)
+    assert "fixed 1" in out.getvalue()
+    drifted.refresh_from_db()
+    healthy.refresh_from_db()
+    assert (drifted.like_count, drifted.comment_count) == (1, 1)
+    assert (healthy.like_count, healthy.comment_count) == (1, 0)
+
+
+def test_prune_tokens_reports_and_deletes_expired():
+    user = User.objects.create_user(username="pt_user", email="pt@ex.com", password="x")
+    OutstandingToken.objects.create(user=user, jti="expired", token="t", expires_at=aware_utcnow() - timedelta(hours=1))
+    OutstandingToken.objects.create(user=user, jti="live", token="t", expires_at=aware_utcnow() + timedelta(hours=1))
+
+    out = StringIO()
+    call_command("prune_tokens", "--dry-run", stdout=out)
+    assert "Would prune 1" in out.getvalue()
+    assert OutstandingToken.objects.count() == 2
+
+    out = StringIO()
+    call_command("prune_tokens", batch_size=1, pause=0, stdout=out)
+    assert "Pruned 1" in out.getvalue()
+    assert list(OutstandingToken.objects.values_list("jti", flat=True)) == ["live"]
+
+
+@pytest.fixture()
+def signup_questions():
+    # The seeded default questions come first when they exist
+    for n in range(3):
+        SecurityQuestion.objects.create(question_text=f"Import Q{n}")
+    return signup_question_ids()
+
+
+def test_import_users_from_jsonl(tmp_path, signup_questions):
+    User.objects.create_user(username="taken", email="taken@ex.com", password="x")
+    hashed = make_password("prehashed-pw")
+    rows = [
+        {"username": "plain", "email": "plain@Ex.com", "password": "plain-pw",
+         "first_name": "P", "security_answers": [
+             {"question": qid, "answer": answer}
+             for qid, answer in zip(signup_questions, ["Red", "Cat", "Pie"])
+         ]},
+        {"username": "hashed", "email": "hashed@ex.com", "password_hash": hashed},
+        {"username": "taken", "email": "other@ex.com"},
+        {"username": "plain", "email": "dupe@ex.com"},
+        {"username": "bad", "email": "not-an-email"},
+    ]
+    path = tmp_path / "users.jsonl"
+    path.write_text("\n".join(json.dumps(r) for r in rows) + "\n")
+
+    out, err = StringIO(), StringIO()
+    call_command("import_users", str(path), batch_size=2, stdout=out, stderr=err)
+    assert "Created 2 users, skipped 2 existing, 1 invalid rows." in out.getvalue()
+    assert "Row 5" in err.getvalue()
+
+    plain = User.objects.get(username="plain")
+    assert plain.email == "plain@ex.com"
+    assert plain.first_name == "P"
+    assert plain.check_password("plain-pw")
+    assert Profile.objects.filter(user=plain).exists()
+    answers = plain.security_answers.order_by("question_id")
+    assert [a.question_id for a in answers] == signup_questions
+    assert answers[1].check_answer("cat")
+
+    assert User.objects.get(username="hashed").check_password("prehashed-pw")
+    assert not User.objects.filter(username="bad").exists()
+
+
+def test_import_users_rejects_malformed_security_answers(tmp_path, signup_questions):
+    q1, q2, q3 = signup_questions
+    rows = [
+        # A string would otherwise be iterated character by character
+        {"username": "chars", "email": "chars@ex.com", "security_answers": "abc"},
+        {"username": "plain", "email": "plain@ex.com", "security_answers": ["a", "b", "c"]},
+        {"username": "repeat", "email": "repeat@ex.com", "security_answers": [
+            {"question": q1, "answer": "a"}, {"question": q1, "answer": "b"}, {"question": q2, "answer": "c"},
+        ]},
+        {"username": "blank", "email": "blank@ex.com", "security_answers": [
+            {"question": q1, "answer": "a"}, {"question": q2, "answer": " "}, {"question": q3, "answer": "c"},
+        ]},
+        {"username": "shuffled", "email": "shuffled@ex.com", "security_answers": [
+            {"question": q3, "answer": "c"}, {"question": q1, "answer": "a"}, {"question": q2, "answer": "b"},
+        ]},
+    ]
+    path = tmp_path / "users.jsonl"
+    path.write_text("\n".join(json.dumps(r) for r in rows) + "\n")
+
+    out, err = StringIO(), StringIO()
+    call_command("import_users", str(path), stdout=out, stderr=err)
+    assert "Created 1 users, skipped 0 existing, 4 invalid rows." in out.getvalue()
+    assert not User.objects.filter(username__in=["chars", "plain", "repeat", "blank"]).exists()
+    answers = User.objects.get(username="shuffled").security_answers.order_by("question_id")
+    assert answers[0].check_answer("a") and answers[2].check_answer("c")
+
+
+def test_import_users_from_csv(tmp_path, signup_questions):
+    path = tmp_path / "users.csv"
+    path.write_text(
+        "username,email,security_answer_1,security_answer_2,security_answer_3\n"
+        "csv1,csv1@ex.com,a,b,c\n"
+        "csv2,csv2@ex.com,,,\n"
+    )
+    out = StringIO()
+    call_command("import_users", str(path), stdout=out)
+    assert "Created 2 users" in out.getvalue()
+    assert not User.objects.get(username="csv2").has_usable_password()
+    assert UserSecurityAnswer.objects.filter(user__username="csv1").count() == 3
+    assert UserSecurityAnswer.objects.filter(user__username="csv2").count() == 0
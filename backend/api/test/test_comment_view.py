@@ -148,3 +148,57 @@ def test_mine_limit_invalid_defaults_to_50(factory, post, user):
     resp = _view({"get": "mine"})(req)
     assert resp.status_code == status.HTTP_200_OK
     assert len(resp.data) == 5
+
+
+
+def test_list_cursor_mode_pages_by_created_at(factory, post, user):
+    for i in range(3):
+        Comment.objects.create(post=post, author=user, content=f"c{i}")
+
+    req = factory.get(f"/comments/?post={post.id}&cursor=&page_size=2")
+    resp = _view({"get": "list"})(req)
+    assert resp.status_code == status.HTTP_200_OK
+    assert [item["content"] for item in resp.data["results"]] == ["c2", "c1"]
+    assert resp.data["next"]
+
+    cursor = resp.data["next"].split("cursor=")[1].split("&")[0]
+    req = factory.get(f"/comments/?post={post.id}&cursor={cursor}&page_size=2")
+    resp = _view({"get": "list"})(req)
+    assert [item["content"] for item in resp.data["results"]] == ["c0"]
+    assert resp.data["next"] is None
+
+
+def test_list_loads_only_serialized_columns(factory, post, user, other_user):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    post.content = "<p>long body</p>" * 1000
+    post.save()
+    for author in (user, other_user, user):
+        Comment.objects.create(post=post, author=author, content="hi")
+
+    with CaptureQueriesContext(connection) as captured:
+        resp = _view({"get": "list"})(factory.get(f"/comments/?post={post.id}&cursor="))
+    assert resp.status_code == status.HTTP_200_OK
+    assert len(_items(resp)) == 3
+    assert {item["author_username"] for item in _items(resp)} == {"u1", "u2"}
+    # The filter's id check, then comments, authors and profiles in one join
+    post_check, comments = [q["sql"] for q in captured.captured_queries]
+    assert '"api_post"."content"' not in post_check
+    assert '"api_post"' not in comments and '"password"' not in comments
+
+
+def test_mine_loads_post_title_and_slug_only(factory, post, user):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    Comment.objects.create(post=post, author=user, content="mine")
+    req = factory.get("/comments/mine/")
+    force_authenticate(req, user=user)
+    with CaptureQueriesContext(connection) as captured:
+        resp = _view({"get": "mine"})(req)
+    assert resp.data[0]["postTitle"] == "p1"
+    assert resp.data[0]["postSlug"] == post.slug
+    assert len(captured.captured_queries) == 1
+    sql = captured.captured_queries[0]["sql"]
+    assert '"api_post"."title"' in sql and '"api_post"."content"' not in sql
@@ -0,0 +1,159 @@
+# backend/api/test/test_content_safety.py
+import html
+import random
+import re
+import time
+
+import pytest
+from api import content_safety
+from api.content_safety import (BLOCK_COMMENT, COMMENT_SQL_PATTERNS, COMMENT_XSS_PATTERNS,
+                                EMBED_SRC, EMBED_TAG, EVENT_HANDLER, IFRAME_SRC, IFRAME_TAG,
+                                OBJECT_DATA, OBJECT_TAG, POST_CONTENT_XSS_PATTERNS,
+                                QUOTED_EVENT_HANDLER, QUOTED_OR, SCRIPT_ELEMENT,
+                                TITLE_SQL_PATTERNS, TITLE_XSS_PATTERNS, UNION_SELECT_FROM)
+from api.middleware import SimpleXSSProtectionMiddleware
+from api.serializers.comment import CommentSerializer
+from api.serializers.post import PostSerializer
+from rest_framework import serializers
+
+# Each linear rule and the backtracking pattern it replaces
+REWRITES = [
+    (QUOTED_OR, r"'.*or.*'.*=.*'"),
+    (BLOCK_COMMENT, r'/\*.*\*/'),
+    (UNION_SELECT_FROM, r'\bunion\s+select\b.*from\b'),
+    (EVENT_HANDLER, r'on\w+\s*='),
+    (QUOTED_EVENT_HANDLER, r'on\w+\s*=\s*["\'][^"\']*["\']'),
+]
+
+# Tag rules run with re.DOTALL in the middleware and without it elsewhere
+TAG_REWRITES = [
+    (SCRIPT_ELEMENT, r'<script[^>]*>.*?</script>'),
+    (IFRAME_TAG, r'<iframe[^>]*>'),
+    (OBJECT_TAG, r'<object[^>]*>'),
+    (EMBED_TAG, r'<embed[^>]*>'),
+    (IFRAME_SRC, r'<iframe[^>]*src\s*='),
+    (OBJECT_DATA, r'<object[^>]*data\s*='),
+    (EMBED_SRC, r'<embed[^>]*src\s*='),
+]
+
+FRAGMENTS = [
+    "'", '"', "or", "OR", "=", "\n", " ", "/*", "*/", "/", "*", "on", "On", "click",
+    "union", "select", "from", "u", "o", "n", "a", "_", "1", "é",
+]
+
+TAG_FRAGMENTS = [
+    "<script", "<SCRIPT", "</script>", "</script", "<", ">", "/", "<iframe", "<object", "<embed",
+    "src", "data", "s", "d", "rc", "ata", "=", " ", "\n", "x",
+]
+
+ONE_MB = 1024 * 1024
+
+PATHOLOGICAL = {
+    "quotes": "'" * ONE_MB,
+    "quote-o": "'o" * (ONE_MB // 2),
+    "quote-or": "'or'" * (ONE_MB // 4),
+    "comment-openers": "/*" * (ONE_MB // 2),
+    "slashes": "/" * ONE_MB,
+    "on-word": "on" * (ONE_MB // 2) + " ",
+    "on-handlers": "onx='" * (ONE_MB // 5),
+    "script-openers": "<script" * (ONE_MB // 7),
+    "script-unclosed": "<script>" + "a" * ONE_MB,
+    "union-select": "union select " * (ONE_MB // 13),
+    "tag-soup": "<iframe<object<embed" * (ONE_MB // 20),
+    "script-elements-unclosed": "<script>" * (ONE_MB // 8),
+    "script-opener-per-line": "<script>x\n" * (ONE_MB // 10),
+    "iframe-sources": "<iframe src" * (ONE_MB // 11),
+    "spaces": "eval" + " " * ONE_MB,
+    "letters": "a" * ONE_MB,
+}
+
+RULE_SETS = [TITLE_SQL_PATTERNS, TITLE_XSS_PATTERNS, POST_CONTENT_XSS_PATTERNS,
+             COMMENT_SQL_PATTERNS, COMMENT_XSS_PATTERNS,
+             SimpleXSSProtectionMiddleware(None).xss_patterns]
+
+
+@pytest.mark.parametrize("linear, original", REWRITES)
+def test_linear_rules_match_original_patterns(linear, original):
+    rnd = random.Random(original)
+    linear_re = re.compile(linear, re.MULTILINE)
+    original_re = re.compile(original, re.IGNORECASE | re.MULTILINE)
+    for _ in range(5000):
+        text = "".join(rnd.choice(FRAGMENTS) for _ in range(rnd.randint(0, 20)))
+        assert bool(linear_re.search(text.lower())) == bool(original_re.search(text)), repr(text)
+
+
+@pytest.mark.parametrize("flags", [re.MULTILINE, re.DOTALL])
+@pytest.mark.parametrize("linear, original", TAG_REWRITES)
+def test_linear_tag_rules_match_original_patterns(linear, original, flags):
+    rnd = random.Random(original)
+    linear_re = re.compile(linear, flags)
+    original_re = re.compile(original, re.IGNORECASE | flags)
+    for _ in range(5000):
+        text = "".join(rnd.choice(TAG_FRAGMENTS) for _ in range(rnd.randint(0, 20)))
+        assert bool(linear_re.search(text.lower())) == bool(original_re.search(text)), repr(text)
+
+
+@pytest.mark.parametrize("name", sorted(PATHOLOGICAL))
+def test_rule_sets_stay_linear_on_pathological_input(name):
+    text = PATHOLOGICAL[name]
+    for rules in RULE_SETS:
+        started = time.perf_counter()
+        rules.search(text)
+        # The replaced patterns take minutes to hours on these inputs
+        assert time.perf_counter() - started < 2.0, (name, rules.patterns)
+
+
+def test_rules_are_compiled_once():
+    for rules in RULE_SETS:
+        assert isinstance(rules.regex, re.Pattern)
+    assert content_safety.TITLE_SQL_PATTERNS is TITLE_SQL_PATTERNS
+
+
+@pytest.mark.parametrize("value", [
+    "<SCRIPT src=x>alert(1)</SCRIPT>",
+    "<script>alert(1)</script>",
+    "javascript:alert(1)",
+    '<img onerror="x()">',
+    "eval (1)",
+])
+def test_post_content_rejects_scripts(value):
+    with pytest.raises(serializers.ValidationError):
+        PostSerializer().validate_content(value)
+
+
+def test_post_content_allows_html():
+    value = '<p>Hello <b>world</b> <a href="https://x.dev">link</a></p>\n<pre>select 1;</pre>'
+    assert PostSerializer().validate_content(value) == value
+
+
+@pytest.mark.parametrize("value, message", [
+    ("drop everything", "SQL"),
+    ("a || b", "SQL"),
+    ("it's or 'x'='x'", "SQL"),
+    ("<script>x</script>", "unsafe content"),
+    ("onload=1", "unsafe content"),
+])
+def test_title_validation(value, message):
+    with pytest.raises(serializers.ValidationError) as exc:
+        PostSerializer().validate_title(value)
+    assert message in str(exc.value.detail[0])
+
+
+def test_title_is_escaped():
+    assert PostSerializer().validate_title("Tom & Jerry") == "Tom &amp; Jerry"
+
+
+@pytest.mark.parametrize("value", ["CONCAT(a)", "<iframe>", "<embed src=x>", "x; y"])
+def test_comment_validation_rejects(value):
+    with pytest.raises(serializers.ValidationError):
+        CommentSerializer().validate_content(value)
+
+
+@pytest.mark.parametrize("value", ["a <iframe", "<script src=x>", "x <embed src=y"])
+def test_comment_validation_allows_unterminated_tags(value):
+    # As before the patterns were made linear: these need a ">" or a closing tag
+    assert CommentSerializer().validate_content(value) == html.escape(value)
+
+
+def test_comment_validation_allows_plain_text():
+    assert CommentSerializer().validate_content("Great post, thanks!") == "Great post, thanks!"
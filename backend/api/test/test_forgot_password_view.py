@@ -2,7 +2,7 @@
 import json
 
 import pytest
-from api.models.security import SecurityQuestion, UserSecurityAnswer
+from api.models.security import SecurityQuestion, UserSecurityAnswer, hash_security_answer
 from api.views.forgot_password_view import (ForgetPasswordResetView,
                                             ForgetPasswordStartView,
                                             ForgetPasswordVerifyView)
@@ -30,8 +30,8 @@ def user():
 def questions(user):
     q1 = SecurityQuestion.objects.create(question_text="pet?")
     q2 = SecurityQuestion.objects.create(question_text="city?")
-    UserSecurityAnswer.objects.create(user=user, question=q1, answer="cat")
-    UserSecurityAnswer.objects.create(user=user, question=q2, answer="sydney")
+    UserSecurityAnswer.objects.create(user=user, question=q1, answer_hash=hash_security_answer("cat"))
+    UserSecurityAnswer.objects.create(user=user, question=q2, answer_hash=hash_security_answer("sydney"))
     return [q1, q2]
 
 
@@ -165,3 +165,46 @@ def test_reset_success_flow(factory, user, questions):
 
     user.refresh_from_db()
     assert user.check_password(new_pwd)
+
+
+def test_answers_are_stored_hashed(user, questions):
+    stored = UserSecurityAnswer.objects.get(user=user, question=questions[0])
+    assert "cat" not in stored.answer_hash
+    assert stored.check_answer("  CAT ")
+    assert not stored.check_answer("dog")
+    assert not stored.check_answer(None)
+
+    other = User.objects.create_user(username="fp_other", email="fp2@ex.com", password="x")
+    twin = UserSecurityAnswer.objects.create(user=other, question=questions[0], answer_hash=hash_security_answer("cat"))
+    assert twin.answer_hash != stored.answer_hash
+
+
+def test_verify_checks_all_answers_in_one_query(factory, user, questions, django_assert_max_num_queries):
+    payload = {
+        "email": user.email,
+        "answers": [
+            {"question_id": questions[0].id, "answer": "Cat"},
+            {"question_id": questions[1].id, "answer": "SYDNEY "},
+        ],
+    }
+    req = factory.post("/", data=json.dumps(payload), content_type="application/json")
+    # One for the answers; the rest is issuing the reset token
+    with django_assert_max_num_queries(3) as captured:
+        resp = ForgetPasswordVerifyView.as_view()(req)
+    assert resp.status_code == status.HTTP_200_OK
+    assert sum("api_usersecurityanswer" in q["sql"] for q in captured.captured_queries) == 1
+
+
+def test_verify_requires_every_answer(factory, user, questions):
+    payload = {"email": user.email, "answers": [{"question_id": questions[0].id, "answer": "cat"}]}
+    req = factory.post("/", data=json.dumps(payload), content_type="application/json")
+    resp = ForgetPasswordVerifyView.as_view()(req)
+    assert resp.status_code == status.HTTP_400_BAD_REQUEST
+    assert "incorrect" in str(resp.data).lower()
+
+
+def test_verify_user_not_found(factory):
+    payload = {"email": "none@ex.com", "answers": [{"question_id": 1, "answer": "x"}]}
+    req = factory.post("/", data=json.dumps(payload), content_type="application/json")
+    resp = ForgetPasswordVerifyView.as_view()(req)
+    assert resp.status_code == status.HTTP_404_NOT_FOUND
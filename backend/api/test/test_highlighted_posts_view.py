@@ -1,16 +1,24 @@
 # backend/api/test/test_highlighted_posts_view.py
 import pytest
+from api.highlights import invalidate_highlighted_posts
 from api.models.like import Like
 from api.models.post import Post
 from api.views.highlighted_posts import HighlightedPostsView
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.test.utils import override_settings
 from django.utils import timezone
 from rest_framework import status
-from rest_framework.test import APIRequestFactory
+from rest_framework.test import APIRequestFactory, force_authenticate
 
 pytestmark = pytest.mark.django_db
 User = get_user_model()
 
+LOC_MEM_CACHE = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
 
 @pytest.fixture()
 def factory():
@@ -101,3 +109,85 @@ def test_most_liked_sorted_and_only_published(factory, users):
     assert titles[:5] == ["pC", "pA", "pD", "pB", "pE"]
 
     assert "p0" not in titles and "p-1" not in titles
+
+
+@override_settings(CACHES=LOC_MEM_CACHE)
+def test_highlighted_query_count_is_constant(factory, users, django_assert_max_num_queries):
+    cache.clear()
+    for i in range(10):
+        post = _mk_post(f"q{i}", published=True, minutes_ago=i)
+        for u in users[: i % 5]:
+            _like(post, u)
+
+    req = factory.get("/highlighted/")
+    # cold cache: one query per list + one tags prefetch per list
+    with django_assert_max_num_queries(4):
+        resp = HighlightedPostsView.as_view()(req)
+        resp.render()
+    assert resp.status_code == status.HTTP_200_OK
+    assert [item["likes_count"] for item in resp.data["most_liked"]][:4] == [4, 4, 3, 3]
+
+
+@override_settings(CACHES=LOC_MEM_CACHE)
+def test_payload_is_cached_and_overlaid_per_viewer(factory, users, django_assert_num_queries):
+    cache.clear()
+    post = _mk_post("cached", published=True)
+    _like(post, users[0])
+
+    resp = HighlightedPostsView.as_view()(factory.get("/highlighted/"))
+    assert resp.data["latest"][0]["likes_count"] == 1
+
+    # Warm cache: anonymous hits don't touch the database at all
+    with django_assert_num_queries(0):
+        resp = HighlightedPostsView.as_view()(factory.get("/highlighted/"))
+    assert resp.data["latest"][0]["liked_by_user"] is False
+
+    # Authenticated viewers only pay for the like overlay
+    req = factory.get("/highlighted/")
+    force_authenticate(req, user=users[0])
+    with django_assert_num_queries(1):
+        resp = HighlightedPostsView.as_view()(req)
+    item = resp.data["latest"][0]
+    assert item["liked_by_user"] is True
+    assert "like_id" not in item
+
+    # A new like invalidates the cached payload once the transaction commits;
+    # the test transaction never does, so run what it queued (once per transaction)
+    _like(post, users[1])
+    queued = [callback for _, callback, *_ in transaction.get_connection().run_on_commit]
+    assert queued.count(invalidate_highlighted_posts) == 1
+    for callback in queued:
+        callback()
+    resp = HighlightedPostsView.as_view()(factory.get("/highlighted/"))
+    assert resp.data["latest"][0]["likes_count"] == 2
+
+
+@override_settings(CACHES=LOC_MEM_CACHE)
+def test_concurrent_miss_serves_stale_payload_instead_of_rebuilding(factory, django_assert_num_queries):
+    from api import highlights
+
+    cache.clear()
+    _mk_post("stale", published=True)
+    HighlightedPostsView.as_view()(factory.get("/highlighted/"))
+
+    # Another worker holds the rebuild lock for the new version
+    highlights.invalidate_highlighted_posts()
+    version = highlights._current_version()
+    cache.add(f"highlighted-posts:v{version}:lock", 1, 10)
+
+    with django_assert_num_queries(0):
+        resp = HighlightedPostsView.as_view()(factory.get("/highlighted/"))
+    assert [item["title"] for item in resp.data["latest"]] == ["pstale"]
+
+
+@override_settings(CACHES=LOC_MEM_CACHE)
+def test_cached_media_urls_follow_each_requests_host(factory):
+    cache.clear()
+    post = _mk_post("cover", published=True)
+    Post.objects.filter(pk=post.pk).update(cover="covers/cover.png")
+
+    resp = HighlightedPostsView.as_view()(factory.get("/highlighted/", HTTP_HOST="first.example.com"))
+    assert resp.data["latest"][0]["cover"] == "http://first.example.com/media/covers/cover.png"
+
+    resp = HighlightedPostsView.as_view()(factory.get("/highlighted/", HTTP_HOST="second.example.com"))
+    assert resp.data["latest"][0]["cover"] == "http://second.example.com/media/covers/cover.png"
@@ -0,0 +1,154 @@
+# backend/api/test/test_like_buffer.py
+from io import StringIO
+from uuid import uuid4
+
+import pytest
+from api import like_buffer
+from api.like_buffer import INFLIGHT_KEY, LOCK_KEY, LOCK_TIMEOUT, flush_likes, pending_count
+from api.models.like import Like
+from api.models.post import Post
+from api import redis_client
+from api.redis_client import get_redis
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+pytestmark = pytest.mark.django_db
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def write_behind(settings):
+    settings.LIKE_WRITE_BEHIND = True
+
+
+def make_post(slug="viral"):
+    author = User.objects.create_user(username=f"author-{uuid4().hex[:6]}", email=f"{uuid4().hex[:6]}@ex.com", password="x")
+    return Post.objects.create(author=author, title="Viral", content="x", slug=f"{slug}-{uuid4().hex[:6]}")
+
+
+def client_for(username):
+    client = APIClient()
+    client.force_authenticate(User.objects.create_user(username=username, email=f"{username}@ex.com", password="x"))
+    return client
+
+
+def like_url(post):
+    return reverse("post-like", kwargs={"slug": post.slug})
+
+
+def test_likes_are_queued_then_flushed():
+    post = make_post()
+    fans = [client_for(f"fan{n}") for n in range(3)]
+
+    response = fans[0].post(like_url(post))
+    assert response.status_code == 202
+    assert response.data == {"liked": True, "likes_count": 0, "pending": True}
+    for fan in fans:
+        fan.post(like_url(post))  # fans[0] double-clicks
+    fans[2].delete(like_url(post))
+    assert not Like.objects.exists()
+    assert pending_count() == 5
+
+    assert flush_likes() == 5
+    post.refresh_from_db()
+    assert post.like_count == 2
+    assert set(Like.objects.values_list("user__username", flat=True)) == {"fan0", "fan1"}
+    assert pending_count() == 0
+    assert flush_likes() == 0
+
+
+def test_interrupted_flush_is_replayed_without_double_counting(monkeypatch):
+    post = make_post()
+    for n in range(4):
+        client_for(f"crash{n}").post(like_url(post))
+
+    original = like_buffer.apply_events
+    calls = []
+
+    def dies_on_second_batch(events):
+        calls.append(events)
+        if len(calls) == 2:
+            raise RuntimeError("worker killed")
+        return original(events)
+
+    monkeypatch.setattr(like_buffer, "apply_events", dies_on_second_batch)
+    with pytest.raises(RuntimeError):
+        flush_likes(batch_size=2)
+    post.refresh_from_db()
+    assert post.like_count == 2  # first batch committed and trimmed
+    assert get_redis().llen(INFLIGHT_KEY) == 2
+    assert not get_redis().exists(LOCK_KEY)
+
+    # New events keep queueing behind the in-flight list
+    client_for("late").post(like_url(post))
+    monkeypatch.setattr(like_buffer, "apply_events", original)
+    assert flush_likes(batch_size=2) == 2  # the replay
+    assert flush_likes(batch_size=2) == 1
+    post.refresh_from_db()
+    assert post.like_count == Like.objects.filter(post=post).count() == 5
+
+
+def test_flush_stops_when_its_lock_expires_midway(monkeypatch):
+    post = make_post()
+    for n in range(4):
+        client_for(f"slow{n}").post(like_url(post))
+
+    now = [1000.0]
+    monkeypatch.setattr(redis_client.time, "monotonic", lambda: now[0])
+    original = like_buffer.apply_events
+    calls = []
+
+    def stalls_on_second_batch(events):
+        calls.append(events)
+        changed = original(events)
+        if len(calls) == 2:
+            now[0] += LOCK_TIMEOUT + 1
+            assert get_redis().set(LOCK_KEY, "other-flusher", nx=True)
+        return changed
+
+    monkeypatch.setattr(like_buffer, "apply_events", stalls_on_second_batch)
+    assert flush_likes(batch_size=2) == 2  # only the batch trimmed under the lock
+    assert get_redis().get(LOCK_KEY) == "other-flusher"  # not released by the loser
+    assert get_redis().llen(INFLIGHT_KEY) == 2  # not trimmed past its lock
+
+    get_redis().delete(LOCK_KEY)
+    assert flush_likes(batch_size=2) == 2  # the new holder replays the second batch
+    post.refresh_from_db()
+    assert post.like_count == Like.objects.filter(post=post).count() == 4
+    assert pending_count() == 0
+
+
+def test_events_for_deleted_posts_are_dropped():
+    kept, gone = make_post("kept"), make_post("gone")
+    fan = client_for("dropper")
+    fan.post(like_url(kept))
+    fan.post(like_url(gone))
+    gone.delete()
+
+    assert flush_likes() == 2
+    assert list(Like.objects.values_list("post_id", flat=True)) == [kept.id]
+
+
+def test_flush_skips_while_locked_and_command_reports():
+    post = make_post()
+    client_for("cmd").post(like_url(post))
+    get_redis().set(LOCK_KEY, "1")
+    assert flush_likes() is None
+    get_redis().delete(LOCK_KEY)
+
+    out = StringIO()
+    call_command("flush_likes", stdout=out)
+    assert "Flushed 1 like events." in out.getvalue()
+    assert Like.objects.filter(post=post).count() == 1
+
+
+def test_orm_apply_matches_sql_apply():
+    post = make_post()
+    users = [User.objects.create_user(username=f"orm{n}", email=f"orm{n}@ex.com", password="x") for n in range(2)]
+    assert like_buffer._apply_orm([(u.id, post.id, 0.0) for u in users], [])
+    assert not like_buffer._apply_orm([(users[0].id, post.id, 0.0)], [])
+    assert like_buffer._apply_orm([], [(users[1].id, post.id)])
+    post.refresh_from_db()
+    assert post.like_count == 1
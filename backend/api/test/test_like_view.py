@@ -101,3 +101,44 @@ def test_destroy_only_owner_can_delete():
     resp = view(req, pk=like.id)
     assert resp.status_code == status.HTTP_204_NO_CONTENT
     assert not Like.objects.filter(id=like.id).exists()
+
+
+def test_list_scoped_to_requester_or_post_and_paginated_by_cursor():
+    from urllib.parse import parse_qs, urlparse
+
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    me, other = make_user("lister"), make_user("stranger")
+    posts = [make_post(author=other, title=f"P{n}", slug=f"p{n}") for n in range(3)]
+    for post in posts:
+        Like.objects.create(user=me, post=post)
+    Like.objects.create(user=other, post=posts[0])
+
+    factory = APIRequestFactory()
+    view = LikeViewSet.as_view({"get": "list"})
+
+    req = factory.get("/api/likes/", {"page_size": 2})
+    force_authenticate(req, user=me)
+    with CaptureQueriesContext(connection) as captured:
+        resp = view(req)
+    assert [item["post_title"] for item in resp.data["results"]] == ["P2", "P1"]
+    assert all(item["username"] == "lister" for item in resp.data["results"])
+    assert len(captured.captured_queries) == 1
+    assert '"api_post"."content"' not in captured.captured_queries[0]["sql"]
+
+    cursor = parse_qs(urlparse(resp.data["next"]).query)["cursor"][0]
+    req = factory.get("/api/likes/", {"page_size": 2, "cursor": cursor})
+    force_authenticate(req, user=me)
+    resp = view(req)
+    assert [item["post_title"] for item in resp.data["results"]] == ["P0"]
+    assert resp.data["next"] is None
+
+    req = factory.get("/api/likes/", {"post": posts[0].id})
+    force_authenticate(req, user=me)
+    resp = view(req)
+    assert {item["username"] for item in resp.data["results"]} == {"lister", "stranger"}
+
+    req = factory.get("/api/likes/", {"post": "abc"})
+    force_authenticate(req, user=me)
+    assert view(req).status_code == status.HTTP_400_BAD_REQUEST
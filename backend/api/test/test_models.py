@@ -4,6 +4,7 @@ from api.models import (
     CustomUser, Profile, Post, Tag, Comment, Like,
     SecurityQuestion, UserSecurityAnswer
 )
+from api.models.security import hash_security_answer
 
 # ======================================================
 # ? CustomUser & Profile
@@ -92,6 +93,45 @@ def test_like_unique_together_constraint():
         Like.objects.create(user=user, post=post)
 
 
+@pytest.mark.django_db
+def test_post_counters_follow_likes_and_comments():
+    """like_count / comment_count track Like and Comment rows, including cascades"""
+    author = CustomUser.objects.create_user(username="counted", email="cnt@example.com", password="pw")
+    fan = CustomUser.objects.create_user(username="fan", email="fan@example.com", password="pw")
+    post = Post.objects.create(author=author, title="Counters", content="Body")
+
+    like = Like.objects.create(user=author, post=post)
+    Like.objects.create(user=fan, post=post)
+    comment = Comment.objects.create(post=post, author=author, content="one")
+    Comment.objects.create(post=post, author=fan, content="two")
+    post.refresh_from_db()
+    assert (post.like_count, post.comment_count) == (2, 2)
+
+    like.delete()
+    comment.delete()
+    post.refresh_from_db()
+    assert (post.like_count, post.comment_count) == (1, 1)
+
+    # Deleting the user cascades to their like and comment
+    fan.delete()
+    post.refresh_from_db()
+    assert (post.like_count, post.comment_count) == (0, 0)
+
+
+@pytest.mark.django_db
+def test_post_save_does_not_overwrite_counters():
+    """A stale in-memory post must not clobber counters on save()"""
+    user = CustomUser.objects.create_user(username="stale", email="stale@example.com", password="pw")
+    post = Post.objects.create(author=user, title="Stale", content="Body")
+    Like.objects.create(user=user, post=post)
+
+    post.title = "Renamed"
+    post.save()
+    post.refresh_from_db()
+    assert post.title == "Renamed"
+    assert post.like_count == 1
+
+
 # ======================================================
 # ? SecurityQuestion & UserSecurityAnswer
 # ======================================================
@@ -101,7 +141,7 @@ def test_security_question_and_answer_str():
     """SecurityQuestion and UserSecurityAnswer string representation"""
     user = CustomUser.objects.create_user(username="eve", email="eve@example.com", password="pw")
     q = SecurityQuestion.objects.create(question_text="What is your pet name?")
-    a = UserSecurityAnswer.objects.create(user=user, question=q, answer="Fluffy")
+    a = UserSecurityAnswer.objects.create(user=user, question=q, answer_hash=hash_security_answer("Fluffy"))
     assert str(q) == "What is your pet name?"
     assert str(a) == f"{user.username} - {q.question_text}"
 
@@ -110,7 +150,7 @@ def test_user_security_answer_unique_constraint():
     """Ensure a user cannot answer the same question twice"""
     user = CustomUser.objects.create_user(username="a", email="a@example.com", password="x")
     q = SecurityQuestion.objects.create(question_text="Favorite color?")
-    UserSecurityAnswer.objects.create(user=user, question=q, answer="Red")
+    UserSecurityAnswer.objects.create(user=user, question=q, answer_hash=hash_security_answer("Red"))
 
     with pytest.raises(Exception):
-        UserSecurityAnswer.objects.create(user=user, question=q, answer="Blue")
\ No newline at end of file
+        UserSecurityAnswer.objects.create(user=user, question=q, answer_hash=hash_security_answer("Blue"))
\ No newline at end of file
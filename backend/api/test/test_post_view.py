@@ -1,10 +1,12 @@
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework.test import APIClient
 from django.utils import timezone
 from uuid import uuid4
 
-from api.models import CustomUser, Post, Tag
+from api.models import Comment, CustomUser, Like, Post, Tag
 
 pytestmark = pytest.mark.django_db
 
@@ -102,6 +104,67 @@ def test_filter_by_tags_query_param():
     assert slug_b not in slugs
 
 
+def test_list_uses_summary_and_retrieve_uses_full_representation():
+    slug = f"summary-{uuid4().hex[:6]}"
+    author = make_user("u6")
+    post = Post.objects.create(author=author, title="Summary", content="<p>Body text</p>", slug=slug, is_published=True)
+    Comment.objects.create(post=post, author=author, content="nice")
+
+    client = APIClient()
+    r = client.get(reverse("post-list"))
+    assert r.status_code == 200
+    item = next(x for x in _results(r.data) if x["slug"] == slug)
+    assert "comments" not in item and "content" not in item
+    assert item["excerpt"] == "Body text"
+    assert item["comments_count"] == 1
+
+    r = client.get(reverse("post-detail", kwargs={"slug": slug}))
+    assert r.status_code == 200
+    assert r.data["content"] == "<p>Body text</p>"
+    assert len(r.data["comments"]) == 1
+
+
+def test_list_query_count_is_constant(django_assert_max_num_queries):
+    viewer = make_user("viewer")
+    tag, _ = Tag.objects.get_or_create(name="python")
+    for i in range(12):
+        author = make_user(f"budget{i}")
+        post = Post.objects.create(
+            author=author, title=f"Budget {i}", content="x", slug=f"budget-{i}-{uuid4().hex[:6]}", is_published=True
+        )
+        post.tags.add(tag)
+        Comment.objects.create(post=post, author=viewer, content="c")
+        Like.objects.create(post=post, user=viewer)
+
+    client = APIClient()
+    client.force_authenticate(user=viewer)
+    # count + posts (author/profile joined, counts annotated) + tags prefetch
+    with django_assert_max_num_queries(3):
+        r = client.get(reverse("post-list"))
+    assert r.status_code == 200
+    items = _results(r.data)
+    assert len(items) == 12
+    assert all(x["likes_count"] == 1 and x["liked_by_user"] for x in items)
+    assert all(x["comments_count"] == 1 and x["tags"] == ["python"] for x in items)
+
+
+def test_retrieve_query_count_is_constant(django_assert_max_num_queries):
+    author = make_user("u7")
+    slug = f"busy-{uuid4().hex[:6]}"
+    post = Post.objects.create(author=author, title="Busy", content="x", slug=slug, is_published=True)
+    for i in range(10):
+        commenter = make_user(f"commenter{i}")
+        Comment.objects.create(post=post, author=commenter, content=f"c{i}")
+
+    client = APIClient()
+    # post + tags prefetch + comments prefetch (authors/profiles joined)
+    with django_assert_max_num_queries(3):
+        r = client.get(reverse("post-detail", kwargs={"slug": slug}))
+    assert r.status_code == 200
+    assert len(r.data["comments"]) == 10
+    assert r.data["likes_count"] == 0 and r.data["liked_by_user"] is False
+
+
 def test_retrieve_by_slug():
     slug = f"java-1-{uuid4().hex[:6]}"
     Post.objects.create(author=make_user("u5"), title="Java", content="x", slug=slug, is_published=True)
@@ -212,3 +275,192 @@ def test_delete_only_author_or_admin():
     client.force_authenticate(user=admin)
     r = client.delete(reverse("post-detail", kwargs={"slug": slug2}))
     assert r.status_code == 204
+
+
+
+def test_cursor_pagination_walks_posts_without_gaps_or_duplicates():
+    author = make_user("scroller")
+    same_moment = timezone.now()
+    created = []
+    for i in range(5):
+        post = Post.objects.create(
+            author=author, title=f"Scroll {i}", content="x", slug=f"scroll-{i}-{uuid4().hex[:6]}", is_published=True
+        )
+        created.append(post)
+    # Two rows share a timestamp so the id tie-breaker is exercised
+    Post.objects.filter(pk__in=[created[1].pk, created[2].pk]).update(created_at=same_moment)
+
+    client = APIClient()
+    r = client.get(reverse("post-list"), {"cursor": "", "page_size": 2, "author": author.id})
+    assert r.status_code == 200
+    assert "count" not in r.data
+    seen = [x["slug"] for x in r.data["results"]]
+
+    # A post published mid-scroll must not shift the following pages
+    Post.objects.create(author=author, title="Late", content="x", slug=f"late-{uuid4().hex[:6]}", is_published=True)
+
+    next_url = r.data["next"]
+    while next_url:
+        r = client.get(next_url)
+        assert r.status_code == 200
+        seen += [x["slug"] for x in r.data["results"]]
+        next_url = r.data["next"]
+
+    expected = list(
+        Post.objects.filter(pk__in=[p.pk for p in created]).order_by("-created_at", "-id").values_list("slug", flat=True)
+    )
+    assert seen == expected
+
+
+def test_cursor_pagination_rejects_garbage_cursor():
+    client = APIClient()
+    r = client.get(reverse("post-list"), {"cursor": "not-a-cursor"})
+    assert r.status_code == 404
+
+
+@pytest.mark.parametrize("param", ["ordering", "search"])
+def test_cursor_pagination_rejects_its_own_ordering_being_overridden(param):
+    r = APIClient().get(reverse("post-list"), {"cursor": "", param: "title"})
+    assert r.status_code == 400
+    assert param in r.data
+
+
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="full-text search needs PostgreSQL")
+def test_full_text_search_ranks_title_matches_and_supports_prefixes():
+    author = make_user("searcher")
+    in_body = Post.objects.create(
+        author=author, title="Weekend notes", content="<p>Some thoughts on kubernetes operators</p>",
+        slug=f"body-{uuid4().hex[:6]}", is_published=True,
+    )
+    in_title = Post.objects.create(
+        author=author, title="Kubernetes in production", content="<p>Lessons learned</p>",
+        slug=f"title-{uuid4().hex[:6]}", is_published=True,
+    )
+    Post.objects.create(
+        author=author, title="Unrelated", content="<p>Nothing to see</p>",
+        slug=f"other-{uuid4().hex[:6]}", is_published=True,
+    )
+
+    client = APIClient()
+    r = client.get(reverse("post-list"), {"search": "kuber", "author": author.id})
+    assert r.status_code == 200
+    assert [x["slug"] for x in _results(r.data)] == [in_title.slug, in_body.slug]
+
+    # Edits are reflected in the index, in the same UPDATE
+    in_body.content = "<p>Now about gardening</p>"
+    with CaptureQueriesContext(connection) as queries:
+        in_body.save()
+    assert len(queries) == 1
+    r = client.get(reverse("post-list"), {"search": "gardening", "author": author.id})
+    assert [x["slug"] for x in _results(r.data)] == [in_body.slug]
+    r = client.get(reverse("post-list"), {"search": "kubernetes", "author": author.id})
+    assert [x["slug"] for x in _results(r.data)] == [in_title.slug]
+
+
+def test_search_keeps_length_and_character_limits():
+    client = APIClient()
+    r = client.get(reverse("post-list"), {"search": "x" * 101})
+    assert r.status_code == 400
+    r = client.get(reverse("post-list"), {"search": "a' or 1=1"})
+    assert r.status_code == 400
+
+
+def test_filter_by_multiple_tags_any_and_all():
+    author = make_user("tagger")
+    both = Post.objects.create(author=author, title="Both", content="x", slug=f"both-{uuid4().hex[:6]}", is_published=True)
+    only_py = Post.objects.create(author=author, title="Py", content="x", slug=f"py-{uuid4().hex[:6]}", is_published=True)
+    only_dj = Post.objects.create(author=author, title="Dj", content="x", slug=f"dj-{uuid4().hex[:6]}", is_published=True)
+    draft = Post.objects.create(author=author, title="Draft", content="x", slug=f"draft-{uuid4().hex[:6]}", is_published=False)
+    for post in (both, only_py, draft):
+        attach_tag(post, "python")
+    for post in (both, only_dj):
+        attach_tag(post, "django")
+
+    client = APIClient()
+    r = client.get(reverse("post-list"), {"tags": "python, django", "author": author.id})
+    slugs = [x["slug"] for x in _results(r.data)]
+    # No duplicate rows for posts carrying both tags; drafts stay hidden
+    assert sorted(slugs) == sorted([both.slug, only_py.slug, only_dj.slug])
+
+    r = client.get(reverse("post-list"), {"tags": "python,django", "tags_match": "all", "author": author.id})
+    assert [x["slug"] for x in _results(r.data)] == [both.slug]
+
+    r = client.get(reverse("post-list"), {"tags": "python,no-such-tag", "tags_match": "all"})
+    assert _results(r.data) == []
+
+
+def test_tag_names_resolve_from_cache_without_queries(django_assert_num_queries):
+    from api.tag_cache import prime_tag_cache, resolve_tag_ids
+
+    tag, _ = Tag.objects.get_or_create(name="python")
+    upper, _ = Tag.objects.get_or_create(name="Python")
+    prime_tag_cache()
+    with django_assert_num_queries(0):
+        assert resolve_tag_ids([" python ", "python"]) == [tag.id]
+        # Tag.name is case-sensitively unique, so differently-cased names stay apart
+        assert resolve_tag_ids(["Python", "PYTHON"]) == [upper.id]
+
+
+def make_likeable_post(author, viewer):
+    post = Post.objects.create(author=author, title="Likeable", content="x", slug=f"likeable-{uuid4().hex[:6]}", is_published=True)
+    Like.objects.create(post=post, user=author)
+    client = APIClient()
+    client.force_authenticate(user=viewer)
+    return post, client, reverse("post-like", kwargs={"slug": post.slug})
+
+
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="single-statement path is PostgreSQL only")
+def test_like_action_costs_one_query(django_assert_num_queries, django_capture_on_commit_callbacks):
+    _, client, url = make_likeable_post(make_user("one_query_author"), make_user("one_query_viewer"))
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        with django_assert_num_queries(1):
+            r = client.post(url)
+    assert r.data == {"liked": True, "likes_count": 2}
+    assert len(callbacks) == 1  # the highlights cache is retired
+
+    # A double click changes nothing
+    with django_capture_on_commit_callbacks() as callbacks:
+        r = client.post(url)
+    assert callbacks == []
+
+
+def test_like_action_is_idempotent():
+    viewer = make_user("like_viewer")
+    post, client, url = make_likeable_post(make_user("like_author"), viewer)
+
+    r = client.post(url)
+    assert r.status_code == 200
+    assert r.data == {"liked": True, "likes_count": 2}
+    # A double click changes nothing
+    r = client.post(url)
+    assert r.data == {"liked": True, "likes_count": 2}
+    assert Like.objects.filter(post=post).count() == 2
+
+    r = client.delete(url)
+    assert r.data == {"liked": False, "likes_count": 1}
+    r = client.delete(url)
+    assert r.data == {"liked": False, "likes_count": 1}
+    post.refresh_from_db()
+    assert post.like_count == 1
+    assert not Like.objects.filter(post=post, user=viewer).exists()
+
+
+def test_like_action_requires_auth_and_existing_post():
+    post = Post.objects.create(author=make_user("like_owner"), title="Anon", content="x", slug=f"anon-{uuid4().hex[:6]}")
+    client = APIClient()
+    assert client.post(reverse("post-like", kwargs={"slug": post.slug})).status_code in (401, 403)
+    client.force_authenticate(user=make_user("like_nobody"))
+    assert client.post(reverse("post-like", kwargs={"slug": "no-such-post"})).status_code == 404
+
+
+def test_like_orm_fallback_matches_sql_path():
+    from api.likes import _set_like_orm
+
+    viewer = make_user("like_orm")
+    post = Post.objects.create(author=viewer, title="Orm", content="x", slug=f"orm-{uuid4().hex[:6]}")
+    assert _set_like_orm(viewer, post.slug, True) == 1
+    assert _set_like_orm(viewer, post.slug, True) == 1
+    assert _set_like_orm(viewer, post.slug, False) == 0
+    assert _set_like_orm(viewer, post.slug, False) == 0
+    assert _set_like_orm(viewer, "missing", True) is None
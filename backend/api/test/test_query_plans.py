@@ -0,0 +1,78 @@
+# backend/api/test/test_query_plans.py
+"""
+EXPLAIN the hot Comment/Like queries against seeded tables and fail if
+one of them falls back to a sequential scan or stops using the composite
+index meant for it.
+"""
+import pytest
+from api.models.comment import Comment
+from api.models.like import Like
+from api.models.post import Post, actual_comment_count, actual_like_count
+from django.contrib.auth import get_user_model
+from django.db import connection
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.skipif(connection.vendor != "postgresql", reason="plans checked on PostgreSQL"),
+]
+User = get_user_model()
+
+USERS, POSTS, COMMENTS_PER_POST, LIKES_PER_USER = 50, 200, 20, 80
+
+
+@pytest.fixture()
+def seeded():
+    users = User.objects.bulk_create(
+        User(username=f"plan{n}", email=f"plan{n}@ex.com", password="!") for n in range(USERS)
+    )
+    posts = Post.objects.bulk_create(
+        Post(author=users[n % USERS], title=f"post {n}", content="...", slug=f"plan-post-{n}")
+        for n in range(POSTS)
+    )
+    Comment.objects.bulk_create(
+        Comment(post=post, author=users[(p + c) % USERS], content="hi")
+        for p, post in enumerate(posts)
+        for c in range(COMMENTS_PER_POST)
+    )
+    Like.objects.bulk_create(
+        Like(user=user, post=posts[(u + k) % POSTS])
+        for u, user in enumerate(users)
+        for k in range(LIKES_PER_USER)
+    )
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE api_comment, api_like, api_post")
+    return users, posts
+
+
+HOT_QUERIES = {
+    # CommentViewSet list / keyset page for one post
+    "comments_of_post": lambda users, posts: Comment.objects.filter(post=posts[7]).order_by("-created_at", "-id")[:12],
+    # CommentViewSet.mine
+    "comments_of_author": lambda users, posts: Comment.objects.filter(author=users[3]).order_by("-created_at")[:50],
+    # Per-post like count
+    "likes_of_post": lambda users, posts: Like.objects.filter(post=posts[7]).values("user"),
+    # LikeViewSet list, default (own likes) and ?post= scopes
+    "like_page_of_user": lambda users, posts: Like.objects.filter(user=users[3]).order_by("-created_at", "-id")[:12],
+    "like_page_of_post": lambda users, posts: Like.objects.filter(post=posts[7]).order_by("-created_at", "-id")[:12],
+    # PostQuerySet.with_engagement: the viewer's like
+    "viewer_like": lambda users, posts: Like.objects.filter(post=posts[7], user=users[7]).values("id"),
+    # reconcile_post_counters
+    "recount": lambda users, posts: Post.objects.filter(pk__in=[p.pk for p in posts[:20]]).annotate(
+        actual_likes=actual_like_count(), actual_comments=actual_comment_count(),
+    ),
+}
+EXPECTED_INDEX = {
+    "comments_of_post": Comment._meta.indexes[0].name,
+    "comments_of_author": Comment._meta.indexes[1].name,
+    "like_page_of_post": Like._meta.indexes[0].name,
+    "like_page_of_user": Like._meta.indexes[1].name,
+}
+
+
+@pytest.mark.parametrize("name", sorted(HOT_QUERIES))
+def test_hot_query_uses_an_index(seeded, name):
+    plan = HOT_QUERIES[name](*seeded).explain()
+    for table in ("api_comment", "api_like"):
+        assert f"Seq Scan on {table}" not in plan, plan
+    if name in EXPECTED_INDEX:
+        assert EXPECTED_INDEX[name] in plan, plan
@@ -0,0 +1,91 @@
+# backend/api/test/test_redis_client.py
+import pytest
+import redis
+from api import redis_client
+from api.redis_client import LocalRedis, get_redis, reset_redis
+from redis.exceptions import LockNotOwnedError, ResponseError
+
+
+def test_client_is_built_lazily_and_reused():
+    assert redis_client._client is None
+    client = get_redis()
+    assert isinstance(client, LocalRedis)
+    assert get_redis() is client
+
+
+def test_forked_process_gets_its_own_client(monkeypatch):
+    parent = get_redis()
+    monkeypatch.setattr(redis_client.os, "getpid", lambda: -1)
+    child = get_redis()
+    assert child is not parent
+    assert get_redis() is child
+
+
+def test_real_client_uses_bounded_pool_without_connecting(settings):
+    settings.REDIS_CLIENT_BACKEND = "redis"
+    settings.REDIS_HOST = "redis.invalid"
+    settings.REDIS_MAX_CONNECTIONS = 7
+    settings.REDIS_SOCKET_TIMEOUT = 0.5
+    reset_redis()
+    try:
+        client = get_redis()
+        assert isinstance(client, redis.Redis)
+        pool = client.connection_pool
+        assert pool.max_connections == 7
+        assert pool.connection_kwargs["socket_timeout"] == 0.5
+        assert pool.connection_kwargs["host"] == "redis.invalid"
+    finally:
+        reset_redis()
+
+
+def test_local_strings_and_expiry(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(redis_client.time, "monotonic", lambda: now[0])
+    r = LocalRedis()
+    assert r.set("k", 1) is True
+    assert r.get("k") == "1"
+    assert r.set("k", 2, nx=True) is None
+    assert r.set("new", "v", ex=10)
+    assert r.set("short", "v", px=500)
+    now[0] += 1
+    assert r.get("short") is None
+    assert r.get("new") == "v"
+    now[0] += 10
+    assert r.get("new") is None
+    assert r.exists("k", "new", "missing") == 1
+    assert r.delete("k", "missing") == 1
+
+
+def test_local_lists_and_rename():
+    r = LocalRedis()
+    assert r.rpush("q", "a", "b") == 2
+    assert r.rpush("q", "c") == 3
+    assert r.lrange("q", 0, -1) == ["a", "b", "c"]
+    assert r.lrange("q", 1, 1) == ["b"]
+    r.rename("q", "inflight")
+    assert r.exists("q") == 0
+    assert r.llen("inflight") == 3
+    r.ltrim("inflight", 2, -1)
+    assert r.lrange("inflight", 0, -1) == ["c"]
+    r.ltrim("inflight", 1, -1)
+    assert r.exists("inflight") == 0
+    with pytest.raises(ResponseError):
+        r.rename("q", "other")
+
+    r.set("s", "x")
+    with pytest.raises(ResponseError):
+        r.rpush("s", "y")
+
+
+def test_local_lock_is_owned_by_its_token():
+    r = LocalRedis()
+    lock = r.lock("l", timeout=10, blocking=False)
+    assert lock.acquire()
+    assert not r.lock("l", timeout=10, blocking=False).acquire()
+    assert lock.reacquire()
+    r.set("l", "someone-else")
+    with pytest.raises(LockNotOwnedError):
+        lock.reacquire()
+    with pytest.raises(LockNotOwnedError):
+        lock.release()
+    assert r.get("l") == "someone-else"
@@ -0,0 +1,109 @@
+# backend/api/test/test_refresh_tokens.py
+from datetime import timedelta
+
+import pytest
+from api.refresh_tokens import BLACKLISTED_KEY, CachedRefreshToken, prune_expired_tokens
+from django.contrib.auth import get_user_model
+from django.core.cache import cache, caches
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import aware_utcnow
+
+pytestmark = pytest.mark.django_db
+User = get_user_model()
+
+
+@pytest.fixture()
+def user():
+    return User.objects.create_user(username="rt_user", email="rt@ex.com", password="x")
+
+
+def refresh(token):
+    return APIClient().post("/api/refresh/", {"refresh": str(token)}, format="json")
+
+
+def test_rotation_blacklists_old_token_in_cache(user):
+    old = RefreshToken.for_user(user)
+    response = refresh(old)
+    assert response.status_code == 200
+    assert response.data["refresh"] != str(old)
+    assert cache.get(BLACKLISTED_KEY % old["jti"]) is True
+    assert BlacklistedToken.objects.filter(token__jti=old["jti"]).exists()
+
+
+def test_replayed_token_is_rejected_without_a_query(user):
+    old = RefreshToken.for_user(user)
+    assert refresh(old).status_code == 200
+
+    with CaptureQueriesContext(connection) as queries:
+        response = refresh(old)
+    assert response.status_code == 401
+    assert not any("blacklist" in q["sql"] for q in queries)
+
+
+def test_cache_miss_falls_back_to_the_database(user):
+    token = RefreshToken.for_user(user)
+    token.blacklist()
+    assert cache.get(BLACKLISTED_KEY % token["jti"]) is None
+
+    assert refresh(token).status_code == 401
+    # The database answer is remembered for the next replay
+    assert cache.get(BLACKLISTED_KEY % token["jti"]) is True
+
+
+def test_valid_token_is_always_checked_against_the_database(user):
+    token = RefreshToken.for_user(user)
+    for _ in range(2):
+        with CaptureQueriesContext(connection) as queries:
+            CachedRefreshToken(str(token))
+        assert any("blacklist" in q["sql"] for q in queries)
+    assert caches["shared"].get(BLACKLISTED_KEY % token["jti"]) is None
+
+
+def test_blacklist_is_kept_in_the_shared_tier(user):
+    token = RefreshToken.for_user(user)
+    CachedRefreshToken(str(token)).blacklist()
+    assert caches["shared"].get(BLACKLISTED_KEY % token["jti"]) is True
+    with pytest.raises(TokenError):
+        CachedRefreshToken(str(token))
+
+
+def test_logout_marks_refresh_token_blacklisted(user):
+    token = RefreshToken.for_user(user)
+    response = APIClient().post("/api/logout/", {"refresh": str(token)}, format="json")
+    assert response.status_code == 205
+    assert cache.get(BLACKLISTED_KEY % token["jti"]) is True
+    with pytest.raises(TokenError):
+        CachedRefreshToken(str(token))
+
+
+def make_tokens(user, count, expired):
+    expires_at = aware_utcnow() + (timedelta(days=-1) if expired else timedelta(days=1))
+    tokens = OutstandingToken.objects.bulk_create(
+        OutstandingToken(user=user, jti=f"{'old' if expired else 'live'}-{n}", token="t", expires_at=expires_at)
+        for n in range(count)
+    )
+    BlacklistedToken.objects.bulk_create(BlacklistedToken(token=t) for t in tokens[::2])
+    return tokens
+
+
+def test_prune_removes_only_expired_tokens_in_batches(user):
+    make_tokens(user, 7, expired=True)
+    make_tokens(user, 3, expired=False)
+
+    assert prune_expired_tokens(dry_run=True) == 7
+    assert OutstandingToken.objects.count() == 10
+
+    assert prune_expired_tokens(batch_size=3) == 7
+    assert set(OutstandingToken.objects.values_list("jti", flat=True)) == {"live-0", "live-1", "live-2"}
+    assert BlacklistedToken.objects.count() == 2
+
+
+def test_expires_at_is_indexed():
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, OutstandingToken._meta.db_table)
+    assert any(c["index"] and c["columns"] == ["expires_at"] for c in constraints.values())
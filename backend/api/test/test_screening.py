@@ -0,0 +1,141 @@
+# backend/api/test/test_screening.py
+import re
+
+import pytest
+from api.middleware import SimpleXSSProtectionMiddleware
+from api.screening import PatternSet, PrefixTrie, request_text
+from api.sql_protection import SimpleSQLInjectionProtectionMiddleware
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+SQL_SAMPLES = [
+    "a UNION  SELECT b",
+    "x or 1 = 1",
+    "x AND 2=2",
+    "name' or 'a'='a'",
+    "abc -- comment",
+    "/* hidden */",
+    "DROP TABLE users",
+    "delete from users",
+    "truncate",
+    "EXECUTE sp",
+    "exec sp",
+    "waitfor delay '0:0:5'",
+    "select LOAD_FILE('/etc/passwd')",
+    "into outfile",
+]
+BENIGN = ["hello world", "execution plan", "order by 1", "a-b-c", "unionselect", ""]
+
+
+@pytest.fixture
+def factory():
+    return RequestFactory()
+
+
+def legacy_search(patterns, flags, text):
+    return any(re.compile(p, flags).search(text) for p in patterns)
+
+
+@pytest.mark.parametrize("text", SQL_SAMPLES + BENIGN)
+def test_sql_pattern_set_matches_individual_patterns(text):
+    patterns = SimpleSQLInjectionProtectionMiddleware.DANGEROUS_SQL_PATTERNS
+    flags = re.IGNORECASE | re.MULTILINE
+    combined = PatternSet(patterns, flags)
+    assert (combined.search(text) is not None) == legacy_search(patterns, flags, text)
+    assert (combined.search(text) is not None) == (text in SQL_SAMPLES)
+
+
+@pytest.mark.parametrize("text", [
+    "<SCRIPT>alert(1)</script>",
+    "JavaScript:alert(1)",
+    'x onClick = "steal()"',
+    "eval (code)",
+    "<iframe id=a src=x>",
+    "hello <b>world</b>",
+    "evaluate this",
+])
+def test_xss_pattern_set_matches_individual_patterns(text):
+    patterns = SimpleXSSProtectionMiddleware.DANGEROUS_PATTERNS
+    flags = re.IGNORECASE | re.DOTALL
+    combined = PatternSet(patterns, flags)
+    assert (combined.search(text) is not None) == legacy_search(patterns, flags, text)
+
+
+def test_pattern_set_reports_matching_pattern():
+    patterns = [r'\bdrop\s+table\b', r'\-\-', r'\b(?:exec|execute)\b', r'x|\by']
+    combined = PatternSet(patterns, re.IGNORECASE)
+    assert combined.search("Drop Table t") == patterns[0]
+    assert combined.search("a -- b") == patterns[1]
+    assert combined.search("EXEC") == patterns[2]
+    # Top-level alternation keeps its own boundary handling
+    assert combined.search("ax") == patterns[3]
+    assert combined.search("ay") is None
+    assert combined.search(None) is None
+
+
+def test_pattern_set_rejects_upper_case_when_ignoring_case():
+    with pytest.raises(ValueError):
+        PatternSet([r'DROP\s+TABLE'], re.IGNORECASE)
+    # Escapes such as \S are not literals
+    PatternSet([r'drop\S'], re.IGNORECASE)
+
+
+def test_prefix_trie_matches_longest_prefix():
+    trie = PrefixTrie([('/api/', 'api'), ('/api/posts/', 'posts'), ('/api/login/', 'login')])
+    assert trie.match('/api/posts/1/') == 'posts'
+    assert trie.match('/api/login/') == 'login'
+    assert trie.match('/api/tags/') == 'api'
+    assert trie.match('/api') is None
+    assert trie.match('/other/') is None
+
+
+def test_request_text_decodes_once(factory):
+    request = factory.post('/api/signup/', data=b'caf\xc3\xa9 \xff', content_type='text/plain')
+    assert request_text(request) == 'café '
+    request._body = b'changed'
+    assert request_text(request) == 'café '
+
+
+def chain():
+    return SimpleSQLInjectionProtectionMiddleware(
+        SimpleXSSProtectionMiddleware(lambda request: HttpResponse())
+    )
+
+
+def test_strict_endpoint_blocks_sql_in_body(factory):
+    request = factory.post('/api/signup/', data='{"username": "x\' OR 1=1"}',
+                           content_type='application/json')
+    response = chain()(request)
+    assert response.status_code == 400
+    assert b'Invalid request data' in response.content
+
+
+def test_strict_endpoint_blocks_xss_in_body(factory):
+    request = factory.post('/api/signup/', data='{"bio": "<script>x</script>"}',
+                           content_type='application/json')
+    response = chain()(request)
+    assert response.status_code == 400
+    assert b'XSS' in response.content
+
+
+def test_content_endpoint_is_not_screened(factory):
+    request = factory.post('/api/posts/', data='{"content": "DROP TABLE x; <script>y</script>"}',
+                           content_type='application/json')
+    response = chain()(request)
+    assert response.status_code == 200
+    assert response['X-Frame-Options'] == 'DENY'
+
+
+def test_moderate_endpoint_only_blocks_critical_patterns(factory):
+    ok = factory.post('/api/forgot-password/', data='{"answer": "drop table"}',
+                      content_type='application/json')
+    assert chain()(ok).status_code == 200
+    bad = factory.post('/api/forgot-password/', data='{"answer": "drop table users"}',
+                       content_type='application/json')
+    assert chain()(bad).status_code == 400
+
+
+def test_other_endpoints_check_query_params(factory):
+    assert chain()(factory.get('/api/tags/', {'search': 'py'})).status_code == 200
+    response = chain()(factory.get('/api/tags/', {'search': "x' or 1=1 --"}))
+    assert response.status_code == 400
@@ -5,11 +5,13 @@ from api.models import (
     CustomUser, Profile, Post, Tag, Like, Comment,
     SecurityQuestion, UserSecurityAnswer
 )
+from api.models.security import hash_security_answer
 from api.serializers import (
-    SignupSerializer, TagSerializer, PostSerializer,
+    SignupSerializer, TagSerializer, PostSerializer, PostListSerializer,
     CommentSerializer, LikeSerializer,
     UserProfileSerializer, BlogExpansionRequestSerializer,
 )
+from api.security_questions import signup_question_ids
 from api.serializers.security_serializers import (
     SecurityQuestionSerializer, VerifySecurityAnswersSerializer
 )
@@ -41,6 +43,27 @@ def test_signup_serializer_creates_user_and_answers():
     assert UserSecurityAnswer.objects.filter(user=user).count() == 3
 
 
+@pytest.mark.django_db
+def test_signup_creates_profile_and_answers_in_one_transaction(django_assert_num_queries):
+    for text in ["Q1", "Q2", "Q3"]:
+        SecurityQuestion.objects.create(question_text=text)
+    data = {
+        "username": "bulk", "email": "bulk@Example.COM", "password": "Test1234",
+        "security_answers": ["A1", "A2", "A3"],
+    }
+    serializer = SignupSerializer(data=data)
+    assert serializer.is_valid(), serializer.errors
+    signup_question_ids()  # loaded once per process, not per signup
+
+    # savepoint, user insert, profile insert, answers bulk insert, release
+    with django_assert_num_queries(5):
+        user = serializer.save()
+    assert user.email == "bulk@example.com"
+    assert user.check_password("Test1234")
+    assert Profile.objects.filter(user=user).count() == 1
+    assert [a.check_answer(f"a{n}") for n, a in enumerate(user.security_answers.order_by("question_id"), 1)] == [True] * 3
+
+
 @pytest.mark.django_db
 def test_signup_serializer_duplicate_email():
     """Should reject duplicate email"""
@@ -92,7 +115,7 @@ def test_verify_security_answers_valid_flow():
     q3 = SecurityQuestion.objects.create(question_text="Q3")
     user = CustomUser.objects.create_user(username="alice", email="a@example.com", password="OldPass123")
     for q, a in zip([q1, q2, q3], ["A1", "A2", "A3"]):
-        UserSecurityAnswer.objects.create(user=user, question=q, answer=a)
+        UserSecurityAnswer.objects.create(user=user, question=q, answer_hash=hash_security_answer(a))
     data = {
         "email": "a@example.com",
         "answers": ["A1", "A2", "A3"],
@@ -114,7 +137,7 @@ def test_verify_security_answers_wrong_answer():
     q3 = SecurityQuestion.objects.create(question_text="Q3")
     user = CustomUser.objects.create_user(username="bob", email="b@example.com", password="old12345")
     for q, a in zip([q1, q2, q3], ["A1", "A2", "A3"]):
-        UserSecurityAnswer.objects.create(user=user, question=q, answer=a)
+        UserSecurityAnswer.objects.create(user=user, question=q, answer_hash=hash_security_answer(a))
     data = {
         "email": "b@example.com",
         "answers": ["wrong", "A2", "A3"],
@@ -177,6 +200,40 @@ def test_post_serializer_like_fields():
     assert data["liked_by_user"] is False
 
 
+@pytest.mark.django_db
+def test_post_list_serializer_summary_fields():
+    """PostListSerializer should drop body/comments and expose excerpt and counts"""
+    factory = APIRequestFactory()
+    user = CustomUser.objects.create_user(username="lister", email="ls@example.com", password="x")
+    post = Post.objects.create(
+        author=user, title="Post L", content="<p>Hello &amp; <b>world</b></p>" + "<p>word </p>" * 100
+    )
+    Comment.objects.create(post=post, author=user, content="first")
+    post.refresh_from_db()
+    request = factory.get("/")
+    request.user = user
+    data = PostListSerializer(post, context={"request": request}).data
+    assert "content" not in data and "comments" not in data
+    assert data["excerpt"].startswith("Hello & world word")
+    assert "<" not in data["excerpt"]
+    assert len(data["excerpt"]) <= 200
+    assert data["comments_count"] == 1
+
+
+@pytest.mark.django_db
+def test_post_list_excerpt_drops_tag_cut_by_the_head():
+    """A tag cut off at the end of content_head must not leak into the excerpt"""
+    user = CustomUser.objects.create_user(username="imager", email="img@example.com", password="x")
+    Post.objects.create(
+        author=user, title="Post I",
+        content='<p>Intro</p><p><img src="data:image/png;base64,' + "A" * 2000 + '"></p>',
+    )
+    post = Post.objects.for_list().get(title="Post I")
+    request = APIRequestFactory().get("/")
+    request.user = user
+    assert PostListSerializer(post, context={"request": request}).data["excerpt"] == "Intro"
+
+
 # ======================================================
 # ? CommentSerializer & LikeSerializer
 # ======================================================
@@ -1,11 +1,16 @@
 # backend/api/test/test_signals.py
 import pytest
+from api.highlights import invalidate_highlighted_posts
+from api.models.comment import Comment
+from api.models.like import Like
+from api.models.post import Post
 from api.models.profile import Profile
 from api.models.security import SecurityQuestion
 from api.models.tag import Tag
 from api.signals import (create_default_security_questions,
                          create_default_tags, create_or_update_user_profile)
 from django.contrib.auth import get_user_model
+from django.db import transaction
 
 pytestmark = pytest.mark.django_db
 User = get_user_model()
@@ -23,6 +28,34 @@ def test_profile_persist_on_user_save_again():
     assert Profile.objects.filter(user =u).exists()
 
 
+def test_user_save_does_not_touch_profile(django_assert_num_queries):
+    u = User.objects.create_user(username="sig_user3", email="s3@ex.com", password="x")
+    u = User.objects.get(pk=u.pk)
+    with django_assert_num_queries(1):
+        u.last_login = u.date_joined
+        u.save(update_fields=["last_login"])
+
+    u.profile  # loaded but unchanged
+    with django_assert_num_queries(1):
+        u.save()
+
+
+def test_profile_edits_saved_with_user_write_only_changed_fields(django_assert_num_queries):
+    u = User.objects.create_user(username="sig_user4", email="s4@ex.com", password="x")
+    u = User.objects.select_related("profile").get(pk=u.pk)
+    u.profile.bio = "hello"
+    with django_assert_num_queries(2) as captured:
+        u.save()
+    profile_update = captured.captured_queries[1]["sql"]
+    assert '"bio"' in profile_update and '"updated_at"' in profile_update
+    assert '"github"' not in profile_update
+    assert Profile.objects.get(user=u).bio == "hello"
+
+    # Nothing left to write
+    with django_assert_num_queries(0):
+        u.profile.save()
+
+
 def test_create_default_tags_idempotent():
     create_default_tags(sender=None)
     subset = {"python", "django", "react", "postgresql", "security", "other"}
@@ -49,3 +82,27 @@ def test_create_default_security_questions_idempotent():
     create_default_security_questions(sender=None)
     total2 = SecurityQuestion.objects.count()
     assert total1 == total2
+
+
+def test_user_delete_recounts_posts_once(django_assert_max_num_queries):
+    author = User.objects.create_user(username="sig_author", email="sa@ex.com", password="x")
+    posts = [Post.objects.create(author=author, title=f"p{n}", content="x", slug=f"sig-p{n}") for n in range(3)]
+    leaver, stayer = (User.objects.create_user(username=n, email=f"{n}@ex.com", password="x") for n in ("leaver", "stayer"))
+    for post in posts:
+        Like.objects.create(user=leaver, post=post)
+        Like.objects.create(user=stayer, post=post)
+        Comment.objects.bulk_create(Comment(post=post, author=leaver, content="c") for _ in range(5))
+        Comment.objects.create(post=post, author=stayer, content="kept")
+    Post.objects.filter(pk__in=[p.pk for p in posts]).update(comment_count=6)
+
+    # Query count doesn't grow with the number of cascaded rows
+    with django_assert_max_num_queries(20) as captured:
+        User.objects.filter(pk=leaver.pk).delete()
+    assert len([q for q in captured.captured_queries if q["sql"].startswith('UPDATE "api_post"')]) == 1
+
+    for post in Post.objects.filter(pk__in=[p.pk for p in posts]):
+        assert (post.like_count, post.comment_count) == (1, 1)
+
+    # Every change in this transaction shares one highlights invalidation
+    queued = [func for _, func, *_ in transaction.get_connection().run_on_commit]
+    assert queued.count(invalidate_highlighted_posts) == 1
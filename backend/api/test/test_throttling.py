@@ -0,0 +1,137 @@
+# backend/api/test/test_throttling.py
+import threading
+
+import pytest
+from api import throttling
+from api.throttling import SlidingWindowLimiter
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+from rest_framework.test import APIClient
+
+pytestmark = pytest.mark.django_db
+User = get_user_model()
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    now = [6000.0]  # start of a 60s window
+    monkeypatch.setattr(throttling.time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture()
+def rates(settings):
+    def set_rates(**rates):
+        settings.REST_FRAMEWORK = {**settings.REST_FRAMEWORK, "DEFAULT_THROTTLE_RATES": rates}
+    return set_rates
+
+
+def login(username, password="wrong", ip="10.0.0.1"):
+    return APIClient().post(
+        "/api/login/", {"username": username, "password": password}, format="json", REMOTE_ADDR=ip,
+    )
+
+
+def test_limiter_admits_up_to_limit_and_reports_state(clock):
+    limiter = SlidingWindowLimiter(3, 60, prefix="t")
+    assert [limiter.hit("k")[0] for _ in range(4)] == [True, True, True, False]
+
+    state = limiter.state("k")
+    assert state["count"] == 3  # the rejected hit is not counted
+    assert state["remaining"] == 0
+    # Into the next window, until the carried-over count has decayed to 2
+    assert state["retry_after"] == 60 + 20
+
+
+def test_limiter_window_slides(clock):
+    limiter = SlidingWindowLimiter(4, 60, prefix="t")
+    for _ in range(4):
+        assert limiter.hit("k")[0]
+
+    # Half way into the next window half of the previous count still applies
+    clock[0] += 90
+    assert limiter.state("k")["remaining"] == 2
+    assert limiter.hit("k")[0]
+    assert limiter.hit("k")[0]
+    assert not limiter.hit("k")[0]
+    assert limiter.state("k")["retry_after"] == 15
+
+
+def test_login_throttled_per_account_before_hashing(rates, clock, monkeypatch):
+    rates(login_ip="100/min", login_account="3/min")
+    User.objects.create_user(username="target", email="target@ex.com", password="right")
+    calls = []
+    original = PBKDF2PasswordHasher.encode
+    monkeypatch.setattr(
+        PBKDF2PasswordHasher, "encode",
+        lambda self, *args, **kwargs: calls.append(1) or original(self, *args, **kwargs),
+    )
+
+    for n in range(3):
+        assert login("target", ip=f"10.0.0.{n}").status_code == 401
+    hashed = len(calls)
+
+    # Different address, same account identifier (case-insensitive)
+    response = login("Target", ip="10.0.1.1")
+    assert response.status_code == 429
+    assert int(response["Retry-After"]) > 0
+    assert len(calls) == hashed
+
+    # Other accounts are unaffected
+    assert login("someone-else", ip="10.0.1.1").status_code == 401
+
+
+def test_signup_throttled_per_ip(rates, clock):
+    rates(signup_ip="2/hour")
+    client = APIClient()
+    for _ in range(2):
+        assert client.post("/api/signup/", {}, format="json", REMOTE_ADDR="10.0.0.9").status_code == 400
+    assert client.post("/api/signup/", {}, format="json", REMOTE_ADDR="10.0.0.9").status_code == 429
+    assert client.post("/api/signup/", {}, format="json", REMOTE_ADDR="10.0.0.10").status_code == 400
+
+
+def test_forgot_password_throttled_and_reports_headers(rates, clock):
+    rates(password_reset_ip="5/hour", password_reset_account="2/hour")
+    client = APIClient()
+    response = client.post("/api/forget-password/start/", {"email": "nobody@ex.com"}, format="json")
+    assert response.status_code == 404
+    assert response["X-RateLimit-Limit"] == "2"
+    assert response["X-RateLimit-Remaining"] == "1"
+
+    client.post("/api/forget-password/start/", {"email": "nobody@ex.com"}, format="json")
+    response = client.post("/api/forget-password/verify/", {"email": "nobody@ex.com", "answers": [1]}, format="json")
+    assert response.status_code == 429
+
+
+def test_rate_limit_status_endpoint(rates, clock):
+    rates(login_ip="30/min", login_account="10/min")
+    admin = User.objects.create_user(username="rl_admin", email="rl@ex.com", password="x", is_admin_user=True)
+    login("victim", ip="10.0.0.7")
+
+    client = APIClient()
+    client.force_authenticate(admin)
+    response = client.get("/api/admin-panel/rate-limits/", {"scope": "login", "ip": "10.0.0.7", "account": "Victim"})
+    assert response.status_code == 200
+    assert response.data["ip"]["count"] == 1
+    assert response.data["ip"]["remaining"] == 29
+    assert response.data["account"]["remaining"] == 9
+
+    assert client.get("/api/admin-panel/rate-limits/").status_code == 400
+    client.force_authenticate(User.objects.create_user(username="rl_user", email="u@ex.com", password="x"))
+    assert client.get("/api/admin-panel/rate-limits/", {"scope": "login"}).status_code == 403
+
+
+def test_sheds_load_when_no_slot_is_free(settings, monkeypatch):
+    settings.AUTH_QUEUE_TIMEOUT = 0
+    monkeypatch.setattr(throttling, "_slots", threading.BoundedSemaphore(1))
+    throttling._slots.acquire()
+    try:
+        response = login("anyone")
+        assert response.status_code == 503
+    finally:
+        throttling._slots.release()
+
+    assert login("anyone").status_code == 401
+    # Slots are released after each request
+    assert throttling._slots.acquire(blocking=False)
+    throttling._slots.release()
@@ -0,0 +1,250 @@
+"""
+Rate limiting and load shedding for the credential endpoints
+(login, signup, forgot-password)
+"""
+import hashlib
+import math
+import os
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.settings import api_settings
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class SlidingWindowLimiter:
+    """
+    Sliding-window counter kept in a cache.
+    Each key has one counter per fixed window; the rate is estimated as the
+    current window's count plus the previous window's count weighted by how
+    much of it still overlaps the sliding window. Counters are bumped with
+    cache.incr(), which is atomic on Redis, so concurrent workers never
+    overshoot the limit by more than the requests in flight.
+    """
+
+    def __init__(self, limit, window, prefix="ratelimit", cache_alias=None):
+        self.limit = limit
+        self.window = window
+        self.prefix = prefix
+        self.cache = caches[cache_alias or settings.RATE_LIMIT_CACHE]
+
+    def _window(self, key, now):
+        index = int(now // self.window)
+        current = f"{self.prefix}:{key}:{index}"
+        previous = f"{self.prefix}:{key}:{index - 1}"
+        elapsed = now - index * self.window
+        return current, previous, elapsed
+
+    def _estimate(self, count, previous_count, elapsed):
+        return previous_count * (1 - elapsed / self.window) + count
+
+    def _state(self, count, previous_count, elapsed):
+        estimate = self._estimate(count, previous_count, elapsed)
+        return {
+            "limit": self.limit,
+            "window": self.window,
+            "count": count,
+            "previous_count": previous_count,
+            "remaining": max(0, math.floor(self.limit - estimate)),
+            "retry_after": self._retry_after(count, previous_count, elapsed),
+        }
+
+    def _retry_after(self, count, previous_count, elapsed):
+        """Seconds until one more request fits, 0 if it already does."""
+        if self._estimate(count, previous_count, elapsed) + 1 <= self.limit:
+            return 0
+        spare = self.limit - 1 - count
+        if spare >= 0:
+            # Fits once the previous window's weight has decayed enough
+            return max(1, math.ceil(self.window * (1 - spare / previous_count) - elapsed))
+        # This window alone is full: wait for the next one, where this
+        # window's count becomes the decaying previous count
+        decay = self.window * (1 - (self.limit - 1) / count)
+        return math.ceil(self.window - elapsed + decay)
+
+    def hit(self, key):
+        """
+        Count one request for `key`. Returns (allowed, state); a rejected
+        request is not counted, so the limit applies to admitted requests.
+        """
+        now = time.time()
+        current, previous, elapsed = self._window(key, now)
+        try:
+            count = self.cache.incr(current)
+        except ValueError:
+            # First request in this window; add() loses gracefully to a racing worker
+            self.cache.add(current, 0, self.window * 2)
+            count = self.cache.incr(current)
+        previous_count = self.cache.get(previous) or 0
+
+        allowed = self._estimate(count, previous_count, elapsed) <= self.limit
+        if not allowed:
+            self.cache.decr(current)
+            count -= 1
+        return allowed, self._state(count, previous_count, elapsed)
+
+    def state(self, key):
+        """Current counters for `key`, without counting a request."""
+        current, previous, elapsed = self._window(key, time.time())
+        values = self.cache.get_many([current, previous])
+        return self._state(values.get(current, 0), values.get(previous, 0), elapsed)
+
+    def reset(self, key):
+        current, previous, _ = self._window(key, time.time())
+        self.cache.delete_many([current, previous])
+
+
+class SlidingWindowThrottle(SimpleRateThrottle):
+    """
+    DRF throttle on a SlidingWindowLimiter.
+    The rate comes from DEFAULT_THROTTLE_RATES under
+    "<view.throttle_scope>_<kind>"; a view without a throttle_scope, or a
+    scope without a rate, is not throttled.
+    """
+
+    kind = None
+
+    def __init__(self):
+        # The rate depends on the view, see allow_request()
+        pass
+
+    def get_rate(self):
+        return api_settings.DEFAULT_THROTTLE_RATES.get(self.scope)
+
+    def allow_request(self, request, view):
+        scope = getattr(view, "throttle_scope", None)
+        if not scope:
+            return True
+        self.scope = f"{scope}_{self.kind}"
+        self.rate = self.get_rate()
+        if self.rate is None:
+            return True
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        allowed, self.state = self.limiter().hit(self.key)
+        states = getattr(request, "rate_limits", None)
+        if states is None:
+            states = request.rate_limits = {}
+        states[self.scope] = self.state
+        return allowed
+
+    def limiter(self):
+        return SlidingWindowLimiter(self.num_requests, self.duration, prefix=f"throttle_{self.scope}")
+
+    def wait(self):
+        return self.state["retry_after"]
+
+
+class IPRateThrottle(SlidingWindowThrottle):
+    """Limits requests per client address."""
+
+    kind = "ip"
+
+    def get_cache_key(self, request, view):
+        return self.get_ident(request)
+
+
+class AccountRateThrottle(SlidingWindowThrottle):
+    """
+    Limits requests per targeted account (the username or email in the
+    request body), however many addresses they come from.
+    """
+
+    kind = "account"
+    account_fields = ("username", "email")
+
+    def get_cache_key(self, request, view):
+        try:
+            data = request.data
+        except Exception:
+            return None
+        for field in self.account_fields:
+            value = data.get(field) if hasattr(data, "get") else None
+            if isinstance(value, str) and value.strip():
+                return _account_key(value)
+        return None
+
+
+def _account_key(identifier):
+    # Hashed: keeps keys short and usernames/emails out of the cache
+    return hashlib.sha256(identifier.strip().lower().encode()).hexdigest()
+
+
+def rate_limit_state(scope, kind, ident):
+    """
+    Bucket state for monitoring: `ident` is a client address (kind "ip") or
+    a username/email (kind "account"). Returns None for unknown scopes.
+    """
+    rate = api_settings.DEFAULT_THROTTLE_RATES.get(f"{scope}_{kind}")
+    if rate is None:
+        return None
+    num_requests, duration = SlidingWindowThrottle().parse_rate(rate)
+    if kind == "account":
+        ident = _account_key(ident)
+    limiter = SlidingWindowLimiter(num_requests, duration, prefix=f"throttle_{scope}_{kind}")
+    return limiter.state(ident)
+
+
+class Overloaded(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "Server is busy, please retry shortly."
+    default_code = "overloaded"
+
+
+_slots = None
+_slots_lock = threading.Lock()
+
+
+def _request_slots():
+    global _slots
+    if _slots is None:
+        with _slots_lock:
+            if _slots is None:
+                limit = settings.AUTH_MAX_CONCURRENT_REQUESTS or (os.cpu_count() or 1) * 2
+                _slots = threading.BoundedSemaphore(limit)
+    return _slots
+
+
+class RateLimitedMixin:
+    """
+    For APIViews that hash passwords or check credentials: throttles per
+    address and per account (set `throttle_scope`), sheds load when the
+    process already runs AUTH_MAX_CONCURRENT_REQUESTS of them, and reports
+    the most constrained bucket in X-RateLimit-* headers. All of it happens
+    in initial(), before the handler touches the database or the hasher.
+    """
+
+    throttle_classes = [IPRateThrottle, AccountRateThrottle]
+    throttle_scope = None
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if request.method in ("POST", "PUT", "PATCH"):
+            if not _request_slots().acquire(timeout=settings.AUTH_QUEUE_TIMEOUT):
+                raise Overloaded()
+            self._holds_slot = True
+
+    def dispatch(self, request, *args, **kwargs):
+        self._holds_slot = False
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        finally:
+            if self._holds_slot:
+                _request_slots().release()
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        states = getattr(request, "rate_limits", None)
+        if states:
+            tightest = min(states.values(), key=lambda state: state["remaining"])
+            response["X-RateLimit-Limit"] = str(tightest["limit"])
+            response["X-RateLimit-Remaining"] = str(tightest["remaining"])
+        return response
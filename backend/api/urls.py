@@ -3,6 +3,7 @@ from dj_rest_auth.registration.views import SocialLoginView
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 from rest_framework_simplejwt.views import TokenRefreshView
+from .views.admin import BulkUserActionView, BulkUserJobView, RateLimitStatusView
 from .views.forgot_password_view import ForgetPasswordStartView, ForgetPasswordVerifyView, ForgetPasswordResetView
 
 # Import from the views package
@@ -29,6 +30,9 @@ urlpatterns = [
     path('refresh/', TokenRefreshView.as_view(), name='token_refresh'),
     path('logout/', LogoutView.as_view(), name='logout'),
     path('admin-panel/', AdminUserManagementView.as_view(), name='admin_panel'),
+    path('admin-panel/bulk/', BulkUserActionView.as_view(), name='admin_bulk'),
+    path('admin-panel/bulk/<str:job_id>/', BulkUserJobView.as_view(), name='admin_bulk_job'),
+    path('admin-panel/rate-limits/', RateLimitStatusView.as_view(), name='admin_rate_limits'),
     path('admin-panel/<int:user_id>/', AdminUserManagementView.as_view(), name='admin_user_ops'),
     path('profile/', UserProfileView.as_view(), name='user-profile'),
     path('highlighted-posts/', HighlightedPostsView.as_view(), name='highlighted-posts'),
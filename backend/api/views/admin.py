@@ -1,13 +1,23 @@
 
+import csv
+import json
+
 from django.contrib.auth import get_user_model
+from django.core.files.storage import default_storage
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import transaction
-from rest_framework import serializers, status
+from django.http import StreamingHttpResponse
+from rest_framework import filters, serializers, status
+from rest_framework.generics import GenericAPIView
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from ..bulk_users import get_job, set_admin_flag, start_bulk_delete
 from ..permissions import IsAdminUserFlag
 from ..serializers.UserProfileSerializer import UserProfileSerializer
+from ..throttling import rate_limit_state
 
 CustomUser = get_user_model()
 
@@ -15,13 +25,120 @@ class AdminStatusSerializer(serializers.Serializer):
     user_id = serializers.IntegerField()
     is_admin_user = serializers.BooleanField()
 
-class AdminUserManagementView(APIView):
+class BulkUserActionSerializer(serializers.Serializer):
+    action = serializers.ChoiceField(choices=['set_admin', 'delete'])
+    user_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=10000
+    )
+    is_admin_user = serializers.BooleanField(required=False)
+
+    def validate(self, attrs):
+        if attrs['action'] == 'set_admin' and 'is_admin_user' not in attrs:
+            raise serializers.ValidationError({'is_admin_user': 'This field is required for set_admin.'})
+        return attrs
+
+class AdminUserPagination(PageNumberPagination):
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+# Export columns: (name, queryset value); profile fields are flattened
+EXPORT_COLUMNS = (
+    ('id', 'id'), ('username', 'username'), ('email', 'email'),
+    ('first_name', 'first_name'), ('last_name', 'last_name'),
+    ('address', 'address'), ('phone_number', 'phone_number'),
+    ('is_admin_user', 'is_admin_user'), ('date_joined', 'date_joined'),
+    ('avatar', 'profile__avatar'), ('bio', 'profile__bio'),
+    ('linkedin', 'profile__linkedin'), ('github', 'profile__github'),
+    ('facebook', 'profile__facebook'), ('x_twitter', 'profile__x_twitter'),
+    ('website', 'profile__website'),
+)
+EXPORT_CHUNK_SIZE = 2000
+# Spreadsheets run a cell starting with one of these as a formula
+CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+class Echo:
+    """File-like object for csv.writer that hands each row back instead of buffering it."""
+
+    def write(self, value):
+        return value
+
+
+def export_rows(queryset):
+    """
+    Yield one dict per user, reading the table through a server-side cursor
+    EXPORT_CHUNK_SIZE rows at a time so memory stays flat however many
+    users there are.
+    """
+    names = [name for name, _ in EXPORT_COLUMNS]
+    for values in queryset.values_list(*[lookup for _, lookup in EXPORT_COLUMNS]).iterator(
+        chunk_size=EXPORT_CHUNK_SIZE
+    ):
+        row = dict(zip(names, values))
+        if row['avatar']:
+            row['avatar'] = default_storage.url(row['avatar'])
+        yield row
+
+
+def stream_ndjson(rows):
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder) + '\n'
+
+
+def csv_safe(value):
+    """Quote user-supplied text with a leading ' so a spreadsheet shows it instead of evaluating it."""
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def stream_csv(rows):
+    writer = csv.DictWriter(Echo(), fieldnames=[name for name, _ in EXPORT_COLUMNS])
+    yield writer.writeheader()
+    for row in rows:
+        yield writer.writerow({name: csv_safe(value) for name, value in row.items()})
+
+
+class AdminUserManagementView(GenericAPIView):
+    """
+    GET lists users a page at a time (?page=, ?page_size=), filtered by
+    ?search= (username, email, names) and sorted by ?ordering=.
+    GET ?export=ndjson|csv streams every matching user instead.
+    """
     permission_classes = [IsAuthenticated, IsAdminUserFlag]
+    serializer_class = UserProfileSerializer
+    pagination_class = AdminUserPagination
+    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    search_fields = ['username', 'email', 'first_name', 'last_name']
+    ordering_fields = ['id', 'username', 'email', 'date_joined', 'last_login', 'is_admin_user']
+    ordering = ['id']
+    export_formats = {
+        'ndjson': (stream_ndjson, 'application/x-ndjson'),
+        'csv': (stream_csv, 'text/csv'),
+    }
+
+    def get_queryset(self):
+        return CustomUser.objects.select_related('profile')
 
     def get(self, request):
-        users = CustomUser.objects.all()
-        serializer = UserProfileSerializer(users, many=True)
-        return Response(serializer.data)
+        users = self.filter_queryset(self.get_queryset())
+
+        export = request.query_params.get('export')
+        if export:
+            if export not in self.export_formats:
+                return Response(
+                    {"error": f"Unsupported export format: {export}"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            stream, content_type = self.export_formats[export]
+            response = StreamingHttpResponse(stream(export_rows(users)), content_type=content_type)
+            response['Content-Disposition'] = f'attachment; filename="users.{export}"'
+            return response
+
+        page = self.paginate_queryset(users)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
     def put(self, request):
         """
@@ -52,7 +169,7 @@ class AdminUserManagementView(APIView):
         # Update admin status
         with transaction.atomic():
             user.is_admin_user = serializer.validated_data['is_admin_user']
-            user.save()
+            user.save(update_fields=['is_admin_user'])
         
         # Return minimal user info to avoid serialization issues
         return Response({
@@ -79,4 +196,60 @@ class AdminUserManagementView(APIView):
             return Response(
                 {"error": f"User with ID {user_id} not found"}, 
                 status=status.HTTP_404_NOT_FOUND
-            )
\ No newline at end of file
+            )
+
+
+class BulkUserActionView(APIView):
+    """
+    POST {"action": "set_admin", "user_ids": [...], "is_admin_user": true}
+        changes the role of every listed user in one UPDATE.
+    POST {"action": "delete", "user_ids": [...]}
+        starts a deletion job (your own account is skipped) and answers 202
+        with it; GET admin-panel/bulk/<job id>/ reports its progress.
+    """
+    permission_classes = [IsAuthenticated, IsAdminUserFlag]
+
+    def post(self, request):
+        serializer = BulkUserActionSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        data = serializer.validated_data
+        user_ids = set(data['user_ids'])
+
+        if data['action'] == 'set_admin':
+            updated = set_admin_flag(user_ids, data['is_admin_user'])
+            return Response({"requested": len(user_ids), "updated": updated})
+
+        skipped = [request.user.id] if request.user.id in user_ids else []
+        job = start_bulk_delete(user_ids - set(skipped), requested_by=request.user.id)
+        return Response({"job": job, "skipped": skipped}, status=status.HTTP_202_ACCEPTED)
+
+
+class BulkUserJobView(APIView):
+    permission_classes = [IsAuthenticated, IsAdminUserFlag]
+
+    def get(self, request, job_id):
+        job = get_job(job_id)
+        if job is None:
+            return Response({"error": f"Job {job_id} not found"}, status=status.HTTP_404_NOT_FOUND)
+        return Response(job)
+
+
+class RateLimitStatusView(APIView):
+    """
+    Current rate-limit buckets for monitoring:
+    GET ?scope=login&ip=<address>&account=<username or email>
+    """
+    permission_classes = [IsAuthenticated, IsAdminUserFlag]
+
+    def get(self, request):
+        scope = request.query_params.get("scope")
+        if not scope:
+            return Response({"error": "scope is required"}, status=status.HTTP_400_BAD_REQUEST)
+
+        data = {"scope": scope}
+        for kind in ("ip", "account"):
+            ident = request.query_params.get(kind)
+            if ident:
+                data[kind] = rate_limit_state(scope, kind, ident)
+        return Response(data)
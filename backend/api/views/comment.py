@@ -1,12 +1,16 @@
 # ✅ api/views/comment.py
+from django.contrib.auth import get_user_model
+from django.db import transaction
 from rest_framework import viewsets, permissions, filters
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from ..models.comment import Comment
+from ..models.post import Post
+from ..pagination import KeysetPaginationMixin
 from ..serializers.comment import CommentSerializer
-from django_filters.rest_framework import DjangoFilterBackend
+from django_filters.rest_framework import DjangoFilterBackend, FilterSet, ModelChoiceFilter
 
 from ..serializers.myComment import MyCommentItemSerializer
 
@@ -15,22 +19,37 @@ class IsAuthorOrAdmin(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
         return request.user and (request.user == obj.author or request.user.is_admin_user)
 
-class CommentViewSet(viewsets.ModelViewSet):
-    queryset = Comment.objects.select_related('post', 'author').all().order_by('-created_at')
+class CommentFilter(FilterSet):
+    # The ids are still validated, but without loading the post body or the user row
+    post = ModelChoiceFilter(queryset=Post.objects.only('id'))
+    author = ModelChoiceFilter(queryset=get_user_model().objects.only('id'))
+
+    class Meta:
+        model = Comment
+        fields = ['author', 'post']
+
+class CommentViewSet(KeysetPaginationMixin, viewsets.ModelViewSet):
+    queryset = Comment.objects.for_display().order_by('-created_at')
     serializer_class = CommentSerializer
     filter_backends = [filters.SearchFilter]
     search_fields = ['post__id']  # Support /api/comments/?search=1 to filter comments with post ID = 1
     filter_backends = [DjangoFilterBackend]
-    filterset_fields = ['author', 'post']  # support ?author=<id>&post=<id>
+    filterset_class = CommentFilter  # support ?author=<id>&post=<id>
 
     def get_permissions(self):
         if self.action in ['create', 'update', 'partial_update', 'destroy']:
             return [permissions.IsAuthenticated(), IsAuthorOrAdmin()]
         return [permissions.AllowAny()]
 
+    # The row and the post's comment_count (updated by signal) change in one transaction
+    @transaction.atomic
     def perform_create(self, serializer):
         serializer.save(author=self.request.user)
 
+    @transaction.atomic
+    def perform_destroy(self, instance):
+        instance.delete()
+
     @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated])
     def mine(self, request):
         try:
@@ -39,7 +58,7 @@ class CommentViewSet(viewsets.ModelViewSet):
             limit = 50
         limit = max(1, min(limit, 100))
 
-        qs = (self.get_queryset()
+        qs = (Comment.objects.for_my_list()
         .filter(author=request.user)
         .order_by('-created_at')[:limit])
 
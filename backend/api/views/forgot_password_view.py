@@ -1,65 +1,82 @@
 from rest_framework import generics, status
 from rest_framework.response import Response
 from django.contrib.auth import get_user_model
-from django.contrib.auth.hashers import make_password
 from rest_framework.permissions import AllowAny
 from rest_framework_simplejwt.tokens import RefreshToken
 from api.models.security import UserSecurityAnswer
+from api.throttling import RateLimitedMixin
 
 User = get_user_model()
 
-class ForgetPasswordStartView(generics.GenericAPIView):
+class ForgetPasswordStartView(RateLimitedMixin, generics.GenericAPIView):
     permission_classes = [AllowAny]
+    throttle_scope = "password_reset"
 
     def post(self, request):
         email = request.data.get("email")
         if not email:
             return Response({"error": "Email is required."}, status=status.HTTP_400_BAD_REQUEST)
 
-        try:
-            user = User.objects.get(email=email)
-        except User.DoesNotExist:
-            return Response({"error": "User not found."}, status=status.HTTP_404_NOT_FOUND)
-
-        user_answers = UserSecurityAnswer.objects.filter(user=user).select_related("question")
+        # Questions and user in one query; only an empty result needs a second look
+        user_answers = (
+            UserSecurityAnswer.objects.filter(user__email=email)
+            .select_related("question").order_by("question_id")
+        )
         questions = [
             {"id": ua.question.id, "question_text": ua.question.question_text}
             for ua in user_answers
         ]
+        if not questions and not User.objects.filter(email=email).exists():
+            return Response({"error": "User not found."}, status=status.HTTP_404_NOT_FOUND)
         return Response({"questions": questions}, status=status.HTTP_200_OK)
 
 
-class ForgetPasswordVerifyView(generics.GenericAPIView):
+class ForgetPasswordVerifyView(RateLimitedMixin, generics.GenericAPIView):
     permission_classes = [AllowAny]
+    throttle_scope = "password_reset"
 
     def post(self, request):
         email = request.data.get("email")
         answers = request.data.get("answers", [])
 
-        if not email or not answers:
+        if not email or not answers or not isinstance(answers, list):
             return Response({"error": "Email and answers are required."}, status=status.HTTP_400_BAD_REQUEST)
 
-        try:
-            user = User.objects.get(email=email)
-        except User.DoesNotExist:
+        # All of the user's answers (and the user) in one query, keyed by question
+        stored = {
+            ua.question_id: ua
+            for ua in UserSecurityAnswer.objects.filter(user__email=email).select_related("user")
+        }
+        if not stored and not User.objects.filter(email=email).exists():
             return Response({"error": "User not found."}, status=status.HTTP_404_NOT_FOUND)
 
+        given = {}
         for ans in answers:
-            qid = ans.get("question_id")
-            text = ans.get("answer", "").strip().lower()
+            raw_qid = ans.get("question_id") if isinstance(ans, dict) else None
             try:
-                user_answer = UserSecurityAnswer.objects.get(user=user, question_id=qid)
-            except UserSecurityAnswer.DoesNotExist:
-                return Response({"error": f"Invalid question id: {qid}"}, status=status.HTTP_400_BAD_REQUEST)
-            if user_answer.answer.lower() != text:
-                return Response({"error": "One or more answers are incorrect."}, status=status.HTTP_400_BAD_REQUEST)
-
+                qid = int(raw_qid)
+            except (TypeError, ValueError):
+                qid = None
+            if qid not in stored:
+                return Response({"error": f"Invalid question id: {raw_qid}"}, status=status.HTTP_400_BAD_REQUEST)
+            given[qid] = ans.get("answer")
+
+        # Every stored answer is checked, without stopping at the first
+        # mismatch, so the time taken says nothing about which one was wrong
+        correct = True
+        for qid, user_answer in stored.items():
+            correct &= user_answer.check_answer(given.get(qid))
+        if not correct:
+            return Response({"error": "One or more answers are incorrect."}, status=status.HTTP_400_BAD_REQUEST)
+
+        user = next(iter(stored.values())).user
         token = RefreshToken.for_user(user).access_token
         return Response({"message": "Security answers verified.", "reset_token": str(token)}, status=status.HTTP_200_OK)
 
 
-class ForgetPasswordResetView(generics.GenericAPIView):
+class ForgetPasswordResetView(RateLimitedMixin, generics.GenericAPIView):
     permission_classes = [AllowAny]
+    throttle_scope = "password_reset"
 
     def post(self, request):
         token = request.data.get("reset_token")
@@ -81,7 +98,7 @@ class ForgetPasswordResetView(generics.GenericAPIView):
         except Exception:
             return Response({"error": "Invalid or expired reset token."}, status=status.HTTP_400_BAD_REQUEST)
 
-        user.password = make_password(new_password)
-        user.save()
+        user.set_password(new_password)
+        user.save(update_fields=["password"])
 
         return Response({"message": "Password reset successful."}, status=status.HTTP_200_OK)
@@ -1,20 +1,47 @@
 # api/views/like.py
 
+from django.db import transaction
 from rest_framework import viewsets, permissions
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import PermissionDenied, ValidationError
 from ..models.like import Like
+from ..pagination import KeysetPagination
 from ..serializers.like import LikeSerializer
 
 
 class LikeViewSet(viewsets.ModelViewSet):
+    """
+    GET /likes/ lists the requesting user's likes; GET /likes/?post=<id> lists
+    that post's likes. Both are newest first, a cursor page at a time.
+    """
     http_method_names = ["get", "post", "delete", "head", "options"]
     queryset = Like.objects.all()
     serializer_class = LikeSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action != 'list':
+            return queryset
+
+        # Only the columns LikeSerializer emits, in the same query
+        queryset = queryset.select_related('user', 'post').only(
+            'id', 'user', 'post', 'created_at', 'user__username', 'post__title',
+        )
+        post_id = self.request.query_params.get('post')
+        if post_id is None:
+            return queryset.filter(user=self.request.user)
+        try:
+            return queryset.filter(post_id=int(post_id))
+        except ValueError:
+            raise ValidationError({"post": "A valid integer is required."})
+
+    # The row and the post's like_count (updated by signal) change in one transaction
+    @transaction.atomic
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
+    @transaction.atomic
     def perform_destroy(self, instance):
         if instance.user != self.request.user:
             raise PermissionDenied("You can only remove your own like.")
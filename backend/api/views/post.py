@@ -1,9 +1,18 @@
-from rest_framework import viewsets, permissions
+from django.db.models import Exists, OuterRef
+from django.conf import settings
+from rest_framework import viewsets, permissions, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
 from ..models.post import Post
-from ..serializers.post import PostSerializer
+from ..serializers.post import PostListSerializer, PostSerializer
 from django_filters.rest_framework import DjangoFilterBackend, FilterSet, CharFilter
 from rest_framework import filters
+from ..like_buffer import buffer_like
+from ..likes import set_like
 from ..models.tag import Tag
+from ..pagination import KeysetPaginationMixin
+from ..search import PostFullTextSearchFilter
+from ..tag_cache import resolve_tag_ids
 from ..security_decorators import safe_query, validate_search_params  # added import
 
 class IsPostAuthorOrAdmin(permissions.BasePermission):
@@ -11,34 +20,84 @@ class IsPostAuthorOrAdmin(permissions.BasePermission):
         return request.user and (request.user == obj.author or request.user.is_admin_user)
 
 class PostFilter(FilterSet):
-    tags = CharFilter(field_name='tags__name', lookup_expr='iexact')  # Support tags=name queries
+    # tags=python or tags=python,django; tags_match=all requires every tag (default: any)
+    tags = CharFilter(method='filter_tags')
 
     class Meta:
         model = Post
-        fields = ['author', 'tags']
+        fields = ['author', 'tags', 'is_published']
 
-class PostViewSet(viewsets.ModelViewSet):
+    def filter_tags(self, queryset, name, value):
+        names = {n.strip() for n in value.split(',') if n.strip()}
+        if not names:
+            return queryset
+        match_all = self.data.get('tags_match', 'any').lower() == 'all'
+
+        # Names are resolved from the in-process tag cache, so posts are matched by id
+        tag_ids = resolve_tag_ids(names)
+        if not tag_ids or (match_all and len(tag_ids) < len(names)):
+            return queryset.none()
+
+        # EXISTS over the (post_id, tag_id) unique index: no join fan-out, no DISTINCT
+        tagged = Post.tags.through.objects.filter(post_id=OuterRef('pk'))
+        queryset = queryset.filter(is_published=True)
+        if match_all:
+            for tag_id in tag_ids:
+                queryset = queryset.filter(Exists(tagged.filter(tag_id=tag_id)))
+            return queryset
+        return queryset.filter(Exists(tagged.filter(tag_id__in=tag_ids)))
+
+class PostViewSet(KeysetPaginationMixin, viewsets.ModelViewSet):
     queryset = Post.objects.all()
     serializer_class = PostSerializer
     lookup_field = 'slug'
     filter_backends = [
         DjangoFilterBackend,
         filters.OrderingFilter,
-        filters.SearchFilter
+        PostFullTextSearchFilter
     ]
     filterset_class = PostFilter
     ordering_fields = ['created_at', 'updated_at']
-    search_fields = ['title', 'content']
+    search_fields = ['title', 'content']  # Used only by the non-PostgreSQL fallback
     # filterset_fields = ['author']
 
     def get_permissions(self):
         if self.action in ['create', 'update', 'partial_update', 'destroy']:
             return [permissions.IsAuthenticated(), IsPostAuthorOrAdmin()]
+        if self.action == 'like':
+            return [permissions.IsAuthenticated()]
         return [permissions.AllowAny()]
 
+    def get_serializer_class(self):
+        # Feed pages only need a summary; the full body and comments are for retrieve
+        if self.action == 'list':
+            return PostListSerializer
+        return PostSerializer
+
     def perform_create(self, serializer):
         serializer.save(author=self.request.user)
 
+    @action(detail=True, methods=['post', 'delete'])
+    def like(self, request, slug=None):
+        """
+        POST likes the post, DELETE unlikes it; both are idempotent and return
+        the fresh count. In write-behind mode the change is queued and the
+        response (202, "pending") carries the count before it.
+        """
+        liked = request.method == 'POST'
+        if settings.LIKE_WRITE_BEHIND:
+            likes_count = buffer_like(request.user, slug, liked)
+            if likes_count is None:
+                return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+            return Response(
+                {"liked": liked, "likes_count": likes_count, "pending": True},
+                status=status.HTTP_202_ACCEPTED,
+            )
+        likes_count = set_like(request.user, slug, liked)
+        if likes_count is None:
+            return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+        return Response({"liked": liked, "likes_count": likes_count})
+
     @safe_query
     @validate_search_params()
     def list(self, request, *args, **kwargs):
@@ -47,8 +106,12 @@ class PostViewSet(viewsets.ModelViewSet):
 
     @safe_query
     def get_queryset(self):
+        # Tag filtering happens once, in PostFilter.filter_tags
         queryset = Post.objects.all()
-        tag_name = self.request.query_params.get('tags')
-        if tag_name:
-            queryset = queryset.filter(tags__name=tag_name, is_published=True)
+        if self.action == 'list':
+            queryset = queryset.for_list()
+        if self.action in ('list', 'retrieve'):
+            queryset = queryset.with_related().with_engagement(self.request.user)
+        if self.action == 'retrieve':
+            queryset = queryset.with_comments()
         return queryset
\ No newline at end of file
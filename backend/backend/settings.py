@@ -51,6 +51,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',  # Full-text search fields and GIN indexes
     'api.apps.ApiConfig', #  Use AppConfig to ensure that ready() is triggered.
     'corsheaders',
     'rest_framework', # Django REST Framework
@@ -75,7 +76,7 @@ SITE_ID = 1
 REST_USE_JWT = True
 
 AUTHENTICATION_BACKENDS = (
-    'django.contrib.auth.backends.ModelBackend',
+    'api.backends.UsernameOrEmailBackend',
     'allauth.account.auth_backends.AuthenticationBackend',
 )
 
@@ -218,7 +219,7 @@ SESSION_SAVE_EVERY_REQUEST = True
 # REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'api.authentication.RevocationAwareJWTAuthentication',
     ),
     'DEFAULT_FILTER_BACKENDS': [
         'django_filters.rest_framework.DjangoFilterBackend'
@@ -226,6 +227,16 @@ REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 12,  # 12 data returned per page, can be adjusted according to actual needs
     "EXCEPTION_HANDLER": "api.exceptions.custom_exception_handler",
+    # Credential endpoints, see api/throttling.py ("<throttle_scope>_ip" / "_account")
+    'DEFAULT_THROTTLE_RATES': {
+        'login_ip': config("THROTTLE_LOGIN_IP", default="30/min"),
+        'login_account': config("THROTTLE_LOGIN_ACCOUNT", default="10/min"),
+        'signup_ip': config("THROTTLE_SIGNUP_IP", default="10/hour"),
+        'password_reset_ip': config("THROTTLE_PASSWORD_RESET_IP", default="20/hour"),
+        'password_reset_account': config("THROTTLE_PASSWORD_RESET_ACCOUNT", default="10/hour"),
+    },
+    # Client address = REMOTE_ADDR unless this many proxies add X-Forwarded-For
+    'NUM_PROXIES': config("NUM_PROXIES", default=0, cast=int),
 }
 
 from datetime import timedelta
@@ -237,37 +248,90 @@ SIMPLE_JWT = {
     'BLACKLIST_AFTER_ROTATION': True,
     'ALGORITHM': 'HS256',
     'SIGNING_KEY': SECRET_KEY,  # Make sure this is your Django's SECRET_KEY
+    # Answers "is this refresh token blacklisted" from the cache first
+    'TOKEN_REFRESH_SERIALIZER': 'api.refresh_tokens.CachedTokenRefreshSerializer',
 }
 
 
 # Caching settings
-# Using Redis for caching
-# Make sure you have django-redis installed: pip install django-redis
-# and Redis server is running on localhost:6379
-CACHES = {
-    "default": {
+# Every process keeps a small LRU of recently read keys in front of a shared
+# cache (api/cache_backends.py). The shared tier is Redis unless CACHE_BACKEND
+# selects the database table ("db") or process-local memory ("locmem").
+REDIS_HOST = config("REDIS_HOST", default="localhost")  # If deployed in AWS EC2, write EC2 internal or public address
+REDIS_PORT = config("REDIS_PORT", default=6379, cast=int)
+REDIS_DB = config("REDIS_DB", default=0, cast=int)
+
+# Client returned by api.redis_client.get_redis(): its pool is built lazily,
+# once per process ("local" swaps in an in-memory stand-in). The Redis cache
+# tier uses the same sizing and timeouts.
+REDIS_CLIENT_BACKEND = config("REDIS_CLIENT_BACKEND", default="redis")
+REDIS_MAX_CONNECTIONS = config("REDIS_MAX_CONNECTIONS", default=50, cast=int)
+REDIS_SOCKET_TIMEOUT = config("REDIS_SOCKET_TIMEOUT", default=2.0, cast=float)
+REDIS_SOCKET_CONNECT_TIMEOUT = config("REDIS_SOCKET_CONNECT_TIMEOUT", default=1.0, cast=float)
+REDIS_HEALTH_CHECK_INTERVAL = config("REDIS_HEALTH_CHECK_INTERVAL", default=30, cast=int)
+
+CACHE_BACKEND = config("CACHE_BACKEND", default="redis")
+
+SHARED_CACHE_BACKENDS = {
+    "redis": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}",
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            "SOCKET_TIMEOUT": REDIS_SOCKET_TIMEOUT,
+            "SOCKET_CONNECT_TIMEOUT": REDIS_SOCKET_CONNECT_TIMEOUT,
+            "CONNECTION_POOL_KWARGS": {
+                "max_connections": REDIS_MAX_CONNECTIONS,
+                "health_check_interval": REDIS_HEALTH_CHECK_INTERVAL,
+                "retry_on_timeout": True,
+            },
+        },
+    },
+    "db": {
         "BACKEND": "django.core.cache.backends.db.DatabaseCache",
-        "LOCATION": "my_cache_table",  
-    }
+        "LOCATION": "my_cache_table",
+    },
+    "locmem": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "techpath-shared",
+    },
 }
 
-# Redis connection config
-REDIS_HOST = 'localhost' # If deployed in AWS EC2, write EC2 internal or public address
-REDIS_PORT = 6379
-REDIS_DB = 0
-
-# redis_client.py
-from django.conf import settings
-import redis
-
-REDIS_CLIENT = redis.StrictRedis(
-    host=settings.REDIS_HOST,
-    port=settings.REDIS_PORT,
-    db=settings.REDIS_DB,
-    decode_responses=True
-)
-
+CACHES = {
+    "default": {
+        "BACKEND": "api.cache_backends.TieredCache",
+        "OPTIONS": {
+            "SHARED_ALIAS": "shared",
+            "MAX_ENTRIES": config("CACHE_LOCAL_MAX_ENTRIES", default=1000, cast=int),
+            "LOCAL_TIMEOUT": config("CACHE_LOCAL_TIMEOUT", default=5, cast=int),
+        },
+    },
+    "shared": SHARED_CACHE_BACKENDS[CACHE_BACKEND],
+}
 
+# Cache holding rate-limit counters (api/throttling.py). Counts come back from
+# incr(), which the tiered cache always sends to the shared tier.
+RATE_LIMIT_CACHE = "default"
+# Load shedding for credential endpoints: requests beyond this many in flight
+# per process (0 = twice the CPU count) wait AUTH_QUEUE_TIMEOUT seconds for a
+# slot, then get 503
+AUTH_MAX_CONCURRENT_REQUESTS = config("AUTH_MAX_CONCURRENT_REQUESTS", default=0, cast=int)
+AUTH_QUEUE_TIMEOUT = config("AUTH_QUEUE_TIMEOUT", default=0.5, cast=float)
+
+# Bulk user deletion from the admin panel (api/bulk_users.py): users per
+# transaction, seconds to pause between batches, and whether the job runs on
+# a background thread (off = inline in the request, as the tests do)
+ADMIN_BULK_DELETE_BATCH_SIZE = config("ADMIN_BULK_DELETE_BATCH_SIZE", default=200, cast=int)
+ADMIN_BULK_DELETE_PAUSE = config("ADMIN_BULK_DELETE_PAUSE", default=0.0, cast=float)
+ADMIN_BULK_DELETE_ASYNC = config("ADMIN_BULK_DELETE_ASYNC", default=True, cast=bool)
+
+# Write-behind likes (api/like_buffer.py): POST/DELETE posts/<slug>/like/
+# queue an event in Redis instead of writing the Like table, and
+# `manage.py flush_likes --every LIKE_FLUSH_INTERVAL` applies them
+# LIKE_FLUSH_BATCH_SIZE events per transaction. Counts lag by up to one interval.
+LIKE_WRITE_BEHIND = config("LIKE_WRITE_BEHIND", default=False, cast=bool)
+LIKE_FLUSH_INTERVAL = config("LIKE_FLUSH_INTERVAL", default=2.0, cast=float)
+LIKE_FLUSH_BATCH_SIZE = config("LIKE_FLUSH_BATCH_SIZE", default=5000, cast=int)
 
 # from pathlib import Path
 # BASE_DIR = Path(__file__).resolve().parent.parent
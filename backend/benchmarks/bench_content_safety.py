@@ -0,0 +1,85 @@
+"""
+Micro-benchmark: comment/post validation rules.
+
+Compares the precompiled linear rules in api/content_safety.py with the
+previous CommentSerializer.validate_content code (pattern lists rebuilt on
+every call, one re.search per pattern) on benign text and on inputs that make
+the old patterns backtrack. The old code is skipped above --legacy-max bytes
+because it is quadratic or worse on the pathological inputs.
+
+Run from backend/:
+    python benchmarks/bench_content_safety.py [--legacy-max BYTES]
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.content_safety import COMMENT_SQL_PATTERNS, COMMENT_XSS_PATTERNS
+
+SIZES = {'1KB': 1024, '10KB': 10 * 1024, '100KB': 100 * 1024, '1MB': 1024 * 1024}
+
+INPUTS = {
+    'prose': "A perfectly ordinary comment about Django, with numbers 1 and 2.\n",
+    'quotes': "'o",
+    'comment-openers': "/*",
+    'on-word': "on",
+    'script-unclosed': "<script>aaaa",
+}
+
+
+def legacy_validate(value):
+    """CommentSerializer.validate_content before the shared rules."""
+    sql_patterns = [
+        r'\b(union|select|insert|update|delete|drop|create|alter)\b',
+        r'(\||\||&&)',
+        r'(\'.*or.*\'.*=.*\')',
+        r'(;|\-\-)',
+        r'(\bconcat\b|\bchar\b)',
+    ]
+    for pattern in sql_patterns:
+        if re.search(pattern, value, re.IGNORECASE):
+            return True
+    xss_patterns = [
+        r'<script[^>]*>.*?</script>',
+        r'javascript:',
+        r'on\w+\s*=',
+        r'<iframe[^>]*>',
+        r'<object[^>]*>',
+        r'<embed[^>]*>',
+        r'eval\s*\(',
+    ]
+    for pattern in xss_patterns:
+        if re.search(pattern, value, re.IGNORECASE):
+            return True
+    return False
+
+
+def validate(value):
+    return bool(COMMENT_SQL_PATTERNS.search(value) or COMMENT_XSS_PATTERNS.search(value))
+
+
+def timed(func, value):
+    started = time.perf_counter()
+    func(value)
+    return (time.perf_counter() - started) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--legacy-max', type=int, default=10 * 1024)
+    args = parser.parse_args()
+
+    print(f"{'input':>16} {'size':>6} {'legacy ms':>10} {'linear ms':>10}")
+    for name, unit in INPUTS.items():
+        for label, size in SIZES.items():
+            value = (unit * (size // len(unit) + 1))[:size]
+            legacy = f"{timed(legacy_validate, value):10.2f}" if size <= args.legacy_max else f"{'skipped':>10}"
+            print(f"{name:>16} {label:>6} {legacy} {timed(validate, value):10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Micro-benchmark: onboarding users in bulk.
+
+Times `manage.py import_users` on a generated JSONL file (pre-hashed
+passwords and three security answers per user, as when migrating from
+another system) against the per-user path signup used before: save the
+user (the post_save handler get_or_creates the profile), query the
+questions, insert each answer. Uses the configured database: a throwaway
+test database is created and dropped.
+
+Run from backend/:
+    python benchmarks/bench_import_users.py [--users N]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from io import StringIO
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+
+import django
+
+django.setup()
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import setup_test_environment
+
+from api.models.security import SecurityQuestion, UserSecurityAnswer
+
+User = get_user_model()
+
+
+def rows(prefix, count, password_hash):
+    for n in range(count):
+        yield {
+            'username': f'{prefix}{n}',
+            'email': f'{prefix}{n}@example.com',
+            'password_hash': password_hash,
+            'first_name': 'Bench',
+            'security_answers': ['red', 'cat', 'pie'],
+        }
+
+
+def legacy_import(items):
+    for row in items:
+        user = User(username=row['username'], email=row['email'], first_name=row['first_name'])
+        user.password = row['password_hash']
+        user.save()
+        questions = list(SecurityQuestion.objects.all().order_by('id')[:3])
+        for q, ans in zip(questions, row['security_answers']):
+            UserSecurityAnswer.objects.create(user=user, question=q, answer=ans)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--users', type=int, default=20000)
+    parser.add_argument('--legacy-users', type=int, default=1000)
+    args = parser.parse_args()
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        password_hash = make_password('bench-password-123')
+
+        start = time.perf_counter()
+        legacy_import(rows('legacy', args.legacy_users, password_hash))
+        legacy = args.legacy_users / (time.perf_counter() - start)
+
+        with tempfile.NamedTemporaryFile('w', suffix='.jsonl', delete=False) as f:
+            for row in rows('bulk', args.users, password_hash):
+                f.write(json.dumps(row) + '\n')
+        try:
+            start = time.perf_counter()
+            call_command('import_users', f.name, stdout=StringIO())
+            bulk = args.users / (time.perf_counter() - start)
+        finally:
+            os.unlink(f.name)
+
+        print(f"{'path':<22}{'users':>8}{'users/s':>10}")
+        print(f"{'per-user (legacy)':<22}{args.legacy_users:>8}{legacy:>10.0f}")
+        print(f"{'import_users':<22}{args.users:>8}{bulk:>10.0f}")
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""
+Benchmark: sustained like throughput on one viral post under concurrent load.
+
+Worker threads like the same post as distinct users, either synchronously
+(api/likes.py: insert plus counter update, serialized on the post row) or
+write-behind (api/like_buffer.py: one indexed read plus RPUSH) while a
+flusher thread drains the buffer every --interval seconds. Reports request
+throughput and, for write-behind, when the last like reached the database.
+Uses the configured database: a throwaway test database is created and
+dropped.
+
+Run from backend/:
+    python benchmarks/bench_likes.py [--threads N] [--likes N] [--local-redis]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+
+import django
+
+django.setup()
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import override_settings, setup_test_environment
+
+from api.like_buffer import buffer_like, flush_likes, pending_count
+from api.likes import set_like
+from api.models.like import Like
+from api.models.post import Post
+from api.redis_client import get_redis, reset_redis
+
+User = get_user_model()
+
+
+def run_workers(users, slug, threads, like):
+    chunks = [users[n::threads] for n in range(threads)]
+
+    def work(chunk):
+        try:
+            for user in chunk:
+                like(user, slug, True)
+        finally:
+            connection.close()
+
+    workers = [threading.Thread(target=work, args=(chunk,)) for chunk in chunks]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def bench_sync(users, slug, threads):
+    return run_workers(users, slug, threads, set_like)
+
+
+def bench_write_behind(users, slug, threads, interval):
+    stop = threading.Event()
+
+    def flusher():
+        try:
+            while not stop.is_set():
+                flush_likes()
+                stop.wait(interval)
+        finally:
+            connection.close()
+
+    thread = threading.Thread(target=flusher)
+    thread.start()
+    start = time.perf_counter()
+    elapsed = run_workers(users, slug, threads, buffer_like)
+    while pending_count():
+        time.sleep(0.01)
+    # The flush that emptied the buffer may still be committing its last batch
+    stop.set()
+    thread.join()
+    flush_likes()
+    return elapsed, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--likes', type=int, default=4000, help='Likes per mode (one per user).')
+    parser.add_argument('--interval', type=float, default=0.5, help='Flush interval in seconds.')
+    parser.add_argument(
+        '--local-redis', action='store_true',
+        help='No Redis server: use the in-process stand-in and a local-memory shared cache.',
+    )
+    args = parser.parse_args()
+
+    if args.local_redis:
+        override_settings(
+            REDIS_CLIENT_BACKEND='local',
+            CACHES={**settings.CACHES, 'shared': settings.SHARED_CACHE_BACKENDS['locmem']},
+        ).enable()
+        reset_redis()
+    get_redis().delete('likes:pending', 'likes:inflight', 'likes:flush_lock')
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        users = User.objects.bulk_create(
+            User(username=f'fan{n}', email=f'fan{n}@example.com', password='!') for n in range(args.likes * 2)
+        )
+        author = users[0]
+        sync_post = Post.objects.create(author=author, title='Sync', content='x', slug='bench-sync')
+        buffered_post = Post.objects.create(author=author, title='Buffered', content='x', slug='bench-buffered')
+        connection.close()
+
+        sync = bench_sync(users[:args.likes], sync_post.slug, args.threads)
+        accepted, drained = bench_write_behind(users[args.likes:], buffered_post.slug, args.threads, args.interval)
+
+        for post in (sync_post, buffered_post):
+            post.refresh_from_db()
+            assert post.like_count == Like.objects.filter(post=post).count() == args.likes, post.like_count
+
+        print(f"{args.likes} likes on one post from {args.threads} threads")
+        print(f"{'mode':<28}{'seconds':>9}{'likes/s':>10}")
+        print(f"{'synchronous':<28}{sync:>9.2f}{args.likes / sync:>10.0f}")
+        print(f"{'write-behind (accepted)':<28}{accepted:>9.2f}{args.likes / accepted:>10.0f}")
+        print(f"{'write-behind (in database)':<28}{drained:>9.2f}{args.likes / drained:>10.0f}")
+    finally:
+        connection.close()
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+Micro-benchmark: token login by username and by email.
+
+Compares the single-lookup backend (api/backends.py) against the previous
+login path (authenticate() by username through ModelBackend and allauth,
+then a second lookup by email and another authenticate()). Uses the
+configured database: a throwaway test database is created and dropped.
+
+Run from backend/:
+    python benchmarks/bench_login.py [--repeat N]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+
+import django
+
+django.setup()
+
+from django.contrib.auth import authenticate, get_user_model
+from django.db import connection
+from django.test.utils import override_settings, setup_test_environment
+
+User = get_user_model()
+PASSWORD = 'bench-password-123'
+LEGACY_BACKENDS = (
+    'django.contrib.auth.backends.ModelBackend',
+    'allauth.account.auth_backends.AuthenticationBackend',
+)
+
+
+def legacy_login(username_or_email, password):
+    # The login serializer before the single-lookup backend
+    with override_settings(AUTHENTICATION_BACKENDS=LEGACY_BACKENDS):
+        user = authenticate(username=username_or_email, password=password)
+        if user is None:
+            try:
+                user_obj = User.objects.get(email=username_or_email)
+            except User.DoesNotExist:
+                return None
+            user = authenticate(username=user_obj.username, password=password)
+        return user
+
+
+def current_login(username_or_email, password):
+    return authenticate(username=username_or_email, password=password)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        User.objects.bulk_create(
+            User(username=f'user{n}', email=f'user{n}@example.com') for n in range(2000)
+        )
+        User.objects.create_user(username='bench', email='bench@example.com', password=PASSWORD)
+
+        cases = [
+            ('username', 'bench', PASSWORD),
+            ('email', 'bench@example.com', PASSWORD),
+            ('bad password', 'bench@example.com', 'wrong'),
+        ]
+        print(f"{'login':<14}{'legacy ms':>12}{'current ms':>12}{'speedup':>10}")
+        for label, login, password in cases:
+            legacy = min(timeit.repeat(lambda: legacy_login(login, password), number=1, repeat=args.repeat))
+            current = min(timeit.repeat(lambda: current_login(login, password), number=1, repeat=args.repeat))
+            print(f'{label:<14}{legacy * 1000:>12.1f}{current * 1000:>12.1f}{legacy / current:>9.1f}x')
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()